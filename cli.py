@@ -0,0 +1,162 @@
+"""Komut satırı giriş noktası - arayüz (PyQt5) ve ekran gerektirmez
+
+Örnekler:
+    python cli.py send --template "Tanıtım" --recipients musteriler.csv
+    python cli.py schedule --subject "Bülten" --body-file bulten.html --to a@ornek.com --weekdays 09:30
+    python cli.py run-daemon
+    python cli.py stats
+    python cli.py backup
+
+Ayarlar (SMTP, limitler, gönderim yayma, takip ...) config.json'dan okunur; zamanlanmış
+işler, engelleme listesi ve gönderim geçmişi arayüzle ortaktır.
+"""
+import sys
+import json
+import signal
+import argparse
+from datetime import datetime
+
+from modules.engine import EmailEngine, format_stats
+from modules.recurrence import cron_recurrence, daily_cron, weekday_cron, first_fire, describe_recurrence
+from modules.send_planner import describe_plan
+
+
+def load_template(name, path="email_templates.json"):
+    """Arayüzde kaydedilmiş şablonu adıyla bul: (konu, gövde, ek yolları)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        templates = json.load(f)
+    for template in templates:
+        if template.get('name') == name:
+            attachments = [attachment['path'] for attachment in template.get('attachments', [])]
+            return template['subject'], template['body'], attachments
+    names = ", ".join(template.get('name', '') for template in templates)
+    raise ValueError(f"Şablon bulunamadı: {name} (kayıtlı şablonlar: {names})")
+
+
+def parse_clock(text):
+    """'SS:DD' -> (saat, dakika)"""
+    hour, minute = text.split(':')
+    return int(hour), int(minute)
+
+
+def add_message_arguments(parser):
+    parser.add_argument('--template', help="email_templates.json içindeki şablon adı")
+    parser.add_argument('--subject', help="Konu (şablon yerine)")
+    parser.add_argument('--body', help="HTML gövde (şablon yerine)")
+    parser.add_argument('--body-file', help="HTML gövdeyi dosyadan oku")
+    parser.add_argument('--attach', action='append', default=[], help="Ek dosya (birden çok kez verilebilir)")
+    parser.add_argument('--to', action='append', default=[], help="Alıcı adresi (birden çok kez verilebilir)")
+    parser.add_argument('--recipients', action='append', default=[],
+                        help="Alıcı dosyası: CSV, TSV, XLSX veya VCF (birden çok kez verilebilir)")
+    spread = parser.add_mutually_exclusive_group()
+    spread.add_argument('--spread', dest='spread', action='store_true', default=None,
+                        help="Gönderimleri izinli saatlere yay (ayardan bağımsız)")
+    spread.add_argument('--no-spread', dest='spread', action='store_false', help="Gönderim yaymayı kapat")
+
+
+def build_job(engine, args, due=None, recurrence=None):
+    if args.template:
+        subject, body, attachments = load_template(args.template)
+    else:
+        if args.body_file:
+            with open(args.body_file, 'r', encoding='utf-8') as f:
+                args.body = f.read()
+        if not args.subject or not args.body:
+            raise ValueError("--template veya --subject ile birlikte --body/--body-file verilmeli")
+        subject, body, attachments = args.subject, args.body, []
+    store = engine.load_recipients(args.to, args.recipients)
+    if not len(store):
+        raise ValueError("Gönderilecek alıcı yok (--to / --recipients)")
+    return engine.build_job(subject, body, store, attachments + args.attach, due, recurrence=recurrence,
+                            spread=args.spread)
+
+
+def command_send(engine, args):
+    job = build_job(engine, args)
+    print(f"{job['total_count']} alıcıya gönderim başlıyor: {job['subject']}")
+    sent = engine.send(job, wait=args.wait)
+    print(f"Gönderilen: {sent}/{job['total_count']}")
+
+
+def command_schedule(engine, args):
+    recurrence = None
+    if args.cron:
+        recurrence = cron_recurrence(args.cron)
+    elif args.daily:
+        recurrence = cron_recurrence(daily_cron(*parse_clock(args.daily)))
+    elif args.weekdays:
+        recurrence = cron_recurrence(weekday_cron(*parse_clock(args.weekdays)))
+    start = datetime.strptime(args.at, "%Y-%m-%d %H:%M").timestamp() if args.at else datetime.now().timestamp()
+    due = first_fire(recurrence, start)
+    if due is None:
+        raise ValueError(f"Cron ifadesi hiçbir zaman çalışmıyor: {recurrence['expr']}")
+    job = build_job(engine, args, due, recurrence)
+    engine.schedule(job)
+    print(f"Zamanlandı: {job['subject']} - {job['total_count']} alıcı - "
+          f"{datetime.fromtimestamp(job['due']):%d.%m.%Y %H:%M} ({describe_recurrence(recurrence)})")
+    if job['plan']:
+        days, first, finish = describe_plan(job['plan'])
+        if days:
+            print(f"Gönderim planı: {days} gün, {datetime.fromtimestamp(first):%d.%m.%Y %H:%M} - "
+                  f"{datetime.fromtimestamp(finish):%d.%m.%Y %H:%M}")
+
+
+def command_run_daemon(engine, args):
+    # Servis yöneticisinin (systemd vb.) durdurma sinyalinde çalışan dilim sıradaki alıcıdan
+    # önce durur ve gönderilenler işe işlenir (yarıda kesilip tekrar gönderilmez)
+    signal.signal(signal.SIGTERM, lambda signum, frame: engine.request_stop())
+    engine.run_daemon(max_sleep=args.max_sleep)
+
+
+def command_stats(engine, args):
+    print(format_stats(engine.stats()))
+
+
+def command_backup(engine, args):
+    if engine.backup() is None:
+        return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="cli.py", description="Otomatik e-posta gönderimi - komut satırı")
+    parser.add_argument('--config', default="config.json", help="Ayar dosyası (varsayılan: config.json)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    send = commands.add_parser('send', help="Hemen gönder (limit dolarsa kalanlar zamanlanır)")
+    add_message_arguments(send)
+    send.add_argument('--wait', action='store_true', help="Limit/plan nedeniyle kalanlar için bekle ve bitir")
+    send.set_defaults(handler=command_send)
+
+    schedule = commands.add_parser('schedule', help="İleri bir zamana veya tekrarlayan gönderim zamanla")
+    add_message_arguments(schedule)
+    schedule.add_argument('--at', help="Başlangıç zamanı 'YYYY-AA-GG SS:DD' (varsayılan: şimdi)")
+    repeat = schedule.add_mutually_exclusive_group()
+    repeat.add_argument('--cron', help="Cron ifadesi, ör. '0 9 * * 1-5'")
+    repeat.add_argument('--daily', metavar='SS:DD', help="Her gün bu saatte")
+    repeat.add_argument('--weekdays', metavar='SS:DD', help="Her iş günü bu saatte")
+    schedule.set_defaults(handler=command_schedule)
+
+    daemon = commands.add_parser('run-daemon', help="Zamanlanmış işleri sürekli çalıştır (Ctrl+C ile durur)")
+    daemon.add_argument('--max-sleep', type=float, default=60, help="İşler arasında en uzun bekleme (saniye)")
+    daemon.set_defaults(handler=command_run_daemon)
+
+    stats = commands.add_parser('stats', help="Gönderim sayaçları, zamanlanmış işler ve takip özetleri")
+    stats.set_defaults(handler=command_stats)
+
+    backup = commands.add_parser('backup', help="Veritabanını pg_dump ile yedekle")
+    backup.set_defaults(handler=command_backup)
+
+    args = parser.parse_args(argv)
+    engine = EmailEngine(args.config)
+    try:
+        return args.handler(engine, args) or 0
+    except (ValueError, OSError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    finally:
+        # Takip olayları diske yazılır, gömülü sunucular durdurulur
+        engine.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,6 @@ import platform
 if platform.system() == "Windows":
     import winsound
 import json
-import subprocess
 
 # PyQt5 importları
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -24,23 +23,36 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QTableWidgetItem, QMessageBox, QFileDialog,
                              QProgressBar, QFrame, QScrollArea,
                              QSizePolicy, QMenu, QInputDialog, QDialog,
-                             QColorDialog, QTimeEdit, QDateEdit, QListWidget,
-                             QHeaderView)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QDateTime, QTime, QDate
+                             QColorDialog, QTimeEdit, QDateEdit, QListWidget, QListWidgetItem,
+                             QHeaderView, QCompleter, QTableView)
+from PyQt5.QtCore import (Qt, QTimer, QThread, pyqtSignal, QDateTime, QTime, QDate, QStringListModel,
+                          QAbstractTableModel, QModelIndex, QFileSystemWatcher)
 from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
 
 # Proje modüllerini import et
 from modules.database_manager import DatabaseManager
 from modules.config_manager import ConfigManager
 from modules.logger import Logger
+from modules.recipient_store import RecipientStore
+from modules.contact_importer import iter_file_contacts, iter_text_contacts
+from modules.email_validator import EmailValidator, NO_MX_REASON, MX_CHECK_AVAILABLE
+from modules.message_builder import PERSONALIZATION_FIELDS, IMAGE_EXTENSIONS
+from modules.smtp_sender import deliver_email
+from modules.attachment_store import default_attachment_store, provider_size_limit
+from modules.image_preview import default_image_previewer
+from modules.file_server import AttachmentOffloader, HostedFileRegistry, BackgroundServer
+from modules.tracking_server import TrackingStore, MessageTracker, create_tracking_app
+from modules.bounce_processor import BounceProcessor, IMAPMailbox, imap_host_for, event_status, load_recipient_statuses
+from modules.campaign_job import (CampaignJobRunner, build_job_spec, normalize_job_spec, remaining_recipients,
+                                  resolve_attachment, resolve_smtp_settings)
+from modules.recurrence import (cron_recurrence, drip_recurrence, daily_cron, weekday_cron, first_fire,
+                                describe_recurrence)
+from modules.send_planner import SendPlanner, slot_time, describe_plan
+from modules.backup import backup_database
+from modules.engine import EmailEngine
 
-# SMTP için gerekli import'lar
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email.mime.image import MIMEImage
-from email import encoders
+# Konu ve gövdede kullanılabilecek kişiselleştirme alanları
+PERSONALIZATION_HINT = "Kişiselleştirme alanları: " + ", ".join("{{%s}}" % field for field in PERSONALIZATION_FIELDS)
 
 class TurkishTextEdit(QTextEdit):
     """Türkçe sağ tık menüsü olan QTextEdit"""
@@ -95,9 +107,14 @@ class TurkishTextEdit(QTextEdit):
         cursor = self.textCursor()
         cursor.removeSelectedText()
 
-def send_email_smtp(subject, body, to, attachments=None, smtp_settings=None, is_html=False, vcard_image_path=None):
+def send_email_smtp(subject, body, to, attachments=None, smtp_settings=None, is_html=False, vcard_image_path=None, context=None,
+                    attach_image_originals=True, offloader=None, tracker=None):
     """
     SMTP üzerinden e-posta gönder
+    context: {{firma_adi}} gibi kişiselleştirme alanlarının alıcıya özel değerleri
+    attach_image_originals: False ise görseller yalnızca küçültülmüş inline ön izleme olarak gider
+    offloader: verilirse eşik üstündeki ekler imzalı indirme bağlantısı olarak gönderilir
+    tracker: verilirse HTML gövdeye alıcıya özel açılma takip pikseli eklenir
     smtp_settings: {
         'server': 'smtp.gmail.com',
         'port': 587,
@@ -114,105 +131,8 @@ def send_email_smtp(subject, body, to, attachments=None, smtp_settings=None, is_
                 'password': 'your_password'
             }
 
-        # Ana mesaj - related type kullan (inline görseller için)
-        msg = MIMEMultipart('related')
-        msg['From'] = smtp_settings['username']
-        msg['To'] = to
-        msg['Subject'] = subject
-        msg['Disposition-Notification-To'] = smtp_settings['username']
-        msg['Return-Receipt-To'] = smtp_settings['username']
-        msg['X-Confirm-Reading-To'] = smtp_settings['username']
-        
-        # E-posta gövdesi için multipart/alternative
-        alternative_part = MIMEMultipart('alternative')
-        
-        # Düz metin versiyonu (HTML etiketlerini temizle)
-        plain_text = body
-        if is_html:
-            import re
-            plain_text = re.sub(r'<[^>]+>', '', body)
-            plain_text = plain_text.replace('&nbsp;', ' ')
-            plain_text = re.sub(r'\s+', ' ', plain_text).strip()
-        
-        text_part = MIMEText(plain_text, 'plain', 'utf-8')
-        alternative_part.attach(text_part)
-        
-        # HTML versiyonu (takip pikseli ile)
-        if is_html:
-            html_body = body
-            
-            html_part = MIMEText(html_body, 'html', 'utf-8')
-            alternative_part.attach(html_part)
-        
-        # Alternative part'ı ana mesaja ekle
-        msg.attach(alternative_part)
-        
-        # Ek dosyalardaki görsellerin ön izlemesini inline olarak ekle
-        image_counter = 1
-        if attachments:
-            for file_path in attachments:
-                if os.path.exists(file_path):
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    if file_ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-                        try:
-                            with open(file_path, "rb") as attachment:
-                                part = MIMEImage(attachment.read())
-                                content_id = f'<image{image_counter}>'
-                                part.add_header('Content-ID', content_id)
-                                part.add_header('Content-Disposition', 'inline', filename=os.path.basename(file_path))
-                                msg.attach(part)
-                                image_counter += 1
-                        except Exception as e:
-                            print(f"Görsel ön izleme eklenirken hata: {e}")
-        
-        # Kartvizit görselini en sona inline olarak ekle (eğer varsa)
-        if vcard_image_path and os.path.exists(vcard_image_path):
-            try:
-                with open(vcard_image_path, "rb") as attachment:
-                    part = MIMEImage(attachment.read())
-                    part.add_header('Content-ID', '<kartvizit>')
-                    part.add_header('Content-Disposition', 'inline', filename=os.path.basename(vcard_image_path))
-                    msg.attach(part)
-            except Exception as e:
-                print(f"Kartvizit görseli eklenirken hata: {e}")
-        
-        # Ek dosyaları en sona ekle
-        if attachments:
-            for file_path in attachments:
-                if os.path.exists(file_path):
-                    with open(file_path, "rb") as attachment:
-                        # Normal ek dosya olarak ekle
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(attachment.read())
-                        encoders.encode_base64(part)
-                        filename = os.path.basename(file_path)
-                        part.add_header(
-                            'Content-Disposition',
-                            'attachment',
-                            filename=('utf-8', '', filename)
-                        )
-                        msg.attach(part)
-        
-        # SSL veya TLS seçimi (daha sağlam EHLO ve timeout ile)
-        port = int(smtp_settings['port'])
-        host = smtp_settings['server']
-        if port == 465:
-            server = smtplib.SMTP_SSL(host, port, timeout=30)
-            server.ehlo()
-        else:
-            server = smtplib.SMTP(host, port, timeout=30)
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-        # Bazı sunucularda giriş kullanıcı adı e-posta adresinden farklı olabilir
-        login_username = smtp_settings.get('auth_username', smtp_settings['username'])
-        try:
-            server.login(login_username, smtp_settings['password'])
-        except smtplib.SMTPAuthenticationError as auth_err:
-            raise Exception(f"SMTP kimlik doğrulama hatası (535). Lütfen kullanıcı adı/şifreyi ve gerekirse uygulama şifresini kontrol edin. Sunucu: {host}, Port: {port}. Orijinal hata: {auth_err}")
-        text = msg.as_string()
-        server.sendmail(smtp_settings['username'], to, text)
-        server.quit()
+        deliver_email(subject, body, to, attachments, smtp_settings, is_html, vcard_image_path, context,
+                      attach_image_originals, offloader, tracker)
         
         return True
     except Exception as e:
@@ -260,26 +180,63 @@ class DatabaseMappingManager:
         self.mappings[table_name] = mapping_dict
         self.save_mappings()
         print(f"'{table_name}' tablosu için eşleştirme kaydedildi")
+
+class RecipientTableModel(QAbstractTableModel):
+    """RecipientStore verisini QTableView'a sunan model (hücre nesnesi oluşturmaz)"""
     
-    def apply_mapping_to_data(self, table_name, sql_data, sql_columns):
-        """SQL verilerini sabit başlıklarla eşleştir"""
-        mapping = self.get_mapping(table_name)
-        if not mapping:
-            return sql_data, sql_columns  # Eşleştirme yoksa orijinal veriyi döndür
-        
-        mapped_data = []
-        for row in sql_data:
-            mapped_row = []
-            for fixed_field in self.fixed_fields:
-                sql_field = mapping.get(fixed_field, "")
-                if sql_field and sql_field in sql_columns:
-                    col_index = sql_columns.index(sql_field)
-                    mapped_row.append(row[col_index] if col_index < len(row) else "")
-                else:
-                    mapped_row.append("")
-            mapped_data.append(mapped_row)
-        
-        return mapped_data, self.fixed_fields
+    headers = ["E-posta", "Ad Soyad", "Durum"]
+    
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return self.store.row(index.row())[index.column()]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+    
+    def add_recipient(self, email, name):
+        """Tek alıcı ekle - yalnızca gerçekten eklenen satır bildirilir"""
+        row = len(self.store)
+        if not self.store.add(email, name):
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.endInsertRows()
+        return True
+    
+    def add_recipients(self, contacts):
+        """(e-posta, ad) çiftlerini toplu ekle - tek model sıfırlaması yapılır"""
+        self.beginResetModel()
+        try:
+            return self.store.add_many(contacts)
+        finally:
+            self.endResetModel()
+    
+    def set_status(self, email, status):
+        """Alıcı durumunu güncelle ve ilgili hücreyi yenile"""
+        row = self.store.set_status(email, status)
+        if row is not None:
+            index = self.index(row, 2)
+            self.dataChanged.emit(index, index)
+    
+    def clear(self):
+        """Tüm alıcıları temizle"""
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
 
 class MainWindow(QMainWindow):
     """Ana uygulama penceresi"""
@@ -293,15 +250,45 @@ class MainWindow(QMainWindow):
         # EŞLEŞTİRME YÖNETİCİSİ - YENİ
         self.mapping_manager = DatabaseMappingManager()
         
-        # Gönderim sayaçları
-        self.hourly_sent_count = 0
-        self.daily_sent_count = 0
-        self.last_hourly_reset = datetime.now()
-        self.last_daily_reset = datetime.now()
-        
-        # Zamanlama listesi
-        self.scheduled_emails = []
-        self.email_timers = {}
+        # Gönderim motoru (cli.py ve servis ile ortak) - limit, zamanlanmış iş ve filtre kuralları
+        self.engine = EmailEngine(self.config_manager.config_path, log=self.logger.info)
+        # Engelleme listesi (bounce / abonelikten çıkma / manuel)
+        self.suppression_list = self.engine.suppression_list
+        # Kampanyalar arası gönderim geçmişi (aynı şablonu tekrar gönderme kontrolü)
+        self.contact_history = self.engine.contact_history
+        # E-posta doğrulama (sözdizimi, IDN, yazım hatası, MX önbelleği)
+        self.email_validator = self.engine.email_validator
+        # Kartvizit/imza HTML önbelleği
+        self.signature_renderer = self.engine.signature_renderer
+        # Büyük ekler için imzalı indirme bağlantıları (dosya sunucusu ilk gönderimde başlatılır)
+        self.hosted_file_registry = HostedFileRegistry()
+        self.attachment_offloader = None
+        # Açılma/tıklama takibi - olaylar bellekte toplanıp arka planda toplu yazılır
+        self.tracking_store = TrackingStore()
+        self.tracking_store.start()
+        self.tracking_server = None
+        self.message_tracker = None
+        # Geri dönüş (DSN) ve okundu bilgisi (MDN) işleme - posta kutusu arka planda yoklanır
+        self.bounce_worker = None
+        
+        # Gönderim sayaçları - config.json'da servisle ortak, kilit altında güncellenir
+        self.limiter = self.engine.limiter
+        
+        # Zamanlanmış işler - kalıcı heap; tek timer en yakın işe kurulur
+        self.job_scheduler = self.engine.job_scheduler
+        self.schedule_row_ids = []
+        # Zamanı gelen işler sırayla arka plan iş parçacığında çalıştırılır
+        self.job_worker = None
+        self.job_reservation = None
+        self.closing = False
+        self.pending_jobs = []
+        self.scheduler_timer = QTimer()
+        self.scheduler_timer.setSingleShot(True)
+        self.scheduler_timer.timeout.connect(self.send_scheduled_email)
+        # İş dosyası servis (cli.py run-daemon) tarafından da değiştirilebilir; dosya atomik
+        # olarak değiştirildiği için klasör izlenir
+        self.jobs_file_watcher = QFileSystemWatcher([os.path.dirname(os.path.abspath(self.job_scheduler.path))])
+        self.jobs_file_watcher.directoryChanged.connect(self.on_jobs_file_changed)
         
         self.init_ui()
         self.load_config()
@@ -309,12 +296,13 @@ class MainWindow(QMainWindow):
         # Veritabanı bağlantısını başlat
         # self.initialize_database_connection()
         
-        # İstatistikleri yükle
-        self.load_sending_stats()
-        
         # UI oluşturulduktan sonra limit ayarlarını yükle
         QTimer.singleShot(100, self.load_limit_settings)
         
+        # Önceki oturumdan kalan zamanlanmış işleri göster ve zamanlayıcıyı kur
+        self.refresh_schedule_list()
+        self.arm_scheduler_timer()
+        
         # Periyodik olarak sonraki zamanlama etiketini güncelle (her 30 saniyede bir)
         self.next_schedule_timer = QTimer()
         self.next_schedule_timer.timeout.connect(self.update_next_schedule_label)
@@ -325,6 +313,16 @@ class MainWindow(QMainWindow):
         self.stats_timer.timeout.connect(self.refresh_sending_stats)
         self.stats_timer.start(10000)  # 10 saniye
         
+        # Takip olaylarını (ilk açılma/tıklama) loglara aktar (her 5 saniyede bir)
+        self.tracking_timer = QTimer()
+        self.tracking_timer.timeout.connect(self.process_tracking_events)
+        self.tracking_timer.start(5000)  # 5 saniye
+        
+        # Posta kutusu yoklama timer'ı (süre ayarlardan, kapalıysa çalışmaz)
+        self.bounce_timer = QTimer()
+        self.bounce_timer.timeout.connect(self.check_bounces)
+        self.update_bounce_timer()
+        
         self.backup_thread = None
         self.backup_stop_event = threading.Event()
         
@@ -705,7 +703,138 @@ class MainWindow(QMainWindow):
         self.signature_services_edit.setPlaceholderText("Personel Devam Kontrol Sistemleri - Bekçi Tur Sistemleri")
         self.signature_services_edit.setMinimumWidth(250)
         vcard_layout.addWidget(self.signature_services_edit, 10, 1)
+        
+        # Görsel ekler: inline ön izleme küçültülmüş kopya ile gönderilir
+        vcard_layout.addWidget(QLabel("Görsel Ekler:"), 11, 0)
+        self.attach_image_originals_check = QCheckBox("Görsellerin orijinalini ayrıca ek olarak gönder")
+        self.attach_image_originals_check.setChecked(True)
+        self.attach_image_originals_check.setToolTip("Kapalıysa görseller yalnızca küçültülmüş ön izleme olarak gönderilir")
+        vcard_layout.addWidget(self.attach_image_originals_check, 11, 1)
         layout.addWidget(vcard_group)
+        
+        # Büyük ek paylaşımı grubu - eşik üstündeki ekler imzalı indirme bağlantısı ile gönderilir
+        offload_group = QGroupBox("Büyük Ek Paylaşımı")
+        offload_layout = QGridLayout(offload_group)
+        offload_layout.setColumnStretch(0, 0)
+        offload_layout.setColumnStretch(1, 1)
+        
+        offload_layout.addWidget(QLabel("Bağlantı ile Gönder:"), 0, 0)
+        self.offload_enabled_check = QCheckBox("Büyük ekleri e-postaya koymak yerine indirme bağlantısı olarak gönder")
+        offload_layout.addWidget(self.offload_enabled_check, 0, 1)
+        
+        offload_layout.addWidget(QLabel("Boyut Eşiği:"), 1, 0)
+        self.offload_threshold_spin = QSpinBox()
+        self.offload_threshold_spin.setRange(1, 1024)
+        self.offload_threshold_spin.setValue(5)
+        self.offload_threshold_spin.setSuffix(" MB")
+        self.offload_threshold_spin.setMaximumWidth(100)
+        offload_layout.addWidget(self.offload_threshold_spin, 1, 1)
+        
+        offload_layout.addWidget(QLabel("Genel Adres:"), 2, 0)
+        self.offload_base_url_edit = QLineEdit()
+        self.offload_base_url_edit.setPlaceholderText("http://sunucu-adresi:8090 (alıcıların erişebileceği adres)")
+        offload_layout.addWidget(self.offload_base_url_edit, 2, 1)
+        
+        offload_layout.addWidget(QLabel("Sunucu Portu:"), 3, 0)
+        offload_port_layout = QHBoxLayout()
+        self.offload_port_spin = QSpinBox()
+        self.offload_port_spin.setRange(1024, 65535)
+        self.offload_port_spin.setValue(8090)
+        self.offload_port_spin.setMaximumWidth(100)
+        offload_port_layout.addWidget(self.offload_port_spin)
+        download_stats_btn = QPushButton("📊 İndirme İstatistikleri")
+        download_stats_btn.setFixedHeight(28)
+        download_stats_btn.clicked.connect(self.show_download_stats)
+        offload_port_layout.addWidget(download_stats_btn)
+        offload_port_layout.addStretch()
+        offload_layout.addLayout(offload_port_layout, 3, 1)
+        layout.addWidget(offload_group)
+        
+        # Açılma/tıklama takibi grubu
+        tracking_group = QGroupBox("Açılma/Tıklama Takibi")
+        tracking_layout = QGridLayout(tracking_group)
+        tracking_layout.setColumnStretch(0, 0)
+        tracking_layout.setColumnStretch(1, 1)
+        
+        tracking_layout.addWidget(QLabel("Takip:"), 0, 0)
+        self.tracking_enabled_check = QCheckBox("HTML e-postalara açılma takip pikseli ekle")
+        tracking_layout.addWidget(self.tracking_enabled_check, 0, 1)
+        
+        tracking_layout.addWidget(QLabel("Tıklama Takibi:"), 3, 0)
+        self.tracking_clicks_check = QCheckBox("Gövdedeki bağlantıları takip yönlendirmesine çevir")
+        self.tracking_clicks_check.setChecked(True)
+        tracking_layout.addWidget(self.tracking_clicks_check, 3, 1)
+        
+        tracking_layout.addWidget(QLabel("Genel Adres:"), 1, 0)
+        self.tracking_base_url_edit = QLineEdit()
+        self.tracking_base_url_edit.setPlaceholderText("http://sunucu-adresi:8080 (alıcıların erişebileceği adres)")
+        tracking_layout.addWidget(self.tracking_base_url_edit, 1, 1)
+        
+        tracking_layout.addWidget(QLabel("Sunucu:"), 2, 0)
+        tracking_server_layout = QHBoxLayout()
+        self.tracking_embedded_check = QCheckBox("Uygulama içinde çalıştır, port:")
+        self.tracking_embedded_check.setChecked(True)
+        self.tracking_embedded_check.setToolTip("Kapalıysa ayrı çalışan sunucu kullanılır (python -m modules.tracking_server)")
+        tracking_server_layout.addWidget(self.tracking_embedded_check)
+        self.tracking_port_spin = QSpinBox()
+        self.tracking_port_spin.setRange(1024, 65535)
+        self.tracking_port_spin.setValue(8080)
+        self.tracking_port_spin.setMaximumWidth(100)
+        tracking_server_layout.addWidget(self.tracking_port_spin)
+        tracking_stats_btn = QPushButton("📊 Kampanya İstatistikleri")
+        tracking_stats_btn.setFixedHeight(28)
+        tracking_stats_btn.clicked.connect(self.show_tracking_stats)
+        tracking_server_layout.addWidget(tracking_stats_btn)
+        tracking_server_layout.addStretch()
+        tracking_layout.addLayout(tracking_server_layout, 2, 1)
+        layout.addWidget(tracking_group)
+        
+        # Geri dönüş ve okundu bilgisi işleme grubu
+        bounce_group = QGroupBox("Geri Dönüş ve Okundu Bilgisi İşleme")
+        bounce_layout = QGridLayout(bounce_group)
+        bounce_layout.setColumnStretch(0, 0)
+        bounce_layout.setColumnStretch(1, 1)
+        
+        bounce_layout.addWidget(QLabel("Posta Kutusu Yoklama:"), 0, 0)
+        self.bounce_enabled_check = QCheckBox("Geri dönen e-postaları engelleme listesine ekle, okundu bilgilerini logla")
+        self.bounce_enabled_check.toggled.connect(self.update_bounce_timer)
+        bounce_layout.addWidget(self.bounce_enabled_check, 0, 1)
+        
+        bounce_layout.addWidget(QLabel("IMAP Sunucu:"), 1, 0)
+        imap_layout = QHBoxLayout()
+        self.imap_server_edit = QLineEdit()
+        self.imap_server_edit.setPlaceholderText("Boş bırakılırsa SMTP sunucusundan türetilir (imap.gmail.com)")
+        imap_layout.addWidget(self.imap_server_edit)
+        imap_layout.addWidget(QLabel("Port:"))
+        self.imap_port_edit = QLineEdit("993")
+        self.imap_port_edit.setMaximumWidth(60)
+        imap_layout.addWidget(self.imap_port_edit)
+        bounce_layout.addLayout(imap_layout, 1, 1)
+        
+        bounce_layout.addWidget(QLabel("Yoklama Aralığı:"), 2, 0)
+        bounce_interval_layout = QHBoxLayout()
+        self.bounce_interval_spin = QSpinBox()
+        self.bounce_interval_spin.setRange(1, 1440)
+        self.bounce_interval_spin.setValue(15)
+        self.bounce_interval_spin.setSuffix(" dk")
+        self.bounce_interval_spin.setMaximumWidth(100)
+        self.bounce_interval_spin.valueChanged.connect(self.update_bounce_timer)
+        bounce_interval_layout.addWidget(self.bounce_interval_spin)
+        bounce_check_btn = QPushButton("📥 Şimdi Kontrol Et")
+        bounce_check_btn.setFixedHeight(28)
+        bounce_check_btn.clicked.connect(lambda: self.check_bounces(manual=True))
+        bounce_interval_layout.addWidget(bounce_check_btn)
+        bounce_interval_layout.addStretch()
+        bounce_layout.addLayout(bounce_interval_layout, 2, 1)
+        layout.addWidget(bounce_group)
+        
+        # İmza HTML'i yalnızca alanlar değiştiğinde yeniden oluşturulur
+        self.vcard_enabled_check.toggled.connect(self.sync_signature_renderer)
+        self.vcard_signature_enabled.toggled.connect(self.sync_signature_renderer)
+        for signature_edit in (self.signature_name_edit, self.signature_phone_edit, self.signature_mobile_edit,
+                               self.signature_email_edit, self.signature_web_edit, self.signature_address_edit,
+                               self.signature_services_edit):
+            signature_edit.textChanged.connect(self.sync_signature_renderer)
 
         # Kontrol butonları için layout
         control_layout = QHBoxLayout()
@@ -860,6 +989,51 @@ class MainWindow(QMainWindow):
         mapping_layout.addLayout(mapping_buttons)
         layout.addWidget(mapping_group)
         
+        # İNDEKS DANIŞMANI - filtre ve e-posta sütunları için eksik indeksler
+        index_group = QGroupBox("İndeks Danışmanı")
+        index_layout = QVBoxLayout(index_group)
+        
+        self.index_suggestion_list = QListWidget()
+        self.index_suggestion_list.setMaximumHeight(120)
+        self.index_suggestion_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        index_layout.addWidget(self.index_suggestion_list)
+        
+        index_buttons = QHBoxLayout()
+        analyze_index_btn = QPushButton("İndeksleri Analiz Et")
+        analyze_index_btn.clicked.connect(self.analyze_table_indexes)
+        index_buttons.addWidget(analyze_index_btn)
+        
+        self.create_index_btn = QPushButton("Seçili İndeksleri Oluştur")
+        self.create_index_btn.clicked.connect(self.create_selected_indexes)
+        self.create_index_btn.setEnabled(False)
+        index_buttons.addWidget(self.create_index_btn)
+        
+        explain_btn = QPushButton("Son Filtre Sorgusunu Ölç")
+        explain_btn.clicked.connect(self.measure_last_filter_query)
+        index_buttons.addWidget(explain_btn)
+        index_layout.addLayout(index_buttons)
+        
+        self.explain_label = QLabel("Sorgu süresi: -")
+        index_layout.addWidget(self.explain_label)
+        
+        layout.addWidget(index_group)
+        
+        # SORGU TANILAMA - filtre şekli bazında süreler
+        stats_group = QGroupBox("Sorgu Tanılama")
+        stats_layout = QVBoxLayout(stats_group)
+        self.query_stats_table = QTableWidget()
+        self.query_stats_table.setColumnCount(6)
+        self.query_stats_table.setHorizontalHeaderLabels(["Sorgu Şekli", "Çalıştırma", "Ort. ms", "En Yüksek ms", "Son ms", "Satır"])
+        self.query_stats_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.query_stats_table.setMaximumHeight(150)
+        stats_layout.addWidget(self.query_stats_table)
+        layout.addWidget(stats_group)
+        
+        self.index_suggestions = []
+        self.last_filter_query = None
+        # (tablo, eşleştirme, filtre şekli) -> hazır filtre sorgusu
+        self.filter_query_cache = {}
+        
         layout.addStretch()
         return widget
         
@@ -889,6 +1063,13 @@ class MainWindow(QMainWindow):
         self.filter_sektor = QComboBox()
         self.filter_sektor.setEditable(True)
         filter_layout.addWidget(self.filter_sektor, 2, 1)
+        
+        # İl/Sektör otomatik tamamlama - seçili tablonun sütunları (öneriler DatabaseManager'ın
+        # DISTINCT değer önbelleğinden gelir)
+        self.filter_columns = {}
+        self.setup_filter_autocomplete(self.filter_il, "il")
+        self.setup_filter_autocomplete(self.filter_sektor, "Sektör")
+        self.filter_tablo_adi.currentTextChanged.connect(self.on_filter_table_changed)
 
         # E-posta filtresi checkbox'ı
         self.filter_email_checkbox = QCheckBox("Sadece e-posta adresi olanları göster")
@@ -907,6 +1088,19 @@ class MainWindow(QMainWindow):
         self.add_to_recipients_btn.setEnabled(False)  # Başlangıçta devre dışı
         button_layout.addWidget(self.add_to_recipients_btn)
         
+        add_all_btn = QPushButton("Filtreye Uyan Tümünü Ekle")
+        add_all_btn.setToolTip("Sonuç tablosunu doldurmadan filtreye uyan tüm kayıtları alıcı listesine ekler")
+        add_all_btn.clicked.connect(self.add_all_matching_to_recipients)
+        button_layout.addWidget(add_all_btn)
+        
+        queue_audience_btn = QPushButton("Filtredeki Herkese Gönder (SQL)")
+        queue_audience_btn.setToolTip("E-postaları veritabanında tekilleştirip satırları yüklemeden gönderim kuyruğuna alır")
+        queue_audience_btn.clicked.connect(self.queue_filter_audience)
+        button_layout.addWidget(queue_audience_btn)
+        
+        # Son filtre sonucu (satırlar, başlıklar) - alıcı listesine ekleme için
+        self.filter_results = ([], [])
+        
         filter_layout.addLayout(button_layout, 4, 0, 1, 2)
         
         layout.addWidget(filter_group)
@@ -982,116 +1176,122 @@ class MainWindow(QMainWindow):
             # Tablo adlarını getir
             cur.execute("SELECT tablename FROM pg_catalog.pg_tables WHERE schemaname = 'public'")
             tablolar = [row[0] for row in cur.fetchall()]
+            cur.close()
+            
+            # Tablo değişim sinyali, doldurma sırasında gereksiz yere tetiklenmesin
+            self.filter_tablo_adi.blockSignals(True)
             self.filter_tablo_adi.clear()
             self.filter_tablo_adi.addItem("")
             self.filter_tablo_adi.addItems(tablolar)
+            self.filter_tablo_adi.blockSignals(False)
             
-            # İL - HAZIR LİSTE YAKLAŞIMI (Performans için)
-            turkiye_illeri = [
-                "Adana", "Adıyaman", "Afyonkarahisar", "Ağrı", "Aksaray", "Amasya", "Ankara", "Antalya", "Ardahan", "Artvin", "Aydın", "Balıkesir",
-                "Bartın", "Batman", "Bayburt", "Bilecik", "Bingöl", "Bitlis", "Bolu", "Burdur", "Bursa", "Çanakkale", "Çankırı", "Çorum",
-                "Denizli", "Diyarbakır", "Düzce", "Edirne", "Elazığ", "Erzincan", "Erzurum", "Eskişehir", "Gaziantep", "Giresun", "Gümüşhane", "Hakkari",
-                "Hatay", "Iğdır", "Isparta", "İstanbul", "İzmir", "Kahramanmaraş", "Karabük", "Karaman", "Kars", "Kastamonu", "Kayseri", "Kilis",
-                "Kırıkkale", "Kırklareli", "Kırşehir", "Kocaeli", "Konya", "Kütahya", "Malatya", "Manisa", "Mardin", "Mersin", "Muğla", "Muş",
-                "Nevşehir", "Niğde", "Ordu", "Osmaniye", "Rize", "Sakarya", "Samsun", "Şanlıurfa", "Siirt", "Sinop", "Sivas", "Şırnak",
-                "Tekirdağ", "Tokat", "Trabzon", "Tunceli", "Uşak", "Van", "Yalova", "Yozgat", "Zonguldak"
-            ]
-            
-            # İl combobox'ını önce hazır liste ile doldur
-            self.filter_il.clear()
-            self.filter_il.addItem("")
-            self.filter_il.addItems(turkiye_illeri)
-            
-            # Eğer veritabanı bağlantısı varsa, dinamik verileri de ekle
-            if self.database_manager.conn:
-                try:
-                    # Seçili tabloya göre dinamik il verilerini al
-                    selected_table = self.filter_tablo_adi.currentText()
-                    if selected_table:
-                        # Eşleştirme kontrol et
-                        mapping = self.mapping_manager.get_mapping(selected_table)
-                        
-                        if mapping and "il" in mapping:
-                            # Eşleştirme varsa, eşleştirilmiş sütun adını kullan
-                            il_column = mapping["il"]
-                            print(f"Eşleştirme ile il sütunu: {il_column}")
-                        else:
-                            # Eşleştirme yoksa, varsayılan "il" sütununu kullan
-                            il_column = "il"
-                            print("Eşleştirme yok, varsayılan il sütunu kullanılıyor")
-                        
-                        # Veritabanındaki ek illeri de ekle (varsa)
-                        cur.execute(f"SELECT DISTINCT \"{il_column}\" FROM \"{selected_table}\" WHERE \"{il_column}\" IS NOT NULL AND \"{il_column}\" <> '' ORDER BY \"{il_column}\"")
-                        db_iller = [row[0] for row in cur.fetchall()]
-                        
-                        # Veritabanındaki ek illeri de ekle (varsa)
-                        for il in db_iller:
-                            if il not in turkiye_illeri:
-                                self.filter_il.addItem(il)
-                                print(f"Ek il eklendi: {il}")
-                except Exception as e:
-                    print(f"Veritabanından il verisi alınamadı: {e}")
-            
-            # SEKTÖR - EŞLEŞTİRME İLE DİNAMİK SQL YAKLAŞIMI
-            try:
-                # Seçili tabloya göre sektör verilerini al
-                selected_table = self.filter_tablo_adi.currentText()
-                if selected_table:
-                    # Eşleştirme kontrol et
-                    mapping = self.mapping_manager.get_mapping(selected_table)
-                    
-                    if mapping and "Sektör" in mapping:
-                        # Eşleştirme varsa, eşleştirilmiş sütun adını kullan
-                        sektor_column = mapping["Sektör"]
-                        print(f"Eşleştirme ile sektör sütunu: {sektor_column}")
-                    else:
-                        # Eşleştirme yoksa, eski yöntemle bul
-                        cur.execute(f"""
-                            SELECT column_name 
-                            FROM information_schema.columns 
-                            WHERE table_name = '{selected_table}' 
-                            ORDER BY ordinal_position
-                        """)
-                        columns = [row[0] for row in cur.fetchall()]
-                        print(f"Tablo '{selected_table}' sütunları: {columns}")
-                        
-                        sektor_column = None
-                        for col in columns:
-                            if col.lower() in ['sektör', 'sektor', 'sector']:
-                                sektor_column = col
-                                break
-                    
-                    if sektor_column:
-                        cur.execute(f"SELECT DISTINCT \"{sektor_column}\" FROM \"{selected_table}\" WHERE \"{sektor_column}\" IS NOT NULL AND \"{sektor_column}\" <> '' ORDER BY \"{sektor_column}\"")
-                        sektorler = [row[0] for row in cur.fetchall()]
-                        self.filter_sektor.clear()
-                        self.filter_sektor.addItem("")
-                        self.filter_sektor.addItems(sektorler)
-                        print(f"Sektör verileri yüklendi: {len(sektorler)} adet")
-                    else:
-                        print(f"Sektör sütunu bulunamadı.")
-                        self.filter_sektor.clear()
-                        self.filter_sektor.addItem("")
-                else:
-                    # Tablo seçilmemişse boş liste
-                    self.filter_sektor.clear()
-                    self.filter_sektor.addItem("")
-                    
-            except Exception as e:
-                print(f"Sektör verisi alınamadı: {e}")
-                # Hata durumunda boş liste
-                self.filter_sektor.clear()
-                self.filter_sektor.addItem("")
-            
-            cur.close()
-            if not self.database_manager.conn:
-                conn.close()
+            # İl ve Sektör değerleri önbellekten (gerekirse veritabanından) doldurulur
+            self.update_filter_value_comboboxes()
                 
-            print(f"Filtre comboboxları güncellendi: {len(tablolar)} tablo, {len(turkiye_illeri)} il (hazır liste), {len(sektorler) if 'sektorler' in locals() else 0} sektör (dinamik)")
+            print(f"Filtre comboboxları güncellendi: {len(tablolar)} tablo")
             
         except Exception as e:
             print(f"Filtre comboboxları güncellenemedi: {e}")
 
+    def on_filter_table_changed(self, table_name):
+        """Filtreleme tablosu değiştiğinde İl/Sektör listelerini önbellekten yenile"""
+        if self.database_manager.conn:
+            self.update_filter_value_comboboxes()
+
+    def get_filter_columns(self, table_name):
+        """Seçili tablo için il ve sektör sütun adlarını döndür (eşleştirme öncelikli)"""
+        mapping = self.mapping_manager.get_mapping(table_name)
+        
+        # İl sütunu: eşleştirme varsa eşleştirilmiş sütun, yoksa varsayılan "il"
+        il_column = mapping.get("il", "il") if mapping else "il"
+        
+        if mapping and "Sektör" in mapping:
+            sektor_column = mapping["Sektör"]
+        else:
+            # Eşleştirme yoksa sütun listesinden bul (sütun listesi önbellekli)
+            columns, error = self.database_manager.get_table_columns(table_name)
+            sektor_column = None
+            for col in columns or []:
+                if col.lower() in ['sektör', 'sektor', 'sector']:
+                    sektor_column = col
+                    break
+        
+        return il_column, sektor_column
+
+    def update_filter_value_comboboxes(self):
+        """İl ve Sektör comboboxlarını DISTINCT değer önbelleğinden doldur"""
+        # İL - HAZIR LİSTE YAKLAŞIMI (Performans için)
+        turkiye_illeri = [
+            "Adana", "Adıyaman", "Afyonkarahisar", "Ağrı", "Aksaray", "Amasya", "Ankara", "Antalya", "Ardahan", "Artvin", "Aydın", "Balıkesir",
+            "Bartın", "Batman", "Bayburt", "Bilecik", "Bingöl", "Bitlis", "Bolu", "Burdur", "Bursa", "Çanakkale", "Çankırı", "Çorum",
+            "Denizli", "Diyarbakır", "Düzce", "Edirne", "Elazığ", "Erzincan", "Erzurum", "Eskişehir", "Gaziantep", "Giresun", "Gümüşhane", "Hakkari",
+            "Hatay", "Iğdır", "Isparta", "İstanbul", "İzmir", "Kahramanmaraş", "Karabük", "Karaman", "Kars", "Kastamonu", "Kayseri", "Kilis",
+            "Kırıkkale", "Kırklareli", "Kırşehir", "Kocaeli", "Konya", "Kütahya", "Malatya", "Manisa", "Mardin", "Mersin", "Muğla", "Muş",
+            "Nevşehir", "Niğde", "Ordu", "Osmaniye", "Rize", "Sakarya", "Samsun", "Şanlıurfa", "Siirt", "Sinop", "Sivas", "Şırnak",
+            "Tekirdağ", "Tokat", "Trabzon", "Tunceli", "Uşak", "Van", "Yalova", "Yozgat", "Zonguldak"
+        ]
+        
+        il_items = list(turkiye_illeri)
+        sektor_items = []
+        selected_table = self.filter_tablo_adi.currentText()
+        self.filter_columns = {}
+        
+        if selected_table:
+            il_column, sektor_column = self.get_filter_columns(selected_table)
+            self.filter_columns = {"il": il_column, "Sektör": sektor_column}
+            
+            # Veritabanındaki ek illeri de ekle (varsa)
+            db_iller, error = self.database_manager.get_distinct_values(selected_table, il_column)
+            if error:
+                print(f"Veritabanından il verisi alınamadı: {error}")
+            known_iller = set(turkiye_illeri)
+            for il in db_iller or []:
+                if il not in known_iller:
+                    il_items.append(il)
+            
+            # SEKTÖR - EŞLEŞTİRME İLE DİNAMİK SQL YAKLAŞIMI
+            if sektor_column:
+                sektorler, error = self.database_manager.get_distinct_values(selected_table, sektor_column)
+                if error:
+                    print(f"Sektör verisi alınamadı: {error}")
+                sektor_items = list(sektorler or [])
+            else:
+                print("Sektör sütunu bulunamadı.")
+        
+        # Kullanıcının yazdığı metni koruyarak listeyi yenile
+        for combo, items in ((self.filter_il, il_items), (self.filter_sektor, sektor_items)):
+            current_text = combo.currentText()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem("")
+            combo.addItems([str(item) for item in items])
+            combo.setEditText(current_text)
+            combo.blockSignals(False)
+        
+        stats = self.database_manager.distinct_cache.get_stats()
+        print(f"İl/Sektör listeleri güncellendi: {len(il_items)} il, {len(sektor_items)} sektör (önbellek: {stats['hits']} isabet, {stats['misses']} sorgu)")
+
+    def setup_filter_autocomplete(self, combo, field):
+        """Combobox için Türkçe büyük/küçük harf duyarsız önek tamamlayıcısı kur"""
+        model = QStringListModel(combo)
+        completer = QCompleter(model, combo)
+        # Filtreleme Qt'ye bırakılmıyor; İ/ı katlaması önbellek indeksinde yapılıyor
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        combo.setCompleter(completer)
+        combo.lineEdit().textEdited.connect(
+            lambda text: self.update_filter_completer(completer, model, field, text))
+
+    def update_filter_completer(self, completer, model, field, text):
+        """Yazılan öneke göre tamamlama listesini güncelle"""
+        column = self.filter_columns.get(field)
+        if not text or not column:
+            model.setStringList([])
+            return
+        matches = self.database_manager.autocomplete_values(self.filter_tablo_adi.currentText(), column, text, limit=30)
+        model.setStringList(matches)
+        if matches:
+            completer.complete()
+
     def create_email_tab(self):
         """E-posta sekmesini oluştur"""
         widget = QWidget()
@@ -1119,11 +1319,29 @@ class MainWindow(QMainWindow):
         
         recipient_layout.addLayout(bcc_layout)
         
-        self.recipient_list = QTableWidget()
-        self.recipient_list.setColumnCount(3)
-        self.recipient_list.setHorizontalHeaderLabels(["E-posta", "Ad Soyad", "Durum"])
+        # Alıcı listesi - asıl veri RecipientStore'da, tablo yalnızca görünüm
+        self.recipient_store = RecipientStore(suppression=self.suppression_list,
+                                              known_statuses=load_recipient_statuses())
+        self.recipient_model = RecipientTableModel(self.recipient_store, self)
+        self.recipient_list = QTableView()
+        self.recipient_list.setModel(self.recipient_model)
         recipient_layout.addWidget(self.recipient_list)
         
+        # SQL tarafında oluşturulan gönderim kuyruğu (filtreye uyan herkes)
+        self.send_queue = []
+        # SQL kuyruğundaki alıcıların kişiselleştirme alanları (e-posta -> alanlar)
+        self.send_queue_contexts = {}
+        send_queue_layout = QHBoxLayout()
+        self.send_queue_label = QLabel()
+        self.send_queue_label.setStyleSheet("color: #1976D2; font-weight: bold;")
+        send_queue_layout.addWidget(self.send_queue_label)
+        self.clear_send_queue_btn = QPushButton("Kuyruğu Temizle")
+        self.clear_send_queue_btn.clicked.connect(self.clear_send_queue)
+        send_queue_layout.addWidget(self.clear_send_queue_btn)
+        send_queue_layout.addStretch()
+        recipient_layout.addLayout(send_queue_layout)
+        self.update_send_queue_label()
+        
         # Alıcı ekleme butonları - yatay düzen
         add_recipient_buttons_layout = QHBoxLayout()
         
@@ -1152,6 +1370,21 @@ class MainWindow(QMainWindow):
         import_btn.clicked.connect(self.show_manual_import_dialog)
         add_recipient_buttons_layout.addWidget(import_btn)
         
+        # Doğrulama butonu
+        validate_list_btn = QPushButton("✔ Listeyi Doğrula")
+        validate_list_btn.setStyleSheet("QPushButton { background-color: #009688; color: white; font-size: 12px; border: none; border-radius: 4px; padding: 8px 12px; } QPushButton:hover { background-color: #00796B; }")
+        validate_list_btn.setToolTip("Sözdizimi, alan adı yazım hatası ve isteğe bağlı MX kontrolü")
+        validate_list_btn.clicked.connect(self.validate_recipient_list)
+        add_recipient_buttons_layout.addWidget(validate_list_btn)
+        self.validation_worker = None
+        
+        # Engelleme listesi butonu
+        suppression_btn = QPushButton("🚫 Engelleme Listesi")
+        suppression_btn.setStyleSheet("QPushButton { background-color: #607D8B; color: white; font-size: 12px; border: none; border-radius: 4px; padding: 8px 12px; } QPushButton:hover { background-color: #455A64; }")
+        suppression_btn.setToolTip("Bounce / abonelikten çıkma / manuel engelleme listesi")
+        suppression_btn.clicked.connect(lambda: self.show_suppression_menu(suppression_btn))
+        add_recipient_buttons_layout.addWidget(suppression_btn)
+        
         # Temizle butonu
         clear_btn = QPushButton("🗑️ Listeyi Temizle")
         clear_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-size: 12px; border: none; border-radius: 4px; padding: 8px 12px; } QPushButton:hover { background-color: #d32f2f; }")
@@ -1247,6 +1480,7 @@ class MainWindow(QMainWindow):
         subject_edit = QLineEdit()
         subject_edit.setText(default_subject)
         subject_edit.setPlaceholderText("Konu")
+        subject_edit.setToolTip(PERSONALIZATION_HINT)
         layout.addWidget(subject_edit)
         
         # Gövde metni ve değişken genişlik seçenekleri
@@ -1564,6 +1798,7 @@ class MainWindow(QMainWindow):
             subject_edit = QLineEdit()
             subject_edit.setText(tpl.get("subject", ""))  # Güvenli erişim
             subject_edit.setPlaceholderText("Konu")
+            subject_edit.setToolTip(PERSONALIZATION_HINT)
             layout.addWidget(subject_edit)
             
             # Gövde metni ve değişken genişlik seçenekleri
@@ -1931,6 +2166,10 @@ class MainWindow(QMainWindow):
         self.limit_check.setChecked(True)
         self.limit_check.setStyleSheet("font-size: 11px;")
         limits_layout.addWidget(self.limit_check, 1, 2, 1, 2)  # 2 sütun genişliğinde
+        # Limit ayarları ortak gönderim sayaçlarına anında yansır
+        self.hourly_limit_spin.valueChanged.connect(self.apply_limit_settings)
+        self.daily_limit_spin.valueChanged.connect(self.apply_limit_settings)
+        self.limit_check.toggled.connect(self.apply_limit_settings)
         
         # 3. SATIR: Güncel Durum
         status_layout = QHBoxLayout()
@@ -2054,8 +2293,90 @@ class MainWindow(QMainWindow):
         status_layout.addLayout(button_layout)
         limits_layout.addLayout(status_layout, 2, 0, 1, 4)  # Tüm sütunları kapla
         
+        # 4. SATIR: Gönderim geçmişi - aynı şablonu tekrar gönderme
+        history_label = QLabel("🔁 Tekrar gönderme:")
+        history_label.setStyleSheet("font-size: 11px; color: #333;")
+        limits_layout.addWidget(history_label, 3, 0)
+        
+        self.history_skip_days_spin = QSpinBox()
+        self.history_skip_days_spin.setRange(0, 365)
+        self.history_skip_days_spin.setValue(0)
+        self.history_skip_days_spin.setSuffix(" gün")
+        self.history_skip_days_spin.setSpecialValueText("Kapalı")
+        self.history_skip_days_spin.setToolTip("Aynı şablonu (konu) bu kadar gün içinde almış alıcılar atlanır")
+        self.history_skip_days_spin.setStyleSheet("""
+            QSpinBox {
+                font-size: 11px;
+                padding: 3px;
+                border: 1px solid #CCC;
+                border-radius: 3px;
+                min-height: 20px;
+            }
+        """)
+        limits_layout.addWidget(self.history_skip_days_spin, 3, 1)
+        
         layout.addWidget(limits_group)
         
+        # Gönderim planı grubu - günlük kota izinli saatlere eşit aralıklarla yayılır
+        plan_group = QGroupBox("🗓️ Gönderim Planı")
+        plan_group.setStyleSheet(limits_group.styleSheet())
+        plan_layout = QGridLayout(plan_group)
+        plan_layout.setSpacing(8)
+        
+        self.spread_check = QCheckBox("Gönderimi çalışma saatlerine yay")
+        self.spread_check.setToolTip("Zamanlanan işler arka arkaya değil, günlük limit izinli saatlere eşit aralıklarla dağıtılarak gönderilir")
+        self.spread_check.setStyleSheet("font-size: 11px;")
+        plan_layout.addWidget(self.spread_check, 0, 0, 1, 2)
+        
+        self.spread_weekdays_check = QCheckBox("Yalnızca iş günleri")
+        self.spread_weekdays_check.setChecked(True)
+        self.spread_weekdays_check.setStyleSheet("font-size: 11px;")
+        plan_layout.addWidget(self.spread_weekdays_check, 0, 2, 1, 2)
+        
+        hours_label = QLabel("🕘 Saatler:")
+        hours_label.setStyleSheet("font-size: 11px; color: #333;")
+        plan_layout.addWidget(hours_label, 1, 0)
+        
+        hours_layout = QHBoxLayout()
+        self.spread_start_hour_spin = QSpinBox()
+        self.spread_start_hour_spin.setRange(0, 23)
+        self.spread_start_hour_spin.setValue(9)
+        self.spread_start_hour_spin.setSuffix(":00")
+        hours_layout.addWidget(self.spread_start_hour_spin)
+        hours_layout.addWidget(QLabel("-"))
+        self.spread_end_hour_spin = QSpinBox()
+        self.spread_end_hour_spin.setRange(1, 24)
+        self.spread_end_hour_spin.setValue(18)
+        self.spread_end_hour_spin.setSuffix(":00")
+        hours_layout.addWidget(self.spread_end_hour_spin)
+        plan_layout.addLayout(hours_layout, 1, 1)
+        
+        jitter_label = QLabel("🎲 Rastgelelik:")
+        jitter_label.setStyleSheet("font-size: 11px; color: #333;")
+        plan_layout.addWidget(jitter_label, 1, 2)
+        
+        self.spread_jitter_spin = QSpinBox()
+        self.spread_jitter_spin.setRange(0, 90)
+        self.spread_jitter_spin.setValue(30)
+        self.spread_jitter_spin.setSuffix(" %")
+        self.spread_jitter_spin.setToolTip("Her gönderim, aralığın bu oranına kadar rastgele geciktirilir")
+        plan_layout.addWidget(self.spread_jitter_spin, 1, 3)
+        
+        self.plan_summary_label = QLabel("Planlı iş yok")
+        self.plan_summary_label.setStyleSheet("font-size: 11px; color: #666;")
+        plan_layout.addWidget(self.plan_summary_label, 2, 0, 1, 4)
+        
+        self.plan_table = QTableWidget()
+        self.plan_table.setColumnCount(4)
+        self.plan_table.setHorizontalHeaderLabels(["📅 Gün", "⏰ Saat Aralığı", "📧 Adet", "⏱️ Aralık"])
+        self.plan_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.plan_table.horizontalHeader().setStretchLastSection(True)
+        self.plan_table.setMaximumHeight(140)
+        self.plan_table.setStyleSheet("font-size: 11px;")
+        plan_layout.addWidget(self.plan_table, 3, 0, 1, 4)
+        
+        layout.addWidget(plan_group)
+        
         # Zamanlama listesi grubu
         schedule_list_group = QGroupBox("📅 Aktif Zamanlamalar")
         schedule_list_group.setStyleSheet("""
@@ -2112,6 +2433,7 @@ class MainWindow(QMainWindow):
         self.schedule_list.setColumnWidth(4, 120)  # Durum
         self.schedule_list.setColumnWidth(5, 80)   # İşlem
         
+        self.schedule_list.itemSelectionChanged.connect(self.show_selected_plan)
         schedule_list_layout.addWidget(self.schedule_list)
         
         # Sil butonu ekle
@@ -2694,111 +3016,24 @@ class MainWindow(QMainWindow):
         return widget
         
     def add_vcard_signature(self, email_body, attachments=None):
-        """E-posta gövdesine kartvizit imzası ve görsel ön izlemeleri ekler"""
-        if not self.vcard_enabled_check.isChecked():
-            return email_body
-            
-        # Mesaj içeriğini yüksek kontrastlı ve tema-dostu HTML'e çevir
-        if not email_body.strip().startswith('<'):
-            # Düz metni HTML'e çevir
-            email_body = email_body.replace('\n', '<br>')
-            email_body = f'''
-            <table role="presentation" width="100%" cellpadding="0" cellspacing="0" border="0" bgcolor="#ffffff" style="background-color:#ffffff;">
-              <tr>
-                <td align="left" style="font-family: 'Segoe UI', Arial, sans-serif; font-size:15px; line-height:1.7; color:#111827; margin:25px 0; padding:20px; border-radius:12px; box-shadow:0 2px 10px rgba(0,0,0,0.06); border-left:4px solid #2563eb;">
-                  {email_body}
-                </td>
-              </tr>
-            </table>
-            '''
-        
-        # Görsel ön izlemelerini ekle (en üstte, sola hizalı)
-        image_preview_html = ""
-        if attachments:
-            image_counter = 1
-            for file_path in attachments:
-                if os.path.exists(file_path):
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    if file_ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-                        image_preview_html += f"""
-                        <table width="400" style="margin: 10px 0; border-collapse: collapse;">
-                        <tr>
-                            <td style="text-align: left; padding: 5px;">
-                                <img src="cid:image{image_counter}" width="400" height="300" style="width: 400px; height: 300px; border-radius: 6px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);" alt="Görsel Ön İzleme" />
-                            </td>
-                        </tr>
-                    </table>
-                        """
-                        image_counter += 1
-        
-        # Kartvizit görselini HTML içinde referans ver (sadece HTML imza yoksa)
-        # Kartvizit görselini tablo yapısında tut - Outlook uyumlu
-        vcard_html = f"""
-        <br><br>
-        <table width="300" style="margin: 15px 0; border-collapse: collapse; background-color: #ffffff; border: 1px solid #e5e7eb; border-radius: 5px;">
-            <tr>
-                <td style="padding: 10px; text-align: left;">
-                    <img src="cid:kartvizit" width="150" height="100" style="width: 150px; height: 100px; border-radius: 4px; float: left; margin-right: 10px;" alt="Kartvizit" />
-                    <div style="font-family: Arial, sans-serif; font-size: 12px; color: #374151; margin-left: 160px;">
-                        Kartvizit Bilgileri
-                    </div>
-                </td>
-            </tr>
-        </table>
-        """
-        
-        # Profesyonel imza HTML'i ekle
-        signature_html = ""
-        if hasattr(self, 'vcard_signature_enabled') and self.vcard_signature_enabled.isChecked():
-            name = self.signature_name_edit.text().strip()
-            phone = self.signature_phone_edit.text().strip()
-            mobile = self.signature_mobile_edit.text().strip()
-            email = self.signature_email_edit.text().strip()
-            web = self.signature_web_edit.text().strip()
-            address = self.signature_address_edit.text().strip()
-            services = self.signature_services_edit.text().strip()
-            
-            # Sadece dolu olan alanları HTML'e ekle
-            signature_parts = []
-            
-            if name:
-                signature_parts.append(f'<div style="font-weight: 600; font-size: 16px; color: #111827; margin-bottom: 4px;">{name}</div>')
-            
-            if phone:
-                signature_parts.append(f'<div style="color: #374151; margin: 2px 0; font-size: 13px;">☎️ {phone}</div>')
-            
-            if mobile:
-                signature_parts.append(f'<div style="color: #374151; margin: 2px 0; font-size: 13px;">📱 {mobile}</div>')
-            
-            if email:
-                signature_parts.append(f'<div style="color: #374151; margin: 2px 0; font-size: 13px;">✉️ {email}</div>')
-            
-            if web:
-                signature_parts.append(f'<div style="color: #374151; margin: 2px 0; font-size: 13px;">🌐 {web}</div>')
-            
-            if address:
-                signature_parts.append(f'<div style="color: #6B7280; font-size: 12px; font-style: italic; margin: 4px 0 2px 0;">📍 {address}</div>')
-            
-            if services:
-                signature_parts.append(f'<div style="color: #9CA3AF; font-size: 11px; font-style: italic; margin: 2px 0;">💼 {services}</div>')
-            
-            # Eğer en az bir alan doluysa HTML oluştur
-            if signature_parts:
-                signature_html = f'''
-                <table role="presentation" width="100%" cellpadding="0" cellspacing="0" border="0" bgcolor="#ffffff" style="background-color:#ffffff; margin-top:25px;">
-                  <tr>
-                    <td align="left" style="font-family: 'Segoe UI', Arial, sans-serif; font-size:14px; color:#374151; padding:15px; border-left:4px solid #e74c3c; border-radius:10px; box-shadow:0 2px 8px rgba(0,0,0,0.06);">
-                      {('<br>'.join(signature_parts))}
-                    </td>
-                  </tr>
-                </table>
-                '''
+        """E-posta gövdesine kartvizit imzası ve görsel ön izlemeleri ekler (önbellekli)"""
+        return self.signature_renderer.render(email_body, attachments)
 
-        # HTML imza varsa kartvizit görselini gösterme
-        if signature_html:
-            vcard_html = ""
-        
-        return image_preview_html + email_body + signature_html + vcard_html
+    def sync_signature_renderer(self, *args):
+        """İmza alanlarından biri değiştiğinde imza önbelleğini güncelle"""
+        self.signature_renderer.update(
+            {
+                'name': self.signature_name_edit.text(),
+                'phone': self.signature_phone_edit.text(),
+                'mobile': self.signature_mobile_edit.text(),
+                'email': self.signature_email_edit.text(),
+                'web': self.signature_web_edit.text(),
+                'address': self.signature_address_edit.text(),
+                'services': self.signature_services_edit.text(),
+            },
+            vcard_enabled=self.vcard_enabled_check.isChecked(),
+            signature_enabled=self.vcard_signature_enabled.isChecked(),
+        )
 
     def on_vcard_image_changed(self, selected_text):
         """Kartvizit görsel seçimi değiştiğinde çalışır"""
@@ -2991,6 +3226,23 @@ class MainWindow(QMainWindow):
 
                 # Kartvizit ayarları eklendi
                 self.vcard_enabled_check.setChecked(s.get("vcard_enabled", False))
+                self.attach_image_originals_check.setChecked(s.get("attach_image_originals", True))
+                # Büyük ek paylaşımı ayarları
+                self.offload_enabled_check.setChecked(s.get("offload_enabled", False))
+                self.offload_threshold_spin.setValue(int(s.get("offload_threshold_mb", 5)))
+                self.offload_base_url_edit.setText(s.get("offload_base_url", ""))
+                self.offload_port_spin.setValue(int(s.get("offload_port", 8090)))
+                # Takip ayarları
+                self.tracking_enabled_check.setChecked(s.get("tracking_enabled", False))
+                self.tracking_base_url_edit.setText(s.get("tracking_base_url", ""))
+                self.tracking_embedded_check.setChecked(s.get("tracking_embedded", True))
+                self.tracking_clicks_check.setChecked(s.get("tracking_clicks", True))
+                # Geri dönüş işleme ayarları
+                self.bounce_enabled_check.setChecked(s.get("bounce_enabled", False))
+                self.imap_server_edit.setText(s.get("imap_server", ""))
+                self.imap_port_edit.setText(str(s.get("imap_port", "993")))
+                self.bounce_interval_spin.setValue(int(s.get("bounce_interval_minutes", 15)))
+                self.tracking_port_spin.setValue(int(s.get("tracking_port", 8080)))
                 vcard_image_path = s.get("vcard_image_path", "")
                 if vcard_image_path and os.path.exists(vcard_image_path):
                     self.vcard_image_path_edit.setText(vcard_image_path)
@@ -3052,6 +3304,20 @@ class MainWindow(QMainWindow):
                 self.sender_password_edit.setText("")
                 # Kartvizit ayarları varsayılan değerler
                 self.vcard_enabled_check.setChecked(False)
+                self.attach_image_originals_check.setChecked(True)
+                self.offload_enabled_check.setChecked(False)
+                self.offload_threshold_spin.setValue(5)
+                self.offload_base_url_edit.setText("")
+                self.offload_port_spin.setValue(8090)
+                self.tracking_enabled_check.setChecked(False)
+                self.tracking_base_url_edit.setText("")
+                self.tracking_embedded_check.setChecked(True)
+                self.tracking_clicks_check.setChecked(True)
+                self.bounce_enabled_check.setChecked(False)
+                self.imap_server_edit.setText("")
+                self.imap_port_edit.setText("993")
+                self.bounce_interval_spin.setValue(15)
+                self.tracking_port_spin.setValue(8080)
                 self.vcard_image_combo.setCurrentText("Kartvizit Yok")
                 self.vcard_image_path_edit.setText("")
                 self.vcard_image_path_edit.setPlaceholderText("Kartvizit görseli seçilmedi")
@@ -3067,9 +3333,6 @@ class MainWindow(QMainWindow):
                 
             self.logger.info("Yapılandırma dosyası yüklendi")
             
-            # Gönderim istatistiklerini yükle
-            self.load_sending_stats()
-            
             # Sonraki zamanlama etiketini güncelle
             self.update_next_schedule_label()
                 
@@ -3104,6 +3367,23 @@ class MainWindow(QMainWindow):
                 # Kartvizit ayarları
                 "vcard_enabled": self.vcard_enabled_check.isChecked(),
                 "vcard_image_path": self.vcard_image_path_edit.text(),
+                "attach_image_originals": self.attach_image_originals_check.isChecked(),
+                # Büyük ek paylaşımı ayarları
+                "offload_enabled": self.offload_enabled_check.isChecked(),
+                "offload_threshold_mb": self.offload_threshold_spin.value(),
+                "offload_base_url": self.offload_base_url_edit.text().strip(),
+                "offload_port": self.offload_port_spin.value(),
+                # Takip ayarları
+                "tracking_enabled": self.tracking_enabled_check.isChecked(),
+                "tracking_base_url": self.tracking_base_url_edit.text().strip(),
+                "tracking_embedded": self.tracking_embedded_check.isChecked(),
+                "tracking_clicks": self.tracking_clicks_check.isChecked(),
+                # Geri dönüş işleme ayarları
+                "bounce_enabled": self.bounce_enabled_check.isChecked(),
+                "imap_server": self.imap_server_edit.text().strip(),
+                "imap_port": self.imap_port_edit.text().strip(),
+                "bounce_interval_minutes": self.bounce_interval_spin.value(),
+                "tracking_port": self.tracking_port_spin.value(),
                 # BCC ayarları
                 "bcc_enabled": self.bcc_checkbox.isChecked(),
                 # E-posta delay ayarı
@@ -3169,45 +3449,11 @@ class MainWindow(QMainWindow):
         finally:
             self.progress_bar.setVisible(False)
             
-    def update_sending_counters(self, sent_count):
-        """Gönderim sayaçlarını güncelle - İyileştirilmiş versiyon"""
-        try:
-            current_time = datetime.now()
-            
-            # 1. SAATLIK SAYAÇ KONTROLÜ - Daha kesin zamanlı
-            current_hour = current_time.replace(minute=0, second=0, microsecond=0)
-            if current_time >= self.last_hourly_reset + timedelta(hours=1):
-                self.hourly_sent_count = 0
-                self.last_hourly_reset = current_hour
-                self.logger.info(f"Saatlik gönderim sayacı sıfırlandı - Yeni saat: {current_hour}")
-            
-            # 2. GÜNLÜK SAYAÇ KONTROLÜ - Daha kesin zamanlı
-            current_day = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            if current_time >= self.last_daily_reset + timedelta(days=1):
-                self.daily_sent_count = 0
-                self.last_daily_reset = current_day
-                self.logger.info(f"Günlük gönderim sayacı sıfırlandı - Yeni gün: {current_day}")
-            
-            # 3. SAYAÇLARI GÜNCELLE
-            self.hourly_sent_count += sent_count
-            self.daily_sent_count += sent_count
-            
-            # 4. İSTATİSTİKLERİ GÜNCELLE
-            self.update_sending_stats_display()
-            
-            # 5. DETAYLI LOG KAYDI
-            self.logger.info(f"Gönderim sayaçları güncellendi - Gönderilen: {sent_count}, Saatlik: {self.hourly_sent_count}, Günlük: {self.daily_sent_count}")
-            
-            # 6. İSTATİSTİKLERİ KAYDET
-            self.save_sending_stats()
-            
-        except Exception as e:
-            self.logger.error(f"Gönderim sayaçları güncellenirken hata: {e}")
-            # Hata durumunda bile istatistikleri kaydetmeye çalış
-            try:
-                self.save_sending_stats()
-            except:
-                pass
+    def apply_limit_settings(self, *args):
+        """Arayüzdeki limit ayarlarını ortak gönderim sayaçlarına (SendingLimiter) aktar"""
+        self.limiter.hourly_limit = self.hourly_limit_spin.value()
+        self.limiter.daily_limit = self.daily_limit_spin.value()
+        self.limiter.enabled = self.limit_check.isChecked()
             
     def update_sending_stats_display(self):
         """Gönderim istatistiklerini ekranda güncelle - İyileştirilmiş versiyon"""
@@ -3220,31 +3466,32 @@ class MainWindow(QMainWindow):
                 self.logger.warning(f"İstatistik widget'ları henüz oluşturulmamış: {missing_widgets}")
                 return
             
-            # 2. LİMİTLERİ AL
+            # 2. LİMİTLERİ VE SAYAÇLARI AL
             hourly_limit = self.hourly_limit_spin.value()
             daily_limit = self.daily_limit_spin.value()
+            hourly_sent = self.limiter.hourly_sent_count
+            daily_sent = self.limiter.daily_sent_count
             
             # 3. RENK KODLARINI BELİRLE
-            hourly_color = "#4CAF50" if self.hourly_sent_count < hourly_limit else "#F44336"
-            daily_color = "#2196F3" if self.daily_sent_count < daily_limit else "#F44336"
+            hourly_color = "#4CAF50" if hourly_sent < hourly_limit else "#F44336"
+            daily_color = "#2196F3" if daily_sent < daily_limit else "#F44336"
             
             # 4. ETİKETLERİ GÜNCELLE
-            self.hourly_sent_label.setText(f"{self.hourly_sent_count}/{hourly_limit} e-posta")
+            self.hourly_sent_label.setText(f"{hourly_sent}/{hourly_limit} e-posta")
             self.hourly_sent_label.setStyleSheet(f"color: {hourly_color}; font-weight: bold; font-size: 11px;")
             
-            self.daily_sent_label.setText(f"{self.daily_sent_count}/{daily_limit} e-posta")
+            self.daily_sent_label.setText(f"{daily_sent}/{daily_limit} e-posta")
             self.daily_sent_label.setStyleSheet(f"color: {daily_color}; font-weight: bold; font-size: 11px;")
             
             # 5. EMAIL STATS LABEL'INI GÜNCELLE
             if hasattr(self, 'email_stats_label') and self.email_stats_label:
-                total_sent = self.hourly_sent_count + self.daily_sent_count
-                stats_text = f"📊 E-posta İstatistikleri: Saatlik {self.hourly_sent_count}/{hourly_limit}, Günlük {self.daily_sent_count}/{daily_limit}"
+                stats_text = f"📊 E-posta İstatistikleri: Saatlik {hourly_sent}/{hourly_limit}, Günlük {daily_sent}/{daily_limit}"
                 self.email_stats_label.setText(stats_text)
                 
                 # Renk kodunu belirle
-                if self.hourly_sent_count >= hourly_limit or self.daily_sent_count >= daily_limit:
+                if hourly_sent >= hourly_limit or daily_sent >= daily_limit:
                     stats_color = "#F44336"  # Kırmızı - limit aşıldı
-                elif self.hourly_sent_count >= hourly_limit * 0.8 or self.daily_sent_count >= daily_limit * 0.8:
+                elif hourly_sent >= hourly_limit * 0.8 or daily_sent >= daily_limit * 0.8:
                     stats_color = "#FF9800"  # Turuncu - limit yaklaşıyor
                 else:
                     stats_color = "#4CAF50"  # Yeşil - normal
@@ -3260,143 +3507,20 @@ class MainWindow(QMainWindow):
                         border: 1px solid #C8E6C9;
                     }}
                 """)
-            
-            # 6. DETAYLI LOG KAYDI
-            self.logger.info(f"İstatistik güncellendi - Saatlik: {self.hourly_sent_count}/{hourly_limit}, Günlük: {self.daily_sent_count}/{daily_limit}")
-            
-            # 7. OTOMATİK KAYIT
-            self.save_sending_stats()
                 
         except Exception as e:
             self.logger.error(f"Gönderim istatistikleri güncellenirken hata: {e}")
-            # Hata durumunda bile kaydetmeye çalış
-            try:
-                self.save_sending_stats()
-            except:
-                pass
             
     def refresh_sending_stats(self):
-        """Gönderim istatistiklerini yenile - İyileştirilmiş versiyon"""
+        """Gönderim istatistiklerini yenile - sayaçlar servisle ortak, diskten okunur"""
         try:
-            current_time = datetime.now()
-            
-            # 1. SAATLIK SAYAÇ KONTROLÜ - Daha kesin zamanlı
-            current_hour = current_time.replace(minute=0, second=0, microsecond=0)
-            if current_time >= self.last_hourly_reset + timedelta(hours=1):
-                self.hourly_sent_count = 0
-                self.last_hourly_reset = current_hour
-                self.logger.info(f"Saatlik gönderim sayacı sıfırlandı - Yeni saat: {current_hour}")
-            
-            # 2. GÜNLÜK SAYAÇ KONTROLÜ - Daha kesin zamanlı
-            current_day = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            if current_time >= self.last_daily_reset + timedelta(days=1):
-                self.daily_sent_count = 0
-                self.last_daily_reset = current_day
-                self.logger.info(f"Günlük gönderim sayacı sıfırlandı - Yeni gün: {current_day}")
-            
-            # 3. İSTATİSTİKLERİ GÜNCELLE
+            # Süresi dolan sayaçlar okunurken sıfırlanır; diğer sürecin gönderimleri de sayılır
+            self.limiter.load()
             self.update_sending_stats_display()
             
-            # 4. İSTATİSTİKLERİ KAYDET
-            self.save_sending_stats()
-            
-            # 5. DETAYLI LOG KAYDI
-            self.logger.info(f"Gönderim istatistikleri yenilendi - Saatlik: {self.hourly_sent_count}, Günlük: {self.daily_sent_count}")
-            
         except Exception as e:
             self.logger.error(f"Gönderim istatistikleri yenilenirken hata: {e}")
-            # Hata durumunda bile kaydetmeye çalış
-            try:
-                self.save_sending_stats()
-            except:
-                pass
             QMessageBox.critical(self, "Hata", f"İstatistikler yenilenemedi: {e}")
-            
-    def save_sending_stats(self):
-        """Gönderim istatistiklerini kaydet - İyileştirilmiş versiyon"""
-        try:
-            # 1. VERİ DOĞRULAMA
-            if not hasattr(self, 'hourly_sent_count') or not hasattr(self, 'daily_sent_count'):
-                self.logger.error("Gönderim sayaçları tanımlanmamış")
-                return
-            
-            # 2. İSTATİSTİK VERİLERİNİ HAZIRLA
-            stats = {
-                "hourly_sent_count": max(0, self.hourly_sent_count),  # Negatif değerleri engelle
-                "daily_sent_count": max(0, self.daily_sent_count),     # Negatif değerleri engelle
-                "last_hourly_reset": self.last_hourly_reset.isoformat(),
-                "last_daily_reset": self.last_daily_reset.isoformat(),
-                "last_save_time": datetime.now().isoformat()  # Son kayıt zamanı
-            }
-            
-            # 3. KONFİGÜRASYONU YÜKLE VE GÜNCELLE
-            config = self.config_manager.load_config()
-            config["sending_stats"] = stats
-            self.config_manager.save_config(config)
-            
-            # 4. BAŞARI LOGU
-            self.logger.info(f"Gönderim istatistikleri kaydedildi - Saatlik: {self.hourly_sent_count}, Günlük: {self.daily_sent_count}")
-            
-        except Exception as e:
-            self.logger.error(f"Gönderim istatistikleri kaydedilirken hata: {e}")
-            # Kritik hata durumunda kullanıcıya bildir
-            try:
-                QMessageBox.warning(self, "Uyarı", "İstatistikler kaydedilemedi. Veriler geçici olarak kaybolabilir.")
-            except:
-                pass
-
-    def load_sending_stats(self):
-        """Gönderim istatistiklerini yükle - İyileştirilmiş versiyon"""
-        try:
-            # 1. KONFİGÜRASYONU YÜKLE
-            config = self.config_manager.load_config()
-            if "sending_stats" not in config:
-                self.logger.info("Kayıtlı istatistik bulunamadı, varsayılan değerler kullanılıyor")
-                self._initialize_default_stats()
-                return
-            
-            stats = config["sending_stats"]
-            
-            # 2. VERİ DOĞRULAMA
-            required_fields = ["hourly_sent_count", "daily_sent_count", "last_hourly_reset", "last_daily_reset"]
-            missing_fields = [field for field in required_fields if field not in stats]
-            
-            if missing_fields:
-                self.logger.warning(f"Eksik istatistik alanları: {missing_fields}, varsayılan değerler kullanılıyor")
-                self._initialize_default_stats()
-                return
-            
-            # 3. SAYAÇLARI YÜKLE
-            self.hourly_sent_count = max(0, stats.get("hourly_sent_count", 0))
-            self.daily_sent_count = max(0, stats.get("daily_sent_count", 0))
-            
-            # 4. TARİHLERİ YÜKLE
-            try:
-                self.last_hourly_reset = datetime.fromisoformat(stats.get("last_hourly_reset", ""))
-                self.last_daily_reset = datetime.fromisoformat(stats.get("last_daily_reset", ""))
-            except (ValueError, TypeError) as e:
-                self.logger.warning(f"Tarih formatı hatası: {e}, varsayılan tarihler kullanılıyor")
-                self.last_hourly_reset = datetime.now()
-                self.last_daily_reset = datetime.now()
-            
-            # 5. BAŞARI LOGU
-            self.logger.info(f"İstatistikler yüklendi - Saatlik: {self.hourly_sent_count}, Günlük: {self.daily_sent_count}")
-            
-        except Exception as e:
-            self.logger.error(f"İstatistikler yüklenirken hata: {e}")
-            self._initialize_default_stats()
-    
-    def _initialize_default_stats(self):
-        """Varsayılan istatistik değerlerini başlat"""
-        try:
-            current_time = datetime.now()
-            self.hourly_sent_count = 0
-            self.daily_sent_count = 0
-            self.last_hourly_reset = current_time.replace(minute=0, second=0, microsecond=0)
-            self.last_daily_reset = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            self.logger.info("Varsayılan istatistik değerleri başlatıldı")
-        except Exception as e:
-            self.logger.error(f"Varsayılan istatistik başlatılırken hata: {e}")
 
     def check_sending_limits(self):
         """Gönderim limitlerini kontrol et"""
@@ -3413,8 +3537,8 @@ class MainWindow(QMainWindow):
             daily_limit = self.daily_limit_spin.value()
             
             # Saatlik limit kontrolü
-            if self.hourly_sent_count >= hourly_limit:
-                next_hourly_reset = self.last_hourly_reset + timedelta(hours=1)
+            if self.limiter.hourly_sent_count >= hourly_limit:
+                next_hourly_reset = self.limiter.last_hourly_reset + timedelta(hours=1)
                 remaining_time = next_hourly_reset - datetime.now()
                 hours = int(remaining_time.total_seconds() // 3600)
                 minutes = int((remaining_time.total_seconds() % 3600) // 60)
@@ -3422,43 +3546,29 @@ class MainWindow(QMainWindow):
                 return False, f"Saatlik limit ({hourly_limit}) doldu! {hours} saat {minutes} dakika sonra tekrar deneyin."
             
             # Günlük limit kontrolü
-            if self.daily_sent_count >= daily_limit:
-                next_daily_reset = self.last_daily_reset + timedelta(days=1)
+            if self.limiter.daily_sent_count >= daily_limit:
+                next_daily_reset = self.limiter.last_daily_reset + timedelta(days=1)
                 remaining_time = next_daily_reset - datetime.now()
                 hours = int(remaining_time.total_seconds() // 3600)
                 minutes = int((remaining_time.total_seconds() % 3600) // 60)
                 
                 return False, f"Günlük limit ({daily_limit}) doldu! {hours} saat {minutes} dakika sonra tekrar deneyin."
             
-            return True, f"Limit kontrolü geçti - Saatlik: {self.hourly_sent_count}/{hourly_limit}, Günlük: {self.daily_sent_count}/{daily_limit}"
+            return True, f"Limit kontrolü geçti - Saatlik: {self.limiter.hourly_sent_count}/{hourly_limit}, Günlük: {self.limiter.daily_sent_count}/{daily_limit}"
             
         except Exception as e:
             self.logger.error(f"Limit kontrolü sırasında hata: {e}")
             return False, f"Limit kontrolü hatası: {e}"
 
     def calculate_safe_sending_count(self, total_recipients):
-        """Güvenli gönderim sayısını hesapla"""
+        """Güvenli gönderim sayısını hesapla (ön izleme - kapasite gönderimden hemen önce
+        SendingLimiter.reserve ile ayrılır)"""
         try:
             # Limit kontrolü
             can_send, message = self.check_sending_limits()
             if not can_send:
                 return 0, message
-            
-            # Limitleri al
-            hourly_limit = self.hourly_limit_spin.value()
-            daily_limit = self.daily_limit_spin.value()
-            
-            # Kalan gönderim kapasitesini hesapla
-            remaining_hourly = hourly_limit - self.hourly_sent_count
-            remaining_daily = daily_limit - self.daily_sent_count
-            
-            # En düşük limiti seç
-            safe_count = min(remaining_hourly, remaining_daily, total_recipients)
-            
-            if safe_count <= 0:
-                return 0, "Gönderim limiti doldu!"
-            
-            return safe_count, f"Güvenli gönderim sayısı: {safe_count}/{total_recipients}"
+            return self.limiter.safe_count(total_recipients)
             
         except Exception as e:
             self.logger.error(f"Güvenli gönderim sayısı hesaplanırken hata: {e}")
@@ -3478,30 +3588,30 @@ class MainWindow(QMainWindow):
             current_time = datetime.now()
             
             # Saatlik limit için kalan süre
-            next_hourly_reset = self.last_hourly_reset + timedelta(hours=1)
+            next_hourly_reset = self.limiter.last_hourly_reset + timedelta(hours=1)
             hourly_remaining = next_hourly_reset - current_time
             hourly_hours = int(hourly_remaining.total_seconds() // 3600)
             hourly_minutes = int((hourly_remaining.total_seconds() % 3600) // 60)
             
             # Günlük limit için kalan süre
-            next_daily_reset = self.last_daily_reset + timedelta(days=1)
+            next_daily_reset = self.limiter.last_daily_reset + timedelta(days=1)
             daily_remaining = next_daily_reset - current_time
             daily_hours = int(daily_remaining.total_seconds() // 3600)
             daily_minutes = int((daily_remaining.total_seconds() % 3600) // 60)
             
             # Durum mesajı
             status_message = f"GÖNDERİM LİMİT DURUMU\n\n"
-            status_message += f"Saatlik Limit: {self.hourly_sent_count}/{hourly_limit}\n"
+            status_message += f"Saatlik Limit: {self.limiter.hourly_sent_count}/{hourly_limit}\n"
             status_message += f"Kalan Saatlik Süre: {hourly_hours} saat {hourly_minutes} dakika\n\n"
-            status_message += f"Günlük Limit: {self.daily_sent_count}/{daily_limit}\n"
+            status_message += f"Günlük Limit: {self.limiter.daily_sent_count}/{daily_limit}\n"
             status_message += f"Kalan Günlük Süre: {daily_hours} saat {daily_minutes} dakika\n\n"
             
             # Limit durumları
-            if self.hourly_sent_count >= hourly_limit:
+            if self.limiter.hourly_sent_count >= hourly_limit:
                 status_message += "⚠️ SAATLİK LİMİT DOLDU!\n"
-            if self.daily_sent_count >= daily_limit:
+            if self.limiter.daily_sent_count >= daily_limit:
                 status_message += "⚠️ GÜNLÜK LİMİT DOLDU!\n"
-            if self.hourly_sent_count < hourly_limit and self.daily_sent_count < daily_limit:
+            if self.limiter.hourly_sent_count < hourly_limit and self.limiter.daily_sent_count < daily_limit:
                 status_message += "✅ Limitler uygun, gönderim yapılabilir."
             
             QMessageBox.information(self, "Limit Durumu", status_message)
@@ -3511,18 +3621,18 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Hata", f"Limit durumu gösterilemedi: {e}")
 
     def add_scheduled_email_to_list(self, email_data):
-        """Zamanlanmış e-postayı listeye ekle"""
+        """Zamanlanmış e-postayı kalıcı zamanlayıcıya ekle"""
         try:
-            # Zamanlama verilerini sakla
-            self.scheduled_emails.append(email_data)
+            job_id = self.job_scheduler.add(email_data)
+            
+            # Tek zamanlayıcıyı en yakın işe göre yeniden kur
+            self.arm_scheduler_timer()
             
             # Tabloyu yenile
             self.refresh_schedule_list()
             
-            # Sonraki zamanlama etiketini güncelle
-            self.update_next_schedule_label()
-            
             self.logger.info(f"Zamanlanmış e-posta listeye eklendi: {email_data['subject']}")
+            return job_id
             
         except Exception as e:
             self.logger.error(f"Zamanlanmış e-posta listeye eklenirken hata: {e}")
@@ -3531,12 +3641,21 @@ class MainWindow(QMainWindow):
         """Zamanlama listesini yenile"""
         try:
             self.schedule_list.setRowCount(0)
+            jobs = self.job_scheduler.sorted_jobs()
+            # Tablo satırı -> iş id (iptal/silme için)
+            self.schedule_row_ids = [job['id'] for job in jobs]
+            current_time = QDateTime.currentDateTime()
             
-            for i, email_data in enumerate(self.scheduled_emails):
+            for i, email_data in enumerate(jobs):
                 self.schedule_list.insertRow(i)
                 
                 # Görev adı
-                task_name = f"E-posta Gönderimi #{i+1}"
+                if email_data.get('kind') == 'remaining':
+                    task_name = f"Kalan Gönderim #{i+1}"
+                elif email_data.get('recurrence'):
+                    task_name = describe_recurrence(email_data['recurrence'])
+                else:
+                    task_name = f"E-posta Gönderimi #{i+1}"
                 self.schedule_list.setItem(i, 0, QTableWidgetItem(task_name))
                 
                 # Konu
@@ -3546,51 +3665,34 @@ class MainWindow(QMainWindow):
                 self.schedule_list.setItem(i, 1, QTableWidgetItem(subject))
                 
                 # Zamanlanan tarih
-                scheduled_datetime = email_data.get('datetime')
-                if scheduled_datetime:
-                    date_str = scheduled_datetime.toString('dd.MM.yyyy HH:mm')
-                else:
-                    date_str = "Belirtilmemiş"
-                self.schedule_list.setItem(i, 2, QTableWidgetItem(date_str))
+                scheduled_datetime = QDateTime.fromSecsSinceEpoch(int(email_data['due']))
+                self.schedule_list.setItem(i, 2, QTableWidgetItem(scheduled_datetime.toString('dd.MM.yyyy HH:mm')))
                 
-                # Alıcı sayısı
-                recipients = email_data.get('recipients', [])
-                recipient_count = len(recipients)
+                # Alıcı sayısı (henüz gönderilmemiş olanlar)
+                recipient_count = len(remaining_recipients(email_data))
                 self.schedule_list.setItem(i, 3, QTableWidgetItem(str(recipient_count)))
                 
-                # Durum - Gerçek gönderim durumunu kontrol et
-                current_time = QDateTime.currentDateTime()
+                # Durum
                 status_item = QTableWidgetItem()
                 status_item.setTextAlignment(Qt.AlignCenter)
                 
-                if scheduled_datetime:
-                    if current_time >= scheduled_datetime:
-                        # Zamanı geçmiş ama gönderilip gönderilmediğini kontrol et
-                        if email_data.get('sent', False):
-                            status = "✅ Tamamlandı"
-                            status_item.setBackground(QColor("#E8F5E9"))  # Yeşil arka plan
-                            status_item.setForeground(QColor("#2E7D32"))  # Koyu yeşil yazı
-                        else:
-                            status = "⏳ Gönderiliyor..."
-                            status_item.setBackground(QColor("#E3F2FD"))  # Mavi arka plan
-                            status_item.setForeground(QColor("#1565C0"))  # Koyu mavi yazı
-                    else:
-                        time_diff = current_time.msecsTo(scheduled_datetime)
-                        hours = time_diff // 3600000
-                        minutes = (time_diff % 3600000) // 60000
-                        status = f"⏰ {hours}s {minutes}d kaldı"
-                        status_item.setBackground(QColor("#FFF3E0"))  # Turuncu arka plan
-                        status_item.setForeground(QColor("#E65100"))  # Koyu turuncu yazı
+                if current_time >= scheduled_datetime:
+                    status = "⏳ Gönderiliyor..."
+                    status_item.setBackground(QColor("#E3F2FD"))  # Mavi arka plan
+                    status_item.setForeground(QColor("#1565C0"))  # Koyu mavi yazı
                 else:
-                    status = "❓ Belirsiz"
-                    status_item.setBackground(QColor("#FFEBEE"))  # Kırmızı arka plan
-                    status_item.setForeground(QColor("#C62828"))  # Koyu kırmızı yazı
+                    time_diff = current_time.msecsTo(scheduled_datetime)
+                    hours = time_diff // 3600000
+                    minutes = (time_diff % 3600000) // 60000
+                    status = f"⏰ {hours}s {minutes}d kaldı"
+                    status_item.setBackground(QColor("#FFF3E0"))  # Turuncu arka plan
+                    status_item.setForeground(QColor("#E65100"))  # Koyu turuncu yazı
                 
                 status_item.setText(status)
                 self.schedule_list.setItem(i, 4, status_item)
                 
                 # İşlem butonu
-                if scheduled_datetime and current_time < scheduled_datetime:
+                if current_time < scheduled_datetime:
                     cancel_btn = QPushButton("İptal Et")
                     cancel_btn.setFixedSize(60, 25)
                     cancel_btn.setStyleSheet("background-color: #F44336; color: white; font-size: 9px; border: none; border-radius: 2px;")
@@ -3607,41 +3709,70 @@ class MainWindow(QMainWindow):
             self.schedule_list.setColumnWidth(4, 120)  # Durum
             self.schedule_list.setColumnWidth(5, 80)   # İşlem
             
-            self.logger.info(f"Zamanlama listesi yenilendi: {len(self.scheduled_emails)} zamanlama")
-            
             # Sonraki zamanlama etiketini güncelle
             self.update_next_schedule_label()
+            self.show_selected_plan()
             
         except Exception as e:
             self.logger.error(f"Zamanlama listesi yenilenirken hata: {e}")
 
+    def show_selected_plan(self):
+        """Seçili (seçim yoksa en yakın planlı) işin kalan gönderim planını göster"""
+        try:
+            row = self.schedule_list.currentRow()
+            if 0 <= row < len(self.schedule_row_ids):
+                job = self.job_scheduler.get(self.schedule_row_ids[row])
+            else:
+                job = next((job for job in self.job_scheduler.sorted_jobs() if job.get('plan')), None)
+            
+            self.plan_table.setRowCount(0)
+            plan = job.get('plan') if job else None
+            if not plan:
+                self.plan_summary_label.setText("Seçili iş için gönderim planı yok (arka arkaya gönderilir)")
+                return
+            
+            days, _, finish = describe_plan(plan)
+            slot = slot_time(plan, plan['index'])
+            next_text = QDateTime.fromSecsSinceEpoch(int(slot[0])).toString('dd.MM.yyyy HH:mm') if slot else "-"
+            finish_text = QDateTime.fromSecsSinceEpoch(int(finish)).toString('dd.MM.yyyy HH:mm') if finish else "-"
+            self.plan_summary_label.setText(
+                f"{job.get('subject', '')[:30]}: {plan['index']} gönderildi, {days} gün - "
+                f"sonraki: {next_text}, tahmini bitiş: {finish_text}")
+            
+            # Yalnızca henüz tamamlanmamış günler gösterilir
+            done = plan['index']
+            for window in plan['windows']:
+                if done >= window['count']:
+                    done -= window['count']
+                    continue
+                i = self.plan_table.rowCount()
+                self.plan_table.insertRow(i)
+                start = QDateTime.fromSecsSinceEpoch(int(window['start']))
+                end = QDateTime.fromSecsSinceEpoch(int(window['end']))
+                interval = (window['end'] - window['start']) / window['count']
+                self.plan_table.setItem(i, 0, QTableWidgetItem(start.toString('dd.MM.yyyy ddd')))
+                self.plan_table.setItem(i, 1, QTableWidgetItem(f"{start.toString('HH:mm')} - {end.toString('HH:mm')}"))
+                self.plan_table.setItem(i, 2, QTableWidgetItem(f"{window['count'] - done}/{window['count']}"))
+                self.plan_table.setItem(i, 3, QTableWidgetItem(f"~{interval / 60:.1f} dk"))
+                done = 0
+        except Exception as e:
+            self.logger.error(f"Gönderim planı gösterilirken hata: {e}")
+    
     def update_next_schedule_label(self):
-        """Sonraki zamanlama etiketini güncelle"""
+        """Sonraki zamanlama etiketini güncelle (heap'in başındaki iş - tarama yok)"""
         try:
             if not hasattr(self, 'next_schedule_label'):
                 return
-                
-            current_time = QDateTime.currentDateTime()
-            next_schedule = None
-            min_time_diff = float('inf')
-            
-            # En yakın zamanlamayı bul
-            for email_data in self.scheduled_emails:
-                scheduled_datetime = email_data.get('datetime')
-                if scheduled_datetime and current_time < scheduled_datetime:
-                    # Henüz gönderilmemiş ve gelecekte olan zamanlamalar
-                    if not email_data.get('sent', False):
-                        time_diff = current_time.msecsTo(scheduled_datetime)
-                        if time_diff < min_time_diff:
-                            min_time_diff = time_diff
-                            next_schedule = email_data
+            
+            next_schedule = self.job_scheduler.peek()
             
             if next_schedule:
-                scheduled_datetime = next_schedule['datetime']
+                current_time = QDateTime.currentDateTime()
+                scheduled_datetime = QDateTime.fromSecsSinceEpoch(int(next_schedule['due']))
                 subject = next_schedule.get('subject', 'Konu yok')
                 
                 # Kalan süreyi hesapla
-                time_diff = current_time.msecsTo(scheduled_datetime)
+                time_diff = max(0, current_time.msecsTo(scheduled_datetime))
                 hours = time_diff // 3600000
                 minutes = (time_diff % 3600000) // 60000
                 
@@ -3654,15 +3785,11 @@ class MainWindow(QMainWindow):
                 next_schedule_text = f"Sonraki Zamanlama: {scheduled_datetime.toString('dd.MM.yyyy HH:mm')} ({time_str} kaldı) - {subject}"
                 self.next_schedule_label.setText(next_schedule_text)
                 self.next_schedule_label.setStyleSheet("color: #2196F3; font-weight: bold;")
-                
-                self.logger.info(f"Sonraki zamanlama güncellendi: {subject} - {time_str} kaldı")
             else:
                 # Zamanlama yoksa
                 self.next_schedule_label.setText("Sonraki Zamanlama: Yok")
                 self.next_schedule_label.setStyleSheet("color: #666; font-weight: normal;")
                 
-                self.logger.info("Sonraki zamanlama bulunamadı")
-                
         except Exception as e:
             self.logger.error(f"Sonraki zamanlama etiketi güncellenirken hata: {e}")
             self.next_schedule_label.setText("Sonraki Zamanlama: Hata")
@@ -3672,8 +3799,9 @@ class MainWindow(QMainWindow):
         """Seçili zamanlamayı sil"""
         try:
             current_row = self.schedule_list.currentRow()
-            if current_row >= 0 and current_row < len(self.scheduled_emails):
-                email_data = self.scheduled_emails[current_row]
+            if 0 <= current_row < len(self.schedule_row_ids):
+                job_id = self.schedule_row_ids[current_row]
+                email_data = self.job_scheduler.jobs.get(job_id, {})
                 subject = email_data.get('subject', 'Bilinmeyen')
                 
                 reply = QMessageBox.question(self, "Zamanlama Sil", 
@@ -3681,21 +3809,14 @@ class MainWindow(QMainWindow):
                     QMessageBox.Yes | QMessageBox.No)
                 
                 if reply == QMessageBox.Yes:
-                    # Timer'ı durdur
-                    timer_id = f"email_{current_row}"
-                    if timer_id in self.email_timers:
-                        self.email_timers[timer_id].stop()
-                        del self.email_timers[timer_id]
-                    
-                    # Listeden kaldır
-                    del self.scheduled_emails[current_row]
+                    # Çalışıyorsa durdur, zamanlayıcıdan kaldır ve tek timer'ı yeniden kur
+                    self.stop_running_job(job_id)
+                    self.job_scheduler.cancel(job_id)
+                    self.arm_scheduler_timer()
                     
                     # Tabloyu yenile
                     self.refresh_schedule_list()
                     
-                    # Sonraki zamanlama etiketini güncelle
-                    self.update_next_schedule_label()
-                    
                     QMessageBox.information(self, "Başarılı", "Zamanlama silindi!")
                     self.logger.info(f"Zamanlama silindi: {subject}")
                     
@@ -3709,31 +3830,21 @@ class MainWindow(QMainWindow):
     def cancel_scheduled_email(self, row_index):
         """Seçili zamanlanmış e-postayı iptal et"""
         try:
-            if 0 <= row_index < len(self.scheduled_emails):
-                email_data = self.scheduled_emails[row_index]
-                
-                # Timer'ı durdur (güvenli kontrol)
-                timer_id = email_data.get('timer_id')
-                if timer_id and timer_id in self.email_timers:
-                    self.email_timers[timer_id].stop()
-                    del self.email_timers[timer_id]
-                
-                # Listeden kaldır
-                self.scheduled_emails.pop(row_index)
+            if 0 <= row_index < len(self.schedule_row_ids):
+                self.stop_running_job(self.schedule_row_ids[row_index])
+                email_data = self.job_scheduler.cancel(self.schedule_row_ids[row_index])
+                if email_data is None:
+                    return
+                self.arm_scheduler_timer()
                 
                 # Tabloyu güncelle
                 self.refresh_schedule_list()
                 
-                # Sonraki zamanlama etiketini güncelle
-                self.update_next_schedule_label()
-                
                 self.logger.info(f"Zamanlanmış e-posta iptal edildi: {email_data['subject']}")
                 QMessageBox.information(self, "Başarılı", "Zamanlanmış e-posta iptal edildi!")
                 
         except Exception as e:
             self.logger.error(f"Zamanlanmış e-posta iptal edilirken hata: {e}")
-            QMessageBox.critical(self, "Hata", f"E-posta iptal edilemedi: {e}")
-            
 
     def add_recipient(self):
         """Alıcı listesine yeni alıcı ekle"""
@@ -3741,12 +3852,23 @@ class MainWindow(QMainWindow):
         name = self.new_name_edit.text().strip()
         
         if email and name:
-            # Tabloya ekle
-            row = self.recipient_list.rowCount()
-            self.recipient_list.insertRow(row)
-            self.recipient_list.setItem(row, 0, QTableWidgetItem(email))
-            self.recipient_list.setItem(row, 1, QTableWidgetItem(name))
-            self.recipient_list.setItem(row, 2, QTableWidgetItem("Aktif"))
+            # Listeye ekle
+            result = self.email_validator.validate(email)
+            if not result['valid']:
+                QMessageBox.warning(self, "Uyarı", f"Geçersiz e-posta adresi: {result['reason']}")
+                return
+            if result['suggestion']:
+                reply = QMessageBox.question(self, "Yazım Hatası?",
+                    f"'{email}' yerine '{result['suggestion']}' mi demek istediniz?",
+                    QMessageBox.Yes | QMessageBox.No)
+                if reply == QMessageBox.Yes:
+                    email = result['suggestion']
+            if email in self.suppression_list:
+                QMessageBox.warning(self, "Uyarı", "Bu e-posta adresi engelleme listesinde!")
+                return
+            if not self.recipient_model.add_recipient(email, name):
+                QMessageBox.warning(self, "Uyarı", "Bu e-posta adresi geçersiz veya zaten listede!")
+                return
             
             # Formu temizle
             self.new_email_edit.clear()
@@ -3766,21 +3888,10 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            conn = self.database_manager.conn or self.database_manager.connect_from_ui(self)
-            cur = conn.cursor()
-            
-            # 1. EŞLEŞTİRME KONTROL ET
-            mapping = self.mapping_manager.get_mapping(tablo_adi)
-            
-            if mapping:
-                print(f"Manuel eşleştirme bulundu: {mapping}")
-                mapped_data, mapped_headers = self.get_filtered_data_with_mapping(
-                    tablo_adi, il, sektor, email_filter, mapping
-                )
-            else:
-                print("Manuel eşleştirme bulunamadı, eski yöntem kullanılıyor")
-                mapped_data = self.get_filtered_data_old_method(tablo_adi, il, sektor, email_filter)
-                mapped_headers = ["ID", "il", "Sektör", "Firma Adı", "Yetkili Adı Soyadı", "E-posta 1", "E-posta 2", "Web Sitesi"]
+            # 1. EŞLEŞTİRMELİ (veya eski yöntemle) SORGULA
+            mapped_data, mapped_headers = self.fetch_filtered_rows(tablo_adi, il, sektor, email_filter)
+            # Alıcı listesine ekleme tablo hücreleri yerine bu tampondan yapılır
+            self.filter_results = (mapped_data, mapped_headers)
             
             # 2. TABLOYA YERLEŞTİR
             self.filter_table.setRowCount(len(mapped_data))
@@ -3805,98 +3916,99 @@ class MainWindow(QMainWindow):
             print(f"Filtreleme hatası detayı: {e}")
 
     def add_filtered_results_to_recipients(self):
-        """Filtreleme sonuçlarını e-posta alıcı listesine ekle"""
+        """Filtreleme sonuçlarını e-posta alıcı listesine ekle (sonuç tamponundan, tablo hücrelerinden değil)"""
+        rows, headers = self.filter_results
+        if not rows:
+            QMessageBox.warning(self, "Uyarı", "Filtreleme sonucu bulunamadı!")
+            return
+        self.add_rows_to_recipients(rows, headers)
+
+    def add_all_matching_to_recipients(self):
+        """Mevcut filtreye uyan tüm kayıtları sonuç tablosunu doldurmadan alıcı listesine ekle"""
+        tablo_adi = self.filter_tablo_adi.currentText()
+        if not tablo_adi:
+            QMessageBox.warning(self, "Uyarı", "Lütfen bir tablo adı seçin!")
+            return
+        
         try:
-            # Filtreleme tablosundaki verileri al
-            row_count = self.filter_table.rowCount()
-            if row_count == 0:
-                QMessageBox.warning(self, "Uyarı", "Filtreleme sonucu bulunamadı!")
-                return
+            rows, headers = self.fetch_filtered_rows(
+                tablo_adi, self.filter_il.currentText(), self.filter_sektor.currentText(),
+                self.filter_email_checkbox.isChecked())
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Filtreleme hatası: {e}")
+            return
+        
+        if not rows:
+            QMessageBox.information(self, "Bilgi", "Seçilen kriterlere uygun kayıt bulunamadı.")
+            return
+        self.add_rows_to_recipients(rows, headers)
+
+    def fetch_filtered_rows(self, tablo_adi, il, sektor, email_filter):
+        """Filtre sorgusunu çalıştır ve (satırlar, başlıklar) döndür"""
+        if not self.database_manager.conn:
+            self.database_manager.connect_from_ui(self)
+        
+        # EŞLEŞTİRME KONTROL ET
+        mapping = self.mapping_manager.get_mapping(tablo_adi)
+        
+        if mapping:
+            print(f"Manuel eşleştirme bulundu: {mapping}")
+            return self.get_filtered_data_with_mapping(tablo_adi, il, sektor, email_filter, mapping)
+        
+        print("Manuel eşleştirme bulunamadı, eski yöntem kullanılıyor")
+        mapped_data = self.get_filtered_data_old_method(tablo_adi, il, sektor, email_filter)
+        mapped_headers = ["ID", "il", "Sektör", "Firma Adı", "Yetkili Adı Soyadı", "E-posta 1", "E-posta 2", "Web Sitesi"]
+        return mapped_data, mapped_headers
+
+    def add_rows_to_recipients(self, rows, headers):
+        """Sabit başlıklı satırlardan e-postaları toplu olarak alıcı listesine ekle"""
+        try:
+            # Başlık indeksleri bir kez hesaplanır
+            positions = {header: i for i, header in enumerate(headers)}
+            email1_index = positions.get("E-posta-1", positions.get("E-posta 1", -1))
+            email2_index = positions.get("E-posta 2", -1)
+            firma_adi_index = positions.get("Firma Adı", -1)
+            yetkili_adi_index = positions.get("Yetkili Adı Soyadı", -1)
+            il_index = positions.get("il", -1)
+            sektor_index = positions.get("Sektör", -1)
+            
+            def cell(row, index):
+                value = row[index] if index >= 0 else None
+                return str(value).strip() if value else ""
+            
+            def contacts():
+                for row in rows:
+                    firma_adi = cell(row, firma_adi_index)
+                    yetkili_adi = cell(row, yetkili_adi_index)
+                    # Ad Soyad (Firma adı + Yetkili adı)
+                    name = f"{firma_adi} - {yetkili_adi}" if firma_adi and yetkili_adi else (firma_adi or yetkili_adi or "Bilinmeyen")
+                    # Şablon kişiselleştirme alanları
+                    fields = {
+                        'firma_adi': firma_adi,
+                        'yetkili_adi': yetkili_adi,
+                        'il': cell(row, il_index),
+                        'sektor': cell(row, sektor_index),
+                    }
+                    yield cell(row, email1_index), name, fields
+                    yield cell(row, email2_index), name, fields
             
-            added_count = 0
-            duplicate_count = 0
-            
-            # Mevcut alıcı e-postalarını kontrol için set oluştur
-            existing_emails = set()
-            for row in range(self.recipient_list.rowCount()):
-                email = self.recipient_list.item(row, 0).text().strip()
-                if email:
-                    existing_emails.add(email.lower())
-            
-            # Filtreleme sonuçlarını alıcı listesine ekle
-            for row in range(row_count):
-                # Eşleştirme ile dinamik sütun indeksleri kullan
-                table_name = self.filter_tablo_adi.currentText()
-                mapping = self.mapping_manager.get_mapping(table_name)
-                
-                # Sabit başlıklara göre sütun indekslerini bul
-                headers = []
-                for col in range(self.filter_table.columnCount()):
-                    header_item = self.filter_table.horizontalHeaderItem(col)
-                    if header_item:
-                        headers.append(header_item.text())
-                
-                # E-posta ve diğer alanların indekslerini bul
-                email1_index = -1
-                email2_index = -1
-                firma_adi_index = -1
-                yetkili_adi_index = -1
-                
-                for i, header in enumerate(headers):
-                    if header == "E-posta-1" or header == "E-posta 1":
-                        email1_index = i
-                    elif header == "E-posta 2":
-                        email2_index = i
-                    elif header == "Firma Adı":
-                        firma_adi_index = i
-                    elif header == "Yetkili Adı Soyadı":
-                        yetkili_adi_index = i
-                
-                # Verileri al
-                email1 = self.filter_table.item(row, email1_index).text().strip() if email1_index >= 0 and self.filter_table.item(row, email1_index) else ""
-                email2 = self.filter_table.item(row, email2_index).text().strip() if email2_index >= 0 and self.filter_table.item(row, email2_index) else ""
-                firma_adi = self.filter_table.item(row, firma_adi_index).text().strip() if firma_adi_index >= 0 and self.filter_table.item(row, firma_adi_index) else ""
-                yetkili_adi = self.filter_table.item(row, yetkili_adi_index).text().strip() if yetkili_adi_index >= 0 and self.filter_table.item(row, yetkili_adi_index) else ""
-                
-                # E-posta adreslerini kontrol et ve ekle
-                emails_to_add = []
-                if email1 and '@' in email1:
-                    emails_to_add.append(email1)
-                if email2 and '@' in email2:
-                    emails_to_add.append(email2)
-                
-                for email in emails_to_add:
-                    email_lower = email.lower()
-                    if email_lower not in existing_emails:
-                        # Yeni alıcı ekle
-                        recipient_row = self.recipient_list.rowCount()
-                        self.recipient_list.insertRow(recipient_row)
-                        
-                        # E-posta adresi
-                        self.recipient_list.setItem(recipient_row, 0, QTableWidgetItem(email))
-                        
-                        # Ad Soyad (Firma adı + Yetkili adı)
-                        name = f"{firma_adi} - {yetkili_adi}" if firma_adi and yetkili_adi else (firma_adi or yetkili_adi or "Bilinmeyen")
-                        self.recipient_list.setItem(recipient_row, 1, QTableWidgetItem(name))
-                        
-                        # Durum
-                        self.recipient_list.setItem(recipient_row, 2, QTableWidgetItem("Aktif"))
-                        
-                        existing_emails.add(email_lower)
-                        added_count += 1
-                    else:
-                        duplicate_count += 1
+            # Mükerrer kontrolü RecipientStore'un e-posta indeksinde, tek model sıfırlaması ile
+            added_count, duplicate_count, suppressed_count = self.recipient_model.add_recipients(contacts())
             
             # Sonuç mesajı göster
             if added_count > 0:
                 message = f"{added_count} yeni alıcı eklendi."
                 if duplicate_count > 0:
                     message += f" {duplicate_count} mükerrer e-posta atlandı."
+                if suppressed_count > 0:
+                    message += f" {suppressed_count} engelli e-posta atlandı."
                 
                 QMessageBox.information(self, "Başarılı", message)
                 
                 # E-posta sekmesine geç
                 self.switch_to_email_tab()
+            elif suppressed_count > 0:
+                QMessageBox.information(self, "Bilgi", f"Eklenebilecek yeni e-posta adresi bulunamadı ({suppressed_count} adres engelleme listesinde).")
             else:
                 QMessageBox.information(self, "Bilgi", "Eklenebilecek yeni e-posta adresi bulunamadı.")
                 
@@ -3961,61 +4073,16 @@ class MainWindow(QMainWindow):
                 time.sleep(1)
 
     def perform_backup(self):
-        """PostgreSQL veritabanı yedekleme işlemi"""
+        """PostgreSQL veritabanı yedekleme işlemi (modules.backup - CLI ile ortak)"""
         try:
-            import subprocess
-            # Yedekleme dizinini al ve oluştur
-            backup_dir = self.backup_dir_edit.text().strip()
-            if not backup_dir:
-                # Varsayılan backup dizini yoksa yedekleme yapma
-                print("UYARI: Backup dizini belirtilmemiş! Yedekleme yapılmayacak.")
-                return False
-            
-            # Backup dizinini oluştur
-            os.makedirs(backup_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = os.path.join(backup_dir, f"veritabani_yedek_{timestamp}.sql")
-            # Veritabanı bağlantı bilgilerini al
-            db_name = self.db_name_edit.text().strip()
-            user = self.db_user_edit.text().strip()
-            password = self.db_password_edit.text()
-            host = self.db_host_edit.text().strip()
-            port = self.db_port_edit.text().strip()
-            if not all([db_name, user, password, host, port]):
-                print("Veritabanı bağlantı bilgileri eksik!")
-                return False
-            # pg_dump komutu oluştur (plain text format)
-            cmd = [
-                'pg_dump',
-                '-h', host,
-                '-p', port,
-                '-U', user,
-                '-F', 'p',  # plain text format
-                '-f', backup_file,
-                db_name
-            ]
-            # Environment variables
-            env = os.environ.copy()
-            env['PGPASSWORD'] = password
-            print(f"Yedekleme komutu: {' '.join(cmd)}")
-            print(f"Yedekleme dosyası: {backup_file}")
-            # Komutu çalıştır
-            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-            if result.returncode == 0:
-                # Dosya boyutunu kontrol et
-                if os.path.exists(backup_file):
-                    file_size = os.path.getsize(backup_file)
-                    print(f"Yedekleme başarılı! Dosya boyutu: {file_size} bytes")
-                    if file_size == 0:
-                        print("UYARI: Yedek dosyası 0 byte! Veritabanı bağlantısını kontrol edin.")
-                        return False
-                    return True
-                else:
-                    print("HATA: Yedek dosyası oluşturulamadı!")
-                    return False
-            else:
-                print(f"Yedekleme hatası: {result.stderr}")
-                return False
+            database = {
+                'database': self.db_name_edit.text().strip(),
+                'user': self.db_user_edit.text().strip(),
+                'password': self.db_password_edit.text(),
+                'host': self.db_host_edit.text().strip(),
+                'port': self.db_port_edit.text().strip(),
+            }
+            return backup_database(database, self.backup_dir_edit.text().strip()) is not None
         except Exception as e:
             print(f"Yedekleme hatası: {e}")
             return False
@@ -4386,118 +4453,64 @@ class MainWindow(QMainWindow):
         attachment_table.setRowCount(0)
         QMessageBox.information(self, "Bilgi", "Ek listesi temizlendi!")
         
+    def build_scheduled_job(self, subject, body, recipients, attachments, smtp_settings, due, kind='campaign',
+                            recurrence=None):
+        """Arayüzden bağımsız iş tanımı oluştur - gönderim ayarları zamanlama anında sabitlenir
+        
+        body imza eklenmiş son halidir; çalıştırma anında pencere alanları okunmaz.
+        """
+        vcard_image_path = None
+        if hasattr(self, 'vcard_enabled_check') and self.vcard_enabled_check.isChecked():
+            vcard_image_path = self.vcard_image_path_edit.text().strip() or None
+        settings = {
+            'bcc_enabled': self.bcc_checkbox.isChecked(),
+            'email_delay': self.email_delay_spin_schedule.value(),
+            'vcard_image_path': vcard_image_path,
+            'attach_image_originals': self.attach_image_originals_check.isChecked(),
+            'history_skip_days': self.history_skip_days_spin.value(),
+        }
+        contexts = {email: self.get_recipient_context(email) for email in recipients}
+        plan = None
+        planner = self.get_send_planner()
+        if planner is not None:
+            # Bugün gönderilmiş mesajlar ilk günün kotasından düşülür
+            same_day = datetime.fromtimestamp(due).date() == datetime.now().date()
+            plan = planner.plan(len(recipients), due, self.limiter.daily_sent_count if same_day else 0)
+        job = build_job_spec(subject, body, recipients, attachments, smtp_settings, settings, due, contexts, kind,
+                             recurrence, plan)
+        # Şifre işe yazılmaz; çalıştırma anında kayıtlı ayarlardan alınır
+        if not resolve_smtp_settings(job, self.engine.current_smtp_settings()).get('password'):
+            self.logger.warning("SMTP şifresi ayarlara kaydedilmemiş - zamanlanmış iş çalışmadan önce "
+                                "Yapılandırma sekmesinden ayarları kaydedin")
+        return job
+    
+    def get_send_planner(self):
+        """Gönderim yayma açıksa Zamanlama sekmesindeki ayarlarla planlayıcı (kapalıysa None)"""
+        if not self.spread_check.isChecked():
+            return None
+        weekdays = (0, 1, 2, 3, 4) if self.spread_weekdays_check.isChecked() else tuple(range(7))
+        return SendPlanner(self.hourly_limit_spin.value(), self.daily_limit_spin.value(),
+                           self.spread_start_hour_spin.value(), self.spread_end_hour_spin.value(),
+                           weekdays, self.spread_jitter_spin.value() / 100)
+
     def schedule_remaining_emails(self, subject, body, remaining_recipients, attachments, smtp_settings):
-        """Kalan alıcılar için 1 saat sonra e-posta gönderimi planla"""
+        """Kalan alıcılar için gönderim limiti açıldığında e-posta gönderimi planla (kalıcı zamanlayıcıya iş olarak eklenir)"""
         try:
-            # 1 saat sonra çalışacak timer oluştur
-            timer = QTimer()
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda: self.send_remaining_emails(subject, body, remaining_recipients, attachments, smtp_settings))
-            timer.start(3600000)  # 1 saat = 3600000 ms
+            # Zamanlanmış işlerle (servis dahil) aynı kural: limitin yeniden açılacağı an
+            due = self.limiter.next_reset()
+            self.add_scheduled_email_to_list(self.build_scheduled_job(
+                subject, body, remaining_recipients, attachments, smtp_settings, due, kind='remaining'))
+            next_time = QDateTime.fromSecsSinceEpoch(int(due)).toString('dd.MM.yyyy HH:mm')
             
-            self.logger.info(f"Kalan {len(remaining_recipients)} alıcı için 1 saat sonra e-posta gönderimi planlandı")
+            self.logger.info(f"Kalan {len(remaining_recipients)} alıcı için {next_time} itibarıyla e-posta gönderimi planlandı")
             
             # Kullanıcıya bilgi ver
             QMessageBox.information(self, "Zamanlama", 
-                f"Kalan {len(remaining_recipients)} alıcı için 1 saat sonra otomatik gönderim planlandı.\n"
+                f"Kalan {len(remaining_recipients)} alıcı için {next_time} itibarıyla otomatik gönderim planlandı.\n"
                 f"Gönderim durumu log sekmesinden takip edilebilir.")
             
         except Exception as e:
             self.logger.error(f"Kalan e-postalar planlanırken hata: {e}")
-
-    def send_remaining_emails(self, subject, body, remaining_recipients, attachments, smtp_settings):
-        """Kalan alıcılara e-posta gönder - Limit kontrolü ile"""
-        try:
-            # VCard imzasını ekle
-            body_with_signature = self.add_vcard_signature(body, attachments)
-            
-            # Kartvizit görselini ayrı olarak sakla
-            vcard_image_path = None
-            if hasattr(self, 'vcard_enabled_check') and self.vcard_enabled_check.isChecked():
-                vcard_image_path = self.vcard_image_path_edit.text().strip()
-                if not vcard_image_path or not os.path.exists(vcard_image_path):
-                    vcard_image_path = None
-            
-            # Limit kontrolü
-            can_send, message = self.check_sending_limits()
-            if not can_send:
-                # Limit dolmuşsa, tekrar 1 saat sonra dene
-                self.schedule_remaining_emails(subject, body, remaining_recipients, attachments, smtp_settings)
-                self.logger.info(f"Limit doldu, tekrar 1 saat sonra denenecek: {message}")
-                return
-            
-            # Güvenli gönderim sayısını hesapla
-            safe_count, _ = self.calculate_safe_sending_count(len(remaining_recipients))
-            
-            if safe_count == 0:
-                # Limit dolmuşsa, tekrar 1 saat sonra dene
-                self.schedule_remaining_emails(subject, body, remaining_recipients, attachments, smtp_settings)
-                self.logger.info("Güvenli gönderim sayısı 0, tekrar 1 saat sonra denenecek")
-                return
-            
-            # Bu saatte gönderilecek alıcıları seç
-            recipients_to_send_now = remaining_recipients[:safe_count]
-            recipients_to_send_later = remaining_recipients[safe_count:]
-            
-            # E-postaları gönder
-            success_count = 0
-            failed_recipients = []
-            
-            if self.bcc_checkbox.isChecked():
-                # BCC ile gönderim
-                email_delay = self.email_delay_spin_schedule.value()  # UI'dan al
-                for j, recipient in enumerate(recipients_to_send_now):
-                    try:
-                        self.logger.info(f"BCC e-posta gönderiliyor ({j+1}/{len(recipients_to_send_now)}): {recipient}")
-                        if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, True, vcard_image_path):
-                            success_count += 1
-                            self.logger.info(f"BCC e-posta gönderildi: {recipient}")
-                        else:
-                            failed_recipients.append(recipient)
-                            self.logger.error(f"BCC e-posta gönderilemedi: {recipient}")
-                    except Exception as e:
-                        failed_recipients.append(recipient)
-                        self.logger.error(f"BCC e-posta gönderme hatası ({recipient}): {e}")
-                    
-                    # Son e-posta değilse bekle
-                    if j < len(recipients_to_send_now) - 1:
-                        self.logger.info(f"Sonraki BCC e-posta için {email_delay} saniye bekleniyor...")
-                        time.sleep(email_delay)
-            else:
-                # Normal gönderim
-                email_delay = self.email_delay_spin_schedule.value()  # Zamanlama sekmesindeki ayar
-                for j, recipient in enumerate(recipients_to_send_now):
-                    try:
-                        self.logger.info(f"E-posta gönderiliyor ({j+1}/{len(recipients_to_send_now)}): {recipient}")
-                        if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, True, vcard_image_path):
-                            success_count += 1
-                            self.logger.info(f"E-posta gönderildi: {recipient}")
-                        else:
-                            failed_recipients.append(recipient)
-                            self.logger.error(f"E-posta gönderilemedi: {recipient}")
-                    except Exception as e:
-                        failed_recipients.append(recipient)
-                        self.logger.error(f"E-posta gönderme hatası ({recipient}): {e}")
-                    
-                    # Son e-posta değilse bekle
-                    if j < len(recipients_to_send_now) - 1:
-                        self.logger.info(f"Sonraki e-posta için {email_delay} saniye bekleniyor...")
-                        time.sleep(email_delay)
-            
-            # Gönderim sayılarını güncelle
-            if success_count > 0:
-                self.update_sending_counters(success_count)
-                self.logger.info(f"Kalan e-postalardan {success_count} tanesi gönderildi")
-            
-            # Hala kalan alıcılar varsa, tekrar 1 saat sonra dene
-            if recipients_to_send_later:
-                self.schedule_remaining_emails(subject, body_with_signature, recipients_to_send_later, attachments, smtp_settings)
-                self.logger.info(f"Kalan {len(recipients_to_send_later)} alıcı için tekrar 1 saat sonra denenecek")
-            else:
-                self.logger.info("Tüm e-postalar başarıyla gönderildi")
-                
-        except Exception as e:
-            self.logger.error(f"Kalan e-postalar gönderilirken hata: {e}")
         
     def schedule_email(self, subject, body, attachment_table):
         """E-postayı belirli bir zamanda gönder - Kapsamlı Geliştirilmiş"""
@@ -4536,6 +4549,13 @@ class MainWindow(QMainWindow):
             # 5. Kartvizit imzası ekle
             body_with_signature = body
             
+            # Mesaj boyutu sağlayıcı sınırını aşıyorsa uyar
+            vcard_image_path = None
+            if hasattr(self, 'vcard_enabled_check') and self.vcard_enabled_check.isChecked():
+                vcard_image_path = self.vcard_image_path_edit.text().strip() or None
+            if not self.confirm_message_size(body_with_signature, attachments, vcard_image_path):
+                return
+            
             # 6. Güvenli gönderim sayısını hesapla
             safe_count, message = self.calculate_safe_sending_count(len(recipients))
             
@@ -4548,7 +4568,7 @@ class MainWindow(QMainWindow):
                 reply = QMessageBox.question(self, "Limit Bilgisi", 
                     f"{message}\n\n"
                     f"Zamanlandığında {safe_count} e-posta gönderilecek.\n"
-                    f"Kalan {len(recipients) - safe_count} e-posta için 1 saat sonra otomatik devam edilecek.\n\n"
+                    f"Kalan {len(recipients) - safe_count} e-posta için gönderim limiti açıldığında otomatik devam edilecek.\n\n"
                     f"Devam etmek istiyor musunuz?",
                     QMessageBox.Yes | QMessageBox.No)
                 
@@ -4558,7 +4578,7 @@ class MainWindow(QMainWindow):
             # 8. Zamanlama dialog'u oluştur
             dialog = QDialog(self)
             dialog.setWindowTitle("E-posta Zamanlama")
-            dialog.setFixedSize(450, 400)
+            dialog.setFixedSize(450, 560)
             
             layout = QVBoxLayout(dialog)
             
@@ -4601,6 +4621,44 @@ class MainWindow(QMainWindow):
             time_edit.setTime(QTime.currentTime())
             layout.addWidget(time_edit)
             
+            # Tekrar seçenekleri - tekrarlar tek iş olarak saklanır, sonraki zaman her çalışmada hesaplanır
+            layout.addWidget(QLabel("Tekrar:"))
+            repeat_combo = QComboBox()
+            repeat_combo.addItems(["Tek sefer", "Her gün (seçilen saatte)", "Her iş günü (Pzt-Cuma, seçilen saatte)",
+                                   "Cron ifadesi", "Damla dizisi (şablonlar gün arayla)"])
+            layout.addWidget(repeat_combo)
+            
+            cron_edit = QLineEdit()
+            cron_edit.setPlaceholderText("dakika saat gün ay haftanın-günü, örn. 0 9 * * 1-5")
+            layout.addWidget(cron_edit)
+            
+            # Damla dizisi: bu şablondan sonra gönderilecek diğer şablonlar (sekme sırasıyla)
+            drip_list = QListWidget()
+            drip_list.setMaximumHeight(90)
+            drip_templates = []
+            for i, widgets in enumerate(self.template_widgets):
+                if widgets["attachments"] is attachment_table:
+                    continue
+                item = QListWidgetItem(self.email_tab_widget.tabText(i))
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+                drip_list.addItem(item)
+                drip_templates.append(widgets)
+            layout.addWidget(drip_list)
+            
+            drip_interval_spin = QSpinBox()
+            drip_interval_spin.setRange(1, 365)
+            drip_interval_spin.setValue(3)
+            drip_interval_spin.setSuffix(" gün arayla")
+            layout.addWidget(drip_interval_spin)
+            
+            def update_repeat_fields(index):
+                cron_edit.setVisible(index == 3)
+                drip_list.setVisible(index == 4)
+                drip_interval_spin.setVisible(index == 4)
+            repeat_combo.currentIndexChanged.connect(update_repeat_fields)
+            update_repeat_fields(0)
+            
             # E-posta arası süre bilgisi
             delay_info = QLabel(f"⏱️ E-posta arası süre: {self.email_delay_spin_schedule.value()} saniye")
             delay_info.setStyleSheet("color: #666; font-size: 10px; padding: 5px;")
@@ -4630,36 +4688,66 @@ class MainWindow(QMainWindow):
                 scheduled_datetime = QDateTime(selected_date, selected_time)
                 current_datetime = QDateTime.currentDateTime()
                 
-                # Geçmiş tarih kontrolü
-                if scheduled_datetime <= current_datetime:
+                repeat_index = repeat_combo.currentIndex()
+                
+                # Geçmiş tarih kontrolü (tekrarlayan işlerde seçilen an yalnızca başlangıçtır)
+                if scheduled_datetime <= current_datetime and repeat_index in (0, 4):
                     QMessageBox.warning(self, "Hata", "Geçmiş bir tarih seçtiniz!")
                     return
                 
-                # 9. Kapsamlı zamanlama bilgilerini hazırla
-                email_data = {
-                    'subject': subject,
-                    'body': body_with_signature,  # Kartvizit imzası eklenmiş
-                    'attachment_table': attachment_table,
-                    'attachments': attachments,  # Ek dosya listesi
-                    'datetime': scheduled_datetime,
-                    'recipients': recipients,
-                    'smtp_settings': smtp_settings,  # SMTP ayarları
-                    'bcc_enabled': self.bcc_checkbox.isChecked(),  # BCC durumu
-                    'email_delay': self.email_delay_spin_schedule.value(),  # E-posta arası süre
-                    'safe_count': safe_count,  # Güvenli gönderim sayısı
-                    'total_count': len(recipients)  # Toplam alıcı sayısı
-                }
+                # Tekrar kuralı
+                recurrence = None
+                try:
+                    if repeat_index == 1:
+                        recurrence = cron_recurrence(daily_cron(selected_time.hour(), selected_time.minute()))
+                    elif repeat_index == 2:
+                        recurrence = cron_recurrence(weekday_cron(selected_time.hour(), selected_time.minute()))
+                    elif repeat_index == 3:
+                        recurrence = cron_recurrence(cron_edit.text())
+                except ValueError as e:
+                    QMessageBox.warning(self, "Hata", str(e))
+                    return
+                if repeat_index == 4:
+                    steps = [{'subject': subject, 'body': self.add_vcard_signature(body, attachments),
+                              'attachments': [resolve_attachment(path) for path in attachments]}]
+                    for row in range(drip_list.count()):
+                        if drip_list.item(row).checkState() != Qt.Checked:
+                            continue
+                        widgets = drip_templates[row]
+                        step_table = widgets["attachments"]
+                        step_attachments = [step_table.item(r, 0).data(Qt.UserRole) for r in range(step_table.rowCount())]
+                        step_attachments = [path for path in step_attachments if path and os.path.exists(path)]
+                        steps.append({'subject': widgets["subject"].text(),
+                                      'body': self.add_vcard_signature(widgets["body"].toPlainText(), step_attachments),
+                                      'attachments': [resolve_attachment(path) for path in step_attachments]})
+                    if len(steps) < 2:
+                        QMessageBox.warning(self, "Hata", "Damla dizisi için en az bir şablon daha seçin!")
+                        return
+                    recurrence = drip_recurrence(steps, drip_interval_spin.value())
+                
+                due = first_fire(recurrence, max(scheduled_datetime.toSecsSinceEpoch(), time.time()))
+                if due is None:
+                    QMessageBox.warning(self, "Hata", "Cron ifadesi hiçbir zaman gerçekleşmiyor!")
+                    return
+                scheduled_datetime = QDateTime.fromSecsSinceEpoch(int(due))
                 
-                # Listeye ekle
-                self.add_scheduled_email_to_list(email_data)
+                # 9. Kapsamlı zamanlama bilgilerini hazırla - ekler, ayarlar ve imza şimdi sabitlenir
+                email_data = self.build_scheduled_job(subject, self.add_vcard_signature(body, attachments), recipients,
+                                                      attachments, smtp_settings, due, recurrence=recurrence)
                 
-                # Zamanlayıcıyı başlat
-                timer_id = self.start_email_scheduler(scheduled_datetime)
-                email_data['timer_id'] = timer_id
+                # Kalıcı zamanlayıcıya ekle (tek timer en yakın işe göre kurulur)
+                self.add_scheduled_email_to_list(email_data)
                 
                 # 10. Detaylı başarı mesajı
+                plan_text = "🗓️ Gönderim planı: kapalı (arka arkaya gönderilir)"
+                if email_data.get('plan'):
+                    days, _, finish = describe_plan(email_data['plan'])
+                    finish_text = QDateTime.fromSecsSinceEpoch(int(finish)).toString('dd.MM.yyyy HH:mm') if finish else "-"
+                    plan_text = f"🗓️ Gönderim planı: {days} gün, tahmini bitiş {finish_text}"
                 QMessageBox.information(self, "Başarılı", 
-                    f"E-posta {scheduled_datetime.toString('dd.MM.yyyy HH:mm')} tarihinde gönderilecek!\n\n"
+                    f"E-posta {scheduled_datetime.toString('dd.MM.yyyy HH:mm')} tarihinde gönderilecek!\n"
+                    f"🔁 Tekrar: {describe_recurrence(recurrence)}\n"
+                    f"{plan_text}\n"
                     f"📧 Alıcı sayısı: {len(recipients)}\n"
                     f"🛡️ Güvenli gönderim: {safe_count}\n"
                     f"📎 Ek dosya: {len(attachments)}\n"
@@ -4670,217 +4758,472 @@ class MainWindow(QMainWindow):
             self.logger.error(f"E-posta zamanlama hatası: {e}")
             QMessageBox.critical(self, "Hata", f"E-posta zamanlanamadı: {e}")
 
-    def start_email_scheduler(self, scheduled_datetime):
-        """E-posta zamanlayıcısını başlat - Güncellenmiş"""
+    def arm_scheduler_timer(self):
+        """Tek zamanlayıcıyı heap'teki en yakın işin zamanına kur (periyodik yoklama yok)"""
+        next_due = self.job_scheduler.next_due()
+        if next_due is None:
+            self.scheduler_timer.stop()
+            return
+        delay_ms = int(max(0.0, next_due - time.time()) * 1000)
+        # QTimer aralığı 32 bit ile sınırlı; daha uzak işler için ara uyanışta yeniden kurulur
+        self.scheduler_timer.start(min(delay_ms, 2**31 - 1))
+
+    def on_jobs_file_changed(self, path):
+        """İş dosyası başka süreçte değiştiyse listeyi ve zamanlayıcıyı güncelle"""
         try:
-            # Zamanlayıcı timer'ı oluştur
-            timer = QTimer()
-            timer.setSingleShot(True)
-            
-            # Zamanlama süresini hesapla (milisaniye)
-            current_datetime = QDateTime.currentDateTime()
-            time_diff = current_datetime.msecsTo(scheduled_datetime)
-            
-            # Eğer zamanı geçmişse hemen çalıştır
-            if time_diff <= 0:
-                self.logger.info(f"Zamanlanmış e-posta zamanı geçmiş, hemen gönderiliyor: {scheduled_datetime.toString('dd.MM.yyyy HH:mm')}")
-                self.send_scheduled_email()
-            else:
-                timer.timeout.connect(self.send_scheduled_email)
-                timer.start(time_diff)
-                self.logger.info(f"E-posta zamanlayıcısı başlatıldı: {scheduled_datetime.toString('dd.MM.yyyy HH:mm')} - {time_diff}ms sonra")
-            
-            # Timer'ı sakla
-            timer_id = f"email_{len(self.scheduled_emails)}"
-            self.email_timers[timer_id] = timer
-            
-            # Periyodik kontrol timer'ı başlat (her 30 saniyede bir kontrol et)
-            if not hasattr(self, 'schedule_check_timer'):
-                self.schedule_check_timer = QTimer()
-                self.schedule_check_timer.timeout.connect(self.send_scheduled_email)
-                self.schedule_check_timer.start(30000)  # 30 saniye
-                self.logger.info("Periyodik zamanlama kontrolü başlatıldı")
-            
-            # Timer ID'sini döndür
-            return timer_id
-            
+            if self.job_scheduler.refresh():
+                self.refresh_schedule_list()
+                self.arm_scheduler_timer()
         except Exception as e:
-            self.logger.error(f"E-posta zamanlayıcısı başlatılırken hata: {e}")
+            self.logger.error(f"Zamanlanmış işler yeniden okunamadı: {e}")
 
     def send_scheduled_email(self):
-        """Zamanlanmış e-postayı gönder - Limit Kontrolü ile Düzeltilmiş"""
+        """Zamanı gelen işleri sıraya al - tek zamanlayıcı tarafından tetiklenir"""
         try:
-            self.logger.info(f"Zamanlanmış e-posta kontrolü başlatıldı - {len(self.scheduled_emails)} zamanlama mevcut")
-            current_time = QDateTime.currentDateTime()
-            completed_indices = []
+            due_jobs = self.job_scheduler.take_due()
+            self.pending_jobs.extend(due_jobs)
+            self.start_next_scheduled_job()
             
-            for i, email_data in enumerate(self.scheduled_emails):
-                scheduled_datetime = email_data.get('datetime')
-                self.logger.info(f"Zamanlama {i+1} kontrol ediliyor: {scheduled_datetime.toString('dd.MM.yyyy HH:mm') if scheduled_datetime else 'Belirsiz'}")
-                
-                if scheduled_datetime and current_time >= scheduled_datetime:
-                    self.logger.info(f"Zamanlanmış e-posta gönderimi başlatılıyor: {email_data.get('subject', 'Konu yok')}")
-                    
-                    subject = email_data['subject']
-                    body = email_data['body']
-                    recipients = email_data.get('recipients', [])
-                    
-                    if not recipients:
-                        self.logger.error(f"Zamanlanmış e-posta için alıcı listesi boş: {subject}")
-                        completed_indices.append(i)
-                        continue
-                    
-                    self.logger.info(f"Alıcı sayısı: {len(recipients)}")
-                    
-                    smtp_server = self.smtp_server_edit.text()
-                    smtp_port = int(self.smtp_port_edit.text()) if self.smtp_port_edit.text() else 587
-                    sender_email = self.sender_email_edit.text().strip()
-                    sender_password = self.sender_password_edit.text().strip()
-                    
-                    if not smtp_server or not sender_email or not sender_password:
-                        self.logger.error(f"SMTP ayarları eksik, zamanlanmış e-posta gönderilemedi: {subject}")
-                        completed_indices.append(i)
-                        continue
-                    
-                    smtp_settings = {
-                        'server': smtp_server,
-                        'port': smtp_port,
-                        'username': sender_email,
-                        'password': sender_password
-                    }
-                    
-                    attachments = []
-                    attachment_table = email_data.get('attachment_table')
-                    if attachment_table:
-                        for row in range(attachment_table.rowCount()):
-                            file_path = attachment_table.item(row, 0).data(Qt.UserRole)
-                            if file_path and os.path.exists(file_path):
-                                attachments.append(file_path)
-                    
-                    self.logger.info(f"Ek dosya sayısı: {len(attachments)}")
-                    
-                    # Kartvizit imzası ekle
-                    body_with_signature = self.add_vcard_signature(body, attachments)
-                    
-                    # Kartvizit görselini ayrı olarak sakla
-                    vcard_image_path = None
-                    if hasattr(self, 'vcard_enabled_check') and self.vcard_enabled_check.isChecked():
-                        vcard_image_path = self.vcard_image_path_edit.text().strip()
-                        if not vcard_image_path or not os.path.exists(vcard_image_path):
-                            vcard_image_path = None
-                    
-                    # 1. Güvenli gönderim sayısını hesapla
-                    safe_count, message = self.calculate_safe_sending_count(len(recipients))
-                    
-                    if safe_count == 0:
-                        self.logger.warning(f"Limit doldu, zamanlanmış e-posta gönderilemedi: {subject}")
-                        # Limit dolmuşsa, 1 saat sonra tekrar dene
-                        email_data['datetime'] = current_time.addSecs(3600)  # 1 saat sonra
-                        continue
-                    
-                    # 2. Alıcı listesini böl
-                    recipients_to_send_now = recipients[:safe_count]
-                    recipients_to_send_later = recipients[safe_count:]
-                    
-                    self.logger.info(f"Güvenli gönderim: {safe_count}/{len(recipients)} alıcı")
-                    
-                    # 3. Şimdi gönderilecek alıcılara e-posta gönder
-                    success_count = 0
-                    failed_recipients = []
-                    
-                    # E-posta gönderim süresi (saniye) - spam koruması için
-                    email_delay = email_data.get('email_delay', self.email_delay_spin_schedule.value())
-                    
-                    if email_data.get('bcc_enabled', self.bcc_checkbox.isChecked()):
-                        # BCC ile gönderim
-                        for j, recipient in enumerate(recipients_to_send_now):
-                            try:
-                                self.logger.info(f"BCC e-posta gönderiliyor ({j+1}/{len(recipients_to_send_now)}): {subject} -> {recipient}")
-                                if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, True, vcard_image_path):
-                                    success_count += 1
-                                    self.logger.info(f"BCC e-posta gönderildi: {subject} -> {recipient}")
-                                else:
-                                    failed_recipients.append(recipient)
-                                    self.logger.error(f"BCC e-posta gönderilemedi: {subject} -> {recipient}")
-                            except Exception as e:
-                                failed_recipients.append(recipient)
-                                self.logger.error(f"BCC e-posta gönderme hatası ({recipient}): {e}")
-                            
-                            # Son e-posta değilse bekle
-                            if j < len(recipients_to_send_now) - 1:
-                                self.logger.info(f"Sonraki BCC e-posta için {email_delay} saniye bekleniyor...")
-                                time.sleep(email_delay)
-                    else:
-                        # Normal gönderim
-                        for j, recipient in enumerate(recipients_to_send_now):
-                            try:
-                                self.logger.info(f"E-posta gönderiliyor ({j+1}/{len(recipients_to_send_now)}): {subject} -> {recipient}")
-                                if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, True, vcard_image_path):
-                                    success_count += 1
-                                    self.logger.info(f"E-posta gönderildi: {subject} -> {recipient}")
-                                else:
-                                    failed_recipients.append(recipient)
-                                    self.logger.error(f"E-posta gönderilemedi: {subject} -> {recipient}")
-                            except Exception as e:
-                                failed_recipients.append(recipient)
-                                self.logger.error(f"E-posta gönderme hatası ({recipient}): {e}")
-                            
-                            # Son e-posta değilse bekle
-                            if j < len(recipients_to_send_now) - 1:
-                                self.logger.info(f"Sonraki e-posta için {email_delay} saniye bekleniyor...")
-                                time.sleep(email_delay)
-                    
-                    # 4. Gönderim sayılarını güncelle
-                    if success_count > 0:
-                        self.logger.info(f"Zamanlanmış e-posta kısmı tamamlandı: {subject} - {success_count}/{len(recipients_to_send_now)} başarılı")
-                        self.update_sending_counters(success_count)
-                        # UI'ı güncelle
-                        self.refresh_sending_stats()
-                    
-                    # 5. Kalan alıcılar varsa, zamanlayıcı başlat
-                    if recipients_to_send_later:
-                        self.logger.info(f"Kalan {len(recipients_to_send_later)} alıcı için 1 saat sonra otomatik devam edilecek")
-                        self.schedule_remaining_emails(subject, body_with_signature, recipients_to_send_later, attachments, smtp_settings)
-                        
-                        # Zamanlama verilerini güncelle (kalan alıcılar için)
-                        email_data['recipients'] = recipients_to_send_later
-                        email_data['datetime'] = current_time.addSecs(3600)  # 1 saat sonra
-                        email_data['sent'] = False  # Henüz tamamlanmadı
-                        
-                        self.logger.info(f"Zamanlama {i+1} güncellendi: {len(recipients_to_send_later)} alıcı kaldı")
-                    else:
-                        # Tüm alıcılar gönderildi, tamamlandı olarak işaretle
-                        email_data['sent'] = True
-                        completed_indices.append(i)
-                        self.logger.info(f"Zamanlama {i+1} tamamlandı: {subject}")
-                    
-                else:
-                    if scheduled_datetime:
-                        time_diff = current_time.msecsTo(scheduled_datetime)
-                        self.logger.info(f"Zamanlama {i+1} henüz zamanı gelmedi: {time_diff//1000} saniye kaldı")
+            if due_jobs:
+                self.refresh_schedule_list()
+        except Exception as e:
+            self.logger.error(f"Zamanlanmış e-posta gönderilirken hata: {e}")
+        finally:
+            self.arm_scheduler_timer()
+
+    def start_next_scheduled_job(self):
+        """Sıradaki işi arka plan iş parçacığında başlat (aynı anda tek iş çalışır)"""
+        if self.job_worker and self.job_worker.isRunning():
+            return
+        while self.pending_jobs:
+            email_data = normalize_job_spec(self.pending_jobs.pop(0))
+            if self.run_scheduled_job(email_data):
+                return
+
+    def run_scheduled_job(self, email_data):
+        """Zamanlanmış kampanya işini başlat - Limit Kontrolü ile
+        
+        Kiralama, alıcı/SMTP ve limit kontrolü servisle ortak motorda (EmailEngine.start_job_run)
+        yapılır; mesaj seçenekleri arayüz iş parçacığında hesaplanır, gönderim
+        ScheduledJobWorker içinde yapılır. İş başlatıldıysa True döner.
+        """
+        job_id = email_data['id']
+        subject = email_data.get('subject', 'Konu yok')
+        try:
+            self.logger.info(f"Zamanlanmış e-posta gönderimi başlatılıyor: {subject}")
+            status, value = self.engine.start_job_run(job_id, subject)
+            if status == 'limit':
+                # Limit dolmuşsa iş limitin açılacağı zamana ertelendi (servisle aynı kural)
+                next_time = QDateTime.fromSecsSinceEpoch(int(value)).toString('dd.MM.yyyy HH:mm')
+                self.logger.warning(f"Limit doldu, zamanlanmış e-posta {next_time} itibarıyla tekrar denenecek: {subject}")
+                self.refresh_sending_stats()
+                return False
+            if status != 'run':
+                return False
+            # İş parçacığı diskteki son kaydın kopyası üzerinde çalışır; kayıt bitişte güncellenir
+            email_data, safe_count, self.job_reservation = value
+            self.refresh_sending_stats()
             
-            # Tamamlanan zamanlamaları listeden kaldır
-            for index in reversed(completed_indices):
-                del self.scheduled_emails[index]
+            # Mesaj seçenekleri zamanlama anındaki ayarlardan (sunucular gerekirse burada başlatılır)
+            message_options = self.get_message_options()
+            message_options['attach_image_originals'] = email_data['settings'].get('attach_image_originals', True)
+            runner = CampaignJobRunner(self.email_validator, self.suppression_list, self.contact_history,
+                                       message_options)
             
-            if completed_indices:
-                self.logger.info(f"{len(completed_indices)} zamanlama tamamlandı ve listeden kaldırıldı")
-                self.refresh_schedule_list()
-                
-                # Sonraki zamanlama etiketini güncelle
-                self.update_next_schedule_label()
+            worker = ScheduledJobWorker(runner, email_data, safe_count, parent=self)
+            worker.log_message.connect(self.logger.info)
+            worker.job_finished.connect(self.on_scheduled_job_finished)
+            worker.job_failed.connect(self.on_scheduled_job_failed)
+            self.job_worker = worker
+            worker.start()
+            return True
             
         except Exception as e:
-            self.logger.error(f"Zamanlanmış e-posta gönderilirken hata: {e}")
+            # İş kaybolmasın - 1 saat sonra tekrar denenir
+            self.engine.abort_job_run(job_id, e)
+            return False
+
+    def stop_running_job(self, job_id=None):
+        """Çalışan zamanlanmış işi (job_id verilirse yalnızca o işi) sıradaki alıcıdan önce durdur"""
+        worker = self.job_worker
+        if worker is None or not worker.isRunning():
+            return False
+        if job_id is not None and worker.job['id'] != job_id:
+            return False
+        worker.stop()
+        self.logger.info(f"Zamanlanmış gönderim durduruluyor: {worker.job.get('subject', '')}")
+        return True
+
+    def on_scheduled_job_finished(self, job, result):
+        """İş diliminin sonucunu sayaçlara, geçmişe ve zamanlayıcıya yansıt (servisle ortak motor)"""
+        if self.closing:
+            # Kapanışta sonuç closeEvent içinde işlendi
+            return
+        job_id = job['id']
+        subject = job['subject']
+        try:
+            status, next_due = self.engine.finish_job_run_result(job, result, self.job_reservation)
+            if status == 'recurring':
+                recurrence = self.job_scheduler.get(job_id)['recurrence']
+                self.logger.info(f"Tekrar kuralı: {describe_recurrence(recurrence)} - {subject}")
+        except Exception as e:
+            self.logger.error(f"Zamanlanmış iş sonucu işlenirken hata: {e}")
+        finally:
+            self.job_reservation = None
+            self.refresh_sending_stats()
+            self.refresh_schedule_list()
+            self.arm_scheduler_timer()
+            self.start_next_scheduled_job()
+
+    def on_scheduled_job_failed(self, job, error):
+        """İş çalıştırılamadı - kaybolmasın, 1 saat sonra tekrar denenir"""
+        self.engine.abort_job_run(job['id'], error)
+        self.job_reservation = None
+        self.refresh_sending_stats()
+        self.refresh_schedule_list()
+        self.arm_scheduler_timer()
+        self.start_next_scheduled_job()
+
+    def prepare_recipients(self, recipients, subject):
+        """Gönderim öncesi son kontroller: sözdizimi, engelleme listesi, gönderim geçmişi"""
+        valid, invalid_count = self.email_validator.filter_valid(recipients)
+        if invalid_count:
+            self.logger.info(f"{invalid_count} alıcı geçersiz e-posta adresi olduğu için atlandı")
+        return self.apply_contact_history(self.apply_suppression(valid), subject)
+
+    def confirm_message_size(self, body, attachments, vcard_image_path=None):
+        """Kampanya öncesi tahmini mesaj boyutunu sağlayıcı sınırıyla karşılaştır - devam edilecekse True"""
+        # Ek görseller inline ön izleme olarak da gönderilir (küçültülemezse orijinal boyutta);
+        # orijinaller kapalıysa mesajda yalnızca ön izleme bulunur
+        image_paths = [path for path in attachments if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS]
+        inline_images = []
+        if not self.attach_image_originals_check.isChecked():
+            attachments = [path for path in attachments if path not in image_paths]
+        offloader = self.get_attachment_offloader()
+        if offloader is not None:
+            # Bağlantı ile paylaşılan ekler mesaj boyutuna dahil değildir
+            attachments = [path for path in attachments if not offloader.should_offload(path)]
+        if vcard_image_path:
+            inline_images.append(vcard_image_path)
+        size = default_attachment_store.estimate_message_size(attachments, body, inline_images, image_paths,
+                                                              default_image_previewer)
+        limit = provider_size_limit(self.smtp_server_edit.text())
+        self.logger.info(f"Tahmini mesaj boyutu: {size / (1024 * 1024):.1f} MB (sınır {limit / (1024 * 1024):.0f} MB)")
+        if size <= limit:
+            return True
+        reply = QMessageBox.question(self, "Mesaj Boyutu Uyarısı",
+            f"Tahmini mesaj boyutu {size / (1024 * 1024):.1f} MB, e-posta sağlayıcınızın sınırı "
+            f"yaklaşık {limit / (1024 * 1024):.0f} MB.\n"
+            f"Mesajlar reddedilebilir; ek dosyaları küçültmeniz önerilir.\n\n"
+            f"Yine de devam etmek istiyor musunuz?",
+            QMessageBox.Yes | QMessageBox.No)
+        return reply == QMessageBox.Yes
+
+    def validate_recipient_list(self):
+        """Alıcı listesini doğrula ve sorunlu adreslerin durumunu güncelle"""
+        if not len(self.recipient_store):
+            QMessageBox.warning(self, "Uyarı", "Alıcı listesi boş!")
+            return
+        if self.validation_worker and self.validation_worker.isRunning():
+            QMessageBox.warning(self, "Uyarı", "Doğrulama devam ediyor, lütfen bekleyin.")
+            return
+        
+        if MX_CHECK_AVAILABLE:
+            reply = QMessageBox.question(self, "Doğrulama",
+                "Alan adlarının MX (posta sunucusu) kayıtları da kontrol edilsin mi?\n"
+                "Bu işlem internet bağlantısı gerektirir; sonuçlar alan adı başına önbelleğe alınır.",
+                QMessageBox.Yes | QMessageBox.No)
+            check_mx = reply == QMessageBox.Yes
+        else:
+            self.logger.warning("dnspython yüklü değil, MX kontrolü yapılmadan doğrulanıyor (pip install dnspython)")
+            check_mx = False
+        
+        worker = RecipientValidationWorker(self.email_validator, list(self.recipient_store.emails),
+                                           check_mx=check_mx, parent=self)
+        worker.validation_finished.connect(self.on_recipient_validation_finished)
+        worker.validation_failed.connect(lambda error: QMessageBox.critical(self, "Hata", f"Doğrulama hatası: {error}"))
+        self.validation_worker = worker
+        worker.start()
+
+    def on_recipient_validation_finished(self, results):
+        """Doğrulama sonuçlarını alıcı durumlarına yansıt"""
+        invalid_count = 0
+        no_mx_count = 0
+        suggestion_count = 0
+        for result in results:
+            if not result['valid']:
+                self.recipient_model.set_status(result['email'], f"Geçersiz: {result['reason']}")
+                # MX sonucu gönderimde yeniden sorgulanmaz; yalnızca biçim hataları atlanır
+                if result['reason'] == NO_MX_REASON:
+                    no_mx_count += 1
+                else:
+                    invalid_count += 1
+            elif result['suggestion']:
+                self.recipient_model.set_status(result['email'], f"Öneri: {result['suggestion']}")
+                suggestion_count += 1
+        
+        QMessageBox.information(self, "Doğrulama Tamamlandı",
+            f"{len(results)} adres kontrol edildi.\n"
+            f"Geçersiz: {invalid_count} (gönderimde atlanır)\n"
+            f"MX kaydı olmayan alan adı: {no_mx_count} (gönderimde atlanmaz - listeden çıkarabilirsiniz)\n"
+            f"Olası yazım hatası: {suggestion_count}")
+
+    def apply_suppression(self, recipients):
+        """Engelleme listesindeki adresleri çıkar ve sayısını logla"""
+        allowed, suppressed_count = self.suppression_list.filter(recipients)
+        if suppressed_count:
+            self.logger.info(f"{suppressed_count} alıcı engelleme listesinde olduğu için atlandı")
+        return allowed
+
+    def apply_contact_history(self, recipients, subject):
+        """Aynı şablonu (konu) son N gün içinde almış adresleri çıkar"""
+        days = self.history_skip_days_spin.value()
+        allowed, skipped_count = self.contact_history.filter_recent(recipients, subject.strip(), days)
+        if skipped_count:
+            self.logger.info(f"{skipped_count} alıcı aynı şablonu son {days} gün içinde aldığı için atlandı")
+        return allowed
+
+    def record_contact_history(self, sent_recipients, failed_recipients, subject):
+        """Başarılı gönderimleri gönderim geçmişine yaz"""
+        failed = set(failed_recipients)
+        self.contact_history.record_many((r for r in sent_recipients if r not in failed), subject.strip())
+
+    def show_suppression_menu(self, button):
+        """Engelleme listesi işlemleri menüsü"""
+        menu = QMenu(self)
+        menu.addAction(f"Engelli adres sayısı: {len(self.suppression_list)}").setEnabled(False)
+        menu.addSeparator()
+        menu.addAction("Seçili Alıcıları Engelle", self.suppress_selected_recipients)
+        menu.addAction("Dosyadan İçe Aktar...", self.import_suppression_file)
+        menu.addAction("Dışa Aktar...", self.export_suppression_file)
+        menu.exec_(button.mapToGlobal(button.rect().bottomLeft()))
+
+    def suppress_selected_recipients(self):
+        """Alıcı listesinde seçili adresleri engelleme listesine ekle"""
+        rows = sorted({index.row() for index in self.recipient_list.selectionModel().selectedIndexes()})
+        if not rows:
+            QMessageBox.warning(self, "Uyarı", "Lütfen engellenecek alıcıları seçin!")
+            return
+        emails = [self.recipient_store.emails[row] for row in rows]
+        added = self.suppression_list.add_many(emails, reason="manuel")
+        for email in emails:
+            self.recipient_model.set_status(email, "Engellendi")
+        QMessageBox.information(self, "Bilgi", f"{added} adres engelleme listesine eklendi.")
+
+    def import_suppression_file(self):
+        """Engelleme listesini dosyadan (TXT/CSV/TSV) akış halinde içe aktar"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Engelleme Listesi İçe Aktar", "",
+                                                   "Metin/CSV Dosyaları (*.txt *.csv *.tsv);;Tüm Dosyalar (*)")
+        if not file_path:
+            return
+        try:
+            added = self.suppression_list.import_file(file_path)
+            QMessageBox.information(self, "Bilgi", f"{added} yeni adres engelleme listesine eklendi.")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Engelleme listesi içe aktarılamadı: {e}")
+
+    def export_suppression_file(self):
+        """Engelleme listesini dosyaya dışa aktar"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Engelleme Listesi Dışa Aktar", "engelleme_listesi.tsv",
+                                                   "TSV Dosyaları (*.tsv);;Tüm Dosyalar (*)")
+        if not file_path:
+            return
+        try:
+            count = self.suppression_list.export_file(file_path)
+            QMessageBox.information(self, "Bilgi", f"{count} adres dışa aktarıldı.")
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Engelleme listesi dışa aktarılamadı: {e}")
+
+    def get_attachment_offloader(self):
+        """Büyük ek paylaşımı açıksa dosya sunucusunu başlatıp offloader'ı döndür - kapalıysa None"""
+        if not self.offload_enabled_check.isChecked():
+            return None
+        base_url = self.offload_base_url_edit.text().strip()
+        if not base_url:
+            self.logger.warning("Büyük ek paylaşımı açık ama genel adres girilmemiş - ekler e-postaya eklenecek")
+            return None
+        threshold = self.offload_threshold_spin.value() * 1024 * 1024
+        port = self.offload_port_spin.value()
+        offloader = self.attachment_offloader
+        if offloader is None or offloader.base_url != base_url.rstrip("/") or offloader.port != port:
+            if offloader is not None:
+                offloader.stop()
+            offloader = AttachmentOffloader(base_url, self.hosted_file_registry, threshold, port=port)
+            self.attachment_offloader = offloader
+        offloader.threshold = threshold
+        try:
+            offloader.ensure_server()
+        except Exception as e:
+            self.logger.error(f"Dosya paylaşım sunucusu başlatılamadı: {e}")
+            self.attachment_offloader = None
+            return None
+        return offloader
+
+    def get_message_tracker(self):
+        """Takip açıksa (gerekirse uygulama içi sunucuyu başlatıp) MessageTracker döndür - kapalıysa None"""
+        if not self.tracking_enabled_check.isChecked():
+            return None
+        base_url = self.tracking_base_url_edit.text().strip()
+        if not base_url:
+            self.logger.warning("Takip açık ama genel adres girilmemiş - takip pikseli eklenmeyecek")
+            return None
+        if self.tracking_embedded_check.isChecked():
+            port = self.tracking_port_spin.value()
+            if self.tracking_server is not None and self.tracking_server.port != port:
+                self.tracking_server.stop()
+                self.tracking_server = None
+            try:
+                if self.tracking_server is None:
+                    self.tracking_server = BackgroundServer(create_tracking_app(self.tracking_store), port=port)
+                self.tracking_server.start()
+            except Exception as e:
+                self.logger.error(f"Takip sunucusu başlatılamadı: {e}")
+                self.tracking_server = None
+                return None
+        track_clicks = self.tracking_clicks_check.isChecked()
+        tracker = self.message_tracker
+        if tracker is None or tracker.base_url != base_url.rstrip("/") or tracker.track_clicks != track_clicks:
+            tracker = MessageTracker(base_url, self.tracking_store, track_clicks)
+            self.message_tracker = tracker
+        return tracker
+
+    def get_message_options(self):
+        """send_email_smtp için ayarlardan gelen mesaj seçenekleri (görsel, büyük ek, takip)"""
+        return {
+            'attach_image_originals': self.attach_image_originals_check.isChecked(),
+            'offloader': self.get_attachment_offloader(),
+            'tracker': self.get_message_tracker(),
+        }
+
+    def closeEvent(self, event):
+        """Kapanışta çalışan işi durdur, takip kayıtlarını diske yaz ve gömülü sunucuları durdur"""
+        self.closing = True
+        worker = self.job_worker
+        if self.stop_running_job() and worker.wait(60000) and worker.result is not None:
+            # Gönderilenler işe işlenir; yoksa kira bitince aynı alıcılara tekrar gönderilirdi
+            try:
+                self.engine.finish_job_run_result(worker.job, worker.result, self.job_reservation)
+            except Exception as e:
+                self.logger.error(f"Zamanlanmış iş sonucu işlenirken hata: {e}")
+        try:
+            # Tampondaki belirteç/olaylar yazılmazsa sonraki açılma/tıklamalar eşleşmez
+            self.tracking_store.stop()
+        except Exception as e:
+            self.logger.error(f"Takip kayıtları yazılamadı: {e}")
+        for server in (self.tracking_server, self.attachment_offloader):
+            if server is not None:
+                try:
+                    server.stop()
+                except Exception as e:
+                    self.logger.error(f"Sunucu durdurulamadı: {e}")
+        self.tracking_server = None
+        self.attachment_offloader = None
+        self.engine.close()
+        super().closeEvent(event)
+
+    def process_tracking_events(self):
+        """Takip sunucusundan gelen ilk açılma/tıklama olaylarını logla"""
+        for kind, email, campaign in self.tracking_store.drain_notifications():
+            if kind == "open":
+                self.logger.info(f"E-POSTA OKUNDU: {email} - {campaign}")
+            else:
+                self.logger.info(f"Bağlantı tıklandı: {email} - {campaign}")
+
+    def show_tracking_stats(self):
+        """Kampanya başına açılma/tıklama oranlarını göster"""
+        stats = self.tracking_store.get_campaign_stats()
+        if not stats:
+            QMessageBox.information(self, "Kampanya İstatistikleri", "Henüz takip edilen gönderim yok.")
+            return
+        lines = []
+        for campaign, item in stats.items():
+            open_rate = item['opened'] * 100 / item['sent'] if item['sent'] else 0
+            lines.append(f"{campaign}: {item['sent']} gönderim, {item['opened']} açılma (%{open_rate:.1f}), "
+                         f"{item['clicked']} tıklayan ({item['clicks']} tıklama)")
+        QMessageBox.information(self, "Kampanya İstatistikleri", "\n".join(lines))
+
+    def update_bounce_timer(self, *args):
+        """Posta kutusu yoklama timer'ını ayarlara göre başlat/durdur"""
+        if not hasattr(self, 'bounce_timer'):
+            return
+        if self.bounce_enabled_check.isChecked():
+            self.bounce_timer.start(self.bounce_interval_spin.value() * 60 * 1000)
+        else:
+            self.bounce_timer.stop()
+
+    def check_bounces(self, manual=False):
+        """Posta kutusundaki yeni geri dönüş/okundu bilgilerini arka planda işle"""
+        if self.bounce_worker and self.bounce_worker.isRunning():
+            return
+        sender_email = self.sender_email_edit.text().strip()
+        sender_password = self.sender_password_edit.text().strip()
+        if not sender_email or not sender_password:
+            if manual:
+                QMessageBox.warning(self, "Uyarı", "SMTP ayarları eksik! Posta kutusu için aynı hesap kullanılır.")
+            return
+        host = self.imap_server_edit.text().strip() or imap_host_for(self.smtp_server_edit.text())
+        port = int(self.imap_port_edit.text()) if self.imap_port_edit.text().strip().isdigit() else 993
+        mailbox = IMAPMailbox(host, sender_email, sender_password, port=port, use_ssl=(port == 993))
+        
+        worker = BounceCheckWorker(BounceProcessor(mailbox, self.suppression_list), parent=self)
+        worker.check_finished.connect(lambda events: self.on_bounce_check_finished(events, manual))
+        worker.check_failed.connect(lambda error: self.on_bounce_check_failed(error, manual))
+        self.bounce_worker = worker
+        worker.start()
+
+    def on_bounce_check_finished(self, events, manual=False):
+        """Geri dönüş/okundu olaylarını alıcı durumlarına ve loglara yansıt"""
+        counts = {'bounce': 0, 'delayed': 0, 'read': 0}
+        # Durumlar işlemcinin durum dosyasına da yazıldı - listede olmayanlar sonradan eklenince uygulanır
+        self.recipient_store.known_statuses = self.bounce_worker.processor.state['recipients']
+        for event in events:
+            counts[event['type']] += 1
+            if event['type'] == 'read':
+                self.logger.info(f"E-POSTA OKUNDU: {event['email']}")
+            elif event['type'] == 'bounce':
+                self.logger.warning(f"E-posta geri döndü: {event['email']} ({event['status']}) {event['detail']}")
+            self.recipient_model.set_status(event['email'], event_status(event))
+        if events or manual:
+            self.logger.info(f"Posta kutusu işlendi - geri dönüş: {counts['bounce']}, "
+                             f"gecikme: {counts['delayed']}, okundu: {counts['read']}")
+        if manual:
+            QMessageBox.information(self, "Posta Kutusu",
+                f"{counts['bounce']} geri dönüş, {counts['delayed']} gecikme, {counts['read']} okundu bilgisi işlendi.")
+
+    def on_bounce_check_failed(self, error, manual=False):
+        self.logger.error(f"Posta kutusu kontrol edilemedi: {error}")
+        if manual:
+            QMessageBox.critical(self, "Hata", f"Posta kutusu kontrol edilemedi: {error}")
+
+    def show_download_stats(self):
+        """Bağlantı ile paylaşılan dosyaların indirme istatistiklerini göster"""
+        stats = self.hosted_file_registry.get_download_stats()
+        if not stats:
+            QMessageBox.information(self, "İndirme İstatistikleri", "Henüz bağlantı ile paylaşılan dosya yok.")
+            return
+        lines = [f"{item['name']} ({item['size'] / (1024 * 1024):.1f} MB): "
+                 f"{item['downloads']} indirme, {item['recipients']} farklı alıcı" for item in stats]
+        QMessageBox.information(self, "İndirme İstatistikleri", "\n".join(lines))
+
+    def get_recipient_context(self, email):
+        """Alıcının kişiselleştirme alanları ({{firma_adi}}, {{yetkili_adi}} ...)
+        
+        SQL gönderim kuyruğu doluysa alanlar kuyruk oluşturulurken seçilen sütunlardan gelir.
+        """
+        if self.send_queue:
+            context = dict(self.send_queue_contexts.get(email, {}))
+            context['email'] = email
+            return context
+        return self.recipient_store.get_context(email)
 
     def get_recipient_list(self):
-        """Alıcı listesini döndür"""
-        recipients = []
-        for row in range(self.recipient_list.rowCount()):
-            email = self.recipient_list.item(row, 0).text()
-            if email:
-                recipients.append(email)
-        return recipients
+        """Alıcı listesini döndür (kopyasız - değiştirilmemeli)
+        
+        SQL gönderim kuyruğu doluysa o, değilse RecipientStore'un e-posta dizisi döner.
+        """
+        if self.send_queue:
+            return self.send_queue
+        return self.recipient_store.emails
         
     def send_email_with_attachments(self, subject, body, attachment_table):
         """Ek dosyalarla e-posta gönder (SMTP kullanarak) - Gelişmiş limit kontrolü"""
@@ -4922,12 +5265,9 @@ class MainWindow(QMainWindow):
                 if not vcard_image_path or not os.path.exists(vcard_image_path):
                     vcard_image_path = None
             
-            # Alıcı listesini al
-            recipients = []
-            for row in range(self.recipient_list.rowCount()):
-                email = self.recipient_list.item(row, 0).text()
-                if email:
-                    recipients.append(email)
+            # Alıcı listesini al (geçersiz, engelli ve yakın zamanda aynı şablonu almış adresler
+            # gönderimden hemen önce çıkarılır)
+            recipients = self.prepare_recipients(self.get_recipient_list(), subject)
             
             if not recipients:
                 QMessageBox.warning(self, "Uyarı", "Alıcı listesi boş!")
@@ -4939,6 +5279,10 @@ class MainWindow(QMainWindow):
             # HTML formatında gönder
             is_html = True
             
+            # Mesaj boyutu sağlayıcı sınırını aşıyorsa uyar
+            if not self.confirm_message_size(body_with_signature, attachments, vcard_image_path):
+                return
+            
             # Güvenli gönderim sayısını hesapla
             safe_count, message = self.calculate_safe_sending_count(len(recipients))
             
@@ -4951,13 +5295,19 @@ class MainWindow(QMainWindow):
                 reply = QMessageBox.question(self, "Limit Bilgisi", 
                     f"{message}\n\n"
                     f"Şimdi {safe_count} e-posta gönderilecek.\n"
-                    f"Kalan {len(recipients) - safe_count} e-posta için 1 saat sonra otomatik devam edilecek.\n\n"
+                    f"Kalan {len(recipients) - safe_count} e-posta için gönderim limiti açıldığında otomatik devam edilecek.\n\n"
                     f"Devam etmek istiyor musunuz?",
                     QMessageBox.Yes | QMessageBox.No)
                 
                 if reply == QMessageBox.No:
                     return
             
+            # Kapasite gönderimden hemen önce ayrılır (servis aynı anda gönderiyor olabilir)
+            safe_count, message, reservation = self.limiter.reserve(len(recipients))
+            if safe_count == 0:
+                QMessageBox.warning(self, "Limit Uyarısı", message)
+                return
+            
             # Şimdi gönderilecek alıcıları seç
             recipients_to_send_now = recipients[:safe_count]
             recipients_to_send_later = recipients[safe_count:]
@@ -4969,6 +5319,9 @@ class MainWindow(QMainWindow):
                 "attachment_count": len(attachments)
             }
             
+            # Mesaj seçenekleri (takip, büyük ek sunucusu) kampanya başına bir kez hazırlanır
+            message_options = self.get_message_options()
+            
             # E-postaları gönder
             success_count = 0
             failed_recipients = []
@@ -4979,7 +5332,8 @@ class MainWindow(QMainWindow):
                 for j, recipient in enumerate(recipients_to_send_now):
                     try:
                         self.logger.info(f"BCC e-posta gönderiliyor ({j+1}/{len(recipients_to_send_now)}): {recipient}")
-                        if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, is_html, vcard_image_path):
+                        if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, is_html, vcard_image_path, self.get_recipient_context(recipient),
+                                          **message_options):
                             success_count += 1
                             self.logger.info(f"BCC e-posta gönderildi: {recipient}")
                         else:
@@ -5015,7 +5369,8 @@ class MainWindow(QMainWindow):
                 for j, recipient in enumerate(recipients_to_send_now):
                     try:
                         self.logger.info(f"E-posta gönderiliyor ({j+1}/{len(recipients_to_send_now)}): {recipient}")
-                        if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, is_html, vcard_image_path):
+                        if send_email_smtp(subject, body_with_signature, recipient, attachments, smtp_settings, is_html, vcard_image_path, self.get_recipient_context(recipient),
+                                          **message_options):
                             success_count += 1
                             self.logger.info(f"E-posta gönderildi: {recipient}")
                         else:
@@ -5030,9 +5385,11 @@ class MainWindow(QMainWindow):
                         self.logger.info(f"Sonraki e-posta için {email_delay} saniye bekleniyor...")
                         time.sleep(email_delay)
                 
-                    # Gönderim sayılarını güncelle
+            # Gönderilmeyenlerin kapasitesi geri bırakılır
+            self.limiter.settle(reservation, success_count)
+            self.update_sending_stats_display()
             if success_count > 0:
-                    self.update_sending_counters(success_count)
+                self.record_contact_history(recipients_to_send_now, failed_recipients, subject)
 
             # Batch tamamlama logu - Sadece batch logu, çift kayıt yok
             batch_details = f"Toplam {len(recipients_to_send_now)} alıcıya gönderim tamamlandı. "
@@ -5061,7 +5418,7 @@ class MainWindow(QMainWindow):
             # Kalan alıcılar varsa, zamanlayıcı başlat
             if recipients_to_send_later:
                 self.schedule_remaining_emails(subject, body_with_signature, recipients_to_send_later, attachments, smtp_settings)
-                success_message += f"\n\nKalan {len(recipients_to_send_later)} alıcı için 1 saat sonra otomatik devam edilecek."
+                success_message += f"\n\nKalan {len(recipients_to_send_later)} alıcı için gönderim limiti açıldığında otomatik devam edilecek."
 
             if success_count > 0:
                 self.play_notification_sound(success=True)
@@ -5115,43 +5472,21 @@ class MainWindow(QMainWindow):
     def add_imported_contacts_to_list(self, contacts):
         """İçe aktarılan kişileri alıcı listesine ekle"""
         try:
-            added_count = 0
-            duplicate_count = 0
-            
-            # Mevcut alıcı e-postalarını kontrol için set oluştur
-            existing_emails = set()
-            for row in range(self.recipient_list.rowCount()):
-                email = self.recipient_list.item(row, 0).text().strip()
-                if email:
-                    existing_emails.add(email.lower())
-            
-            # İçe aktarılan kişileri ekle
-            for contact in contacts:
-                email = contact.get('email', '').strip()
-                name = contact.get('name', '').strip()
-                
-                if email and '@' in email:
-                    email_lower = email.lower()
-                    if email_lower not in existing_emails:
-                        # Yeni alıcı ekle
-                        row = self.recipient_list.rowCount()
-                        self.recipient_list.insertRow(row)
-                        
-                        self.recipient_list.setItem(row, 0, QTableWidgetItem(email))
-                        self.recipient_list.setItem(row, 1, QTableWidgetItem(name))
-                        self.recipient_list.setItem(row, 2, QTableWidgetItem("Aktif"))
-                        
-                        existing_emails.add(email_lower)
-                        added_count += 1
-                    else:
-                        duplicate_count += 1
+            # İçe aktarılan kişileri tek seferde ekle (mükerrer kontrolü RecipientStore'da)
+            added_count, duplicate_count, suppressed_count = self.recipient_model.add_recipients(
+                (contact.get('email', ''), contact.get('name', '').strip()) for contact in contacts
+            )
             
             # Sonuç mesajı göster
             if added_count > 0:
                 message = f"{added_count} yeni alıcı eklendi."
                 if duplicate_count > 0:
                     message += f" {duplicate_count} mükerrer e-posta atlandı."
+                if suppressed_count > 0:
+                    message += f" {suppressed_count} engelli e-posta atlandı."
                 QMessageBox.information(self, "Başarılı", message)
+            elif suppressed_count > 0:
+                QMessageBox.information(self, "Bilgi", f"Eklenebilecek yeni e-posta adresi bulunamadı ({suppressed_count} adres engelleme listesinde).")
             else:
                 QMessageBox.information(self, "Bilgi", "Eklenebilecek yeni e-posta adresi bulunamadı.")
                 
@@ -5163,7 +5498,7 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(self, "Onay", "Alıcı listesini temizlemek istediğinizden emin misiniz?",
                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.recipient_list.setRowCount(0)
+            self.recipient_model.clear()
             QMessageBox.information(self, "Bilgi", "Alıcı listesi temizlendi!")
 
     def switch_to_email_tab(self):
@@ -5233,6 +5568,13 @@ class MainWindow(QMainWindow):
                 daily_limit = int(schedule.get("daily_limit", 150))
                 limit_enabled = schedule.get("limit_enabled", True)
                 email_delay = int(schedule.get("email_delay_schedule", 3))
+                history_skip_days = int(schedule.get("history_skip_days", 0))
+                if hasattr(self, 'spread_check'):
+                    self.spread_check.setChecked(schedule.get("spread_enabled", False))
+                    self.spread_weekdays_check.setChecked(schedule.get("spread_weekdays_only", True))
+                    self.spread_start_hour_spin.setValue(int(schedule.get("spread_start_hour", 9)))
+                    self.spread_end_hour_spin.setValue(int(schedule.get("spread_end_hour", 18)))
+                    self.spread_jitter_spin.setValue(int(schedule.get("spread_jitter", 30)))
             else:
                 # Eski settings bölümünden yükle (geriye uyumluluk)
                 config = self.config_manager.load_config()
@@ -5242,12 +5584,14 @@ class MainWindow(QMainWindow):
                     daily_limit = int(s.get("daily_limit", 150))
                     limit_enabled = s.get("limit_enabled", True)
                     email_delay = int(s.get("email_delay_schedule", 3))
+                    history_skip_days = 0
                 else:
                     # Varsayılan değerler
                     hourly_limit = 30
                     daily_limit = 150
                     limit_enabled = True
                     email_delay = 3
+                    history_skip_days = 0
 
             if hasattr(self, 'hourly_limit_spin'):
                 self.hourly_limit_spin.setValue(hourly_limit)
@@ -5257,6 +5601,8 @@ class MainWindow(QMainWindow):
                 self.limit_check.setChecked(limit_enabled)
             if hasattr(self, 'email_delay_spin_schedule'):
                 self.email_delay_spin_schedule.setValue(email_delay)
+            if hasattr(self, 'history_skip_days_spin'):
+                self.history_skip_days_spin.setValue(history_skip_days)
 
             # İstatistikleri güncelle
             if hasattr(self, 'hourly_sent_label') and hasattr(self, 'daily_sent_label'):
@@ -5282,6 +5628,12 @@ class MainWindow(QMainWindow):
                 "daily_limit": str(daily_limit),
                 "limit_enabled": limit_enabled,
                 "email_delay_schedule": str(email_delay),
+                "history_skip_days": str(self.history_skip_days_spin.value()),
+                "spread_enabled": self.spread_check.isChecked(),
+                "spread_weekdays_only": self.spread_weekdays_check.isChecked(),
+                "spread_start_hour": str(self.spread_start_hour_spin.value()),
+                "spread_end_hour": str(self.spread_end_hour_spin.value()),
+                "spread_jitter": str(self.spread_jitter_spin.value()),
             }
             
             # Kaydet
@@ -5383,51 +5735,157 @@ class MainWindow(QMainWindow):
         # Eşleştirmeyi kaydet
         self.mapping_manager.save_mapping(table_name, mapping)
         
+        # Eşleştirilen sütunlar değişmiş olabilir, tablo önbelleğini yenile
+        self.database_manager.invalidate_cache(table_name)
+        if self.filter_tablo_adi.currentText() == table_name:
+            self.update_filter_value_comboboxes()
+        
         QMessageBox.information(self, "Başarılı", 
             f"'{table_name}' tablosu için {len(mapping)} alan eşleştirmesi kaydedildi!\n"
             "Bu eşleştirme kalıcı olarak saklanacak ve program her açıldığında kullanılacak.")
 
-    def get_filtered_data_with_mapping(self, table_name, il, sektor, email_filter, mapping):
-        """Eşleştirme ile filtrelenmiş veri getir"""
-        conn = self.database_manager.conn
-        cur = conn.cursor()
+    def analyze_table_indexes(self):
+        """Eşleştirme tablosunun filtre ve e-posta sütunlarında eksik indeksleri listele"""
+        table_name = self.mapping_table_combo.currentText()
+        if not table_name:
+            QMessageBox.warning(self, "Uyarı", "Lütfen önce bir tablo seçin!")
+            return
         
-        # SQL sütunlarını al
-        cur.execute(f"""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = '{table_name}' 
-            ORDER BY ordinal_position
-        """)
-        sql_columns = [row[0] for row in cur.fetchall()]
+        if not self.database_manager.get_connection(self):
+            QMessageBox.critical(self, "Hata", "Veritabanı bağlantısı kurulamadı!")
+            return
         
-        # Eşleştirilmiş sütunları bul
-        mapped_columns = []
-        for fixed_field in self.mapping_manager.fixed_fields:
-            sql_field = mapping.get(fixed_field, "")
-            if sql_field and sql_field in sql_columns:
-                mapped_columns.append(sql_field)
+        il_column, sektor_column = self.get_filter_columns(table_name)
+        mapping = self.mapping_manager.get_mapping(table_name)
+        email_columns = [mapping.get("E-posta-1", "e_posta_1"), mapping.get("E-posta 2", "e_posta_2")]
+        
+        # Sadece tabloda gerçekten var olan sütunlar için öneri yap
+        columns, error = self.database_manager.get_table_columns(table_name)
+        if error:
+            QMessageBox.critical(self, "Hata", f"Sütunlar alınamadı: {error}")
+            return
+        filter_columns = [col for col in (il_column, sektor_column) if col in columns]
+        email_columns = [col for col in email_columns if col in columns]
+        
+        suggestions, error = self.database_manager.suggest_indexes(table_name, filter_columns, email_columns)
+        if error:
+            QMessageBox.critical(self, "Hata", f"İndeks analizi başarısız: {error}")
+            return
+        
+        self.index_suggestions = suggestions
+        self.index_suggestion_list.clear()
+        kind_labels = {'btree': "eşitlik/önek", 'trgm': "ILIKE (pg_trgm GIN)", 'lower': "lower() ifade"}
+        for suggestion in suggestions:
+            self.index_suggestion_list.addItem(f"{suggestion['column']} - {kind_labels[suggestion['kind']]}: {suggestion['name']}")
+        self.index_suggestion_list.selectAll()
+        self.create_index_btn.setEnabled(len(suggestions) > 0)
+        
+        if not suggestions:
+            QMessageBox.information(self, "Bilgi", f"'{table_name}' tablosunda eksik indeks bulunamadı.")
+    
+    def create_selected_indexes(self):
+        """Seçili önerilen indeksleri oluştur ve öncesi/sonrası sorgu süresini göster"""
+        selected_rows = sorted(index.row() for index in self.index_suggestion_list.selectedIndexes())
+        if not selected_rows:
+            QMessageBox.warning(self, "Uyarı", "Lütfen oluşturulacak indeksleri seçin!")
+            return
+        
+        before, _ = self.explain_last_filter_query()
+        
+        created = 0
+        errors = []
+        for row in selected_rows:
+            success, error = self.database_manager.create_suggested_index(self.index_suggestions[row])
+            if success:
+                created += 1
             else:
-                mapped_columns.append("NULL")  # Eşleşmeyen alanlar için
+                errors.append(error)
+        
+        after, _ = self.explain_last_filter_query()
+        if before and after:
+            self.explain_label.setText(
+                f"Sorgu süresi: {before['execution_ms']:.1f} ms ({', '.join(before['scans'])}) → "
+                f"{after['execution_ms']:.1f} ms ({', '.join(after['scans'])})")
+        
+        self.analyze_table_indexes()
+        
+        if errors:
+            QMessageBox.warning(self, "Uyarı", f"{created} indeks oluşturuldu, {len(errors)} hata:\n" + "\n".join(errors))
+        else:
+            QMessageBox.information(self, "Başarılı", f"{created} indeks oluşturuldu.")
+    
+    def explain_last_filter_query(self):
+        """Son filtre sorgusunu EXPLAIN ANALYZE ile ölç"""
+        if not self.last_filter_query:
+            return None, "Henüz filtreleme yapılmadı"
+        query, params = self.last_filter_query
+        return self.database_manager.explain_query(query, params)
+    
+    def measure_last_filter_query(self):
+        """Son filtre sorgusunun süresini ve tarama tipini göster"""
+        result, error = self.explain_last_filter_query()
+        if error:
+            QMessageBox.warning(self, "Uyarı", f"Sorgu ölçülemedi: {error}")
+            return
+        self.explain_label.setText(
+            f"Sorgu süresi: {result['execution_ms']:.1f} ms "
+            f"(planlama {result['planning_ms']:.1f} ms) - {', '.join(result['scans']) or 'tarama yok'}")
+
+    def describe_filter_shape(self, table_name, query):
+        """Tanılama görünümü için sorgu şeklini kısa metin olarak döndür"""
+        where = query.split(" WHERE ", 1)[1].split(" ORDER BY ", 1)[0].strip() if " WHERE " in query else "koşulsuz"
+        return f"{table_name}: {where}"
+
+    def refresh_query_stats(self):
+        """Sorgu şekli istatistik tablosunu güncelle (en yavaş şekil en üstte)"""
+        stats = self.database_manager.get_query_stats()
+        self.query_stats_table.setRowCount(len(stats))
+        for row, stat in enumerate(stats):
+            self.query_stats_table.setItem(row, 0, QTableWidgetItem(stat['shape']))
+            self.query_stats_table.setItem(row, 1, QTableWidgetItem(str(stat['count'])))
+            self.query_stats_table.setItem(row, 2, QTableWidgetItem(f"{stat['avg_ms']:.1f}"))
+            self.query_stats_table.setItem(row, 3, QTableWidgetItem(f"{stat['max_ms']:.1f}"))
+            self.query_stats_table.setItem(row, 4, QTableWidgetItem(f"{stat['last_ms']:.1f}"))
+            self.query_stats_table.setItem(row, 5, QTableWidgetItem(str(stat['rows'])))
+
+    def get_filtered_data_with_mapping(self, table_name, il, sektor, email_filter, mapping):
+        """Eşleştirme ile filtrelenmiş veri getir - satırlar doğrudan sabit başlık sırasında gelir"""
+        query, params = self.build_mapped_filter_query(table_name, il, sektor, email_filter, mapping)
         
-        # Sorgu oluştur
-        select_clause = ", ".join([f'"{col}"' if col != "NULL" else "NULL" for col in mapped_columns])
-        query = f'SELECT {select_clause} FROM "{table_name}"'
+        print(f"Eşleştirme sorgusu: {query}")
+        # İndeks danışmanındaki EXPLAIN ölçümü için son filtre sorgusunu sakla
+        self.last_filter_query = (query, list(params))
+        
+        # Aynı şekildeki sorgular sunucu tarafında bir kez hazırlanır (PREPARE/EXECUTE)
+        mapped_data, error = self.database_manager.execute_prepared(
+            query, params, shape=self.describe_filter_shape(table_name, query))
+        if error:
+            raise Exception(error)
+        self.refresh_query_stats()
+        
+        # SELECT zaten sabit başlık takma adlarıyla döndüğü için Python tarafında yeniden eşleştirme yok
+        return mapped_data, self.mapping_manager.fixed_fields
+
+    def build_filter_conditions(self, table_name, il, sektor, email_filter, mapping, sql_columns):
+        """il/sektör/e-posta filtre koşullarını (koşullar, parametreler) olarak oluştur"""
         conditions = []
         params = []
         
         # Filtreleme koşulları - eşleştirilmiş alanları kullan
+        # (Değer DISTINCT listesinden seçildiyse eşitlik, serbest metinse ILIKE kullanılır)
         if il and il.strip():
             il_field = mapping.get("il", "il")
             if il_field != "NULL" and il_field in sql_columns:
-                conditions.append(f'"{il_field}" ILIKE %s')
-                params.append(f"%{il}%")
+                condition, param = self.database_manager.build_match_condition(table_name, il_field, il)
+                conditions.append(condition)
+                params.append(param)
         
         if sektor and sektor.strip():
             sektor_field = mapping.get("Sektör", "sektor")
             if sektor_field != "NULL" and sektor_field in sql_columns:
-                conditions.append(f'"{sektor_field}" ILIKE %s')
-                params.append(f"%{sektor}%")
+                condition, param = self.database_manager.build_match_condition(table_name, sektor_field, sektor)
+                conditions.append(condition)
+                params.append(param)
         
         if email_filter:
             email1_field = mapping.get("E-posta-1", "e_posta_1")
@@ -5436,19 +5894,131 @@ class MainWindow(QMainWindow):
                 email_condition = f'("{email1_field}" IS NOT NULL AND "{email1_field}" <> \'\' OR "{email2_field}" IS NOT NULL AND "{email2_field}" <> \'\')'
                 conditions.append(email_condition)
         
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+        return conditions, params
+
+    def queue_filter_audience(self):
+        """Filtreye uyan tüm e-postaları SQL'de tekilleştirip doğrudan gönderim kuyruğuna al
         
-        print(f"Eşleştirme sorgusu: {query}")
-        cur.execute(query, params)
-        sql_data = cur.fetchall()
+        Satırlar arayüze yüklenmez; sonuç tablosu ve alıcı listesi atlanır.
+        """
+        table_name = self.filter_tablo_adi.currentText()
+        if not table_name:
+            QMessageBox.warning(self, "Uyarı", "Lütfen bir tablo adı seçin!")
+            return
         
-        # Eşleştirmeyi uygula
-        mapped_data, mapped_headers = self.mapping_manager.apply_mapping_to_data(
-            table_name, sql_data, mapped_columns
-        )
+        try:
+            if not self.database_manager.conn:
+                self.database_manager.connect_from_ui(self)
+            
+            sql_columns, error = self.database_manager.get_table_columns(table_name)
+            if error:
+                raise Exception(error)
+            
+            mapping = self.mapping_manager.get_mapping(table_name)
+            if not mapping:
+                # Eşleştirme yoksa eski yöntemdeki sütun adları (sektör sütunu algılanır)
+                il_column, sektor_column = self.get_filter_columns(table_name)
+                mapping = {"il": il_column, "Sektör": sektor_column or "sektor",
+                           "Firma Adı": "firma_adi", "Yetkili Adı Soyadı": "yetkili_adi_soyadi"}
+            
+            conditions, params = self.build_filter_conditions(
+                table_name, self.filter_il.currentText(), self.filter_sektor.currentText(), False, mapping, sql_columns)
+            email_columns = [col for col in (mapping.get("E-posta-1", "e_posta_1"), mapping.get("E-posta 2", "e_posta_2"))
+                             if col in sql_columns]
+            if not email_columns:
+                QMessageBox.warning(self, "Uyarı", "Tabloda e-posta sütunu bulunamadı!")
+                return
+            
+            # Kişiselleştirme alanları ({{firma_adi}} ...) e-postalarla birlikte seçilir
+            context_columns = {
+                'firma_adi': mapping.get("Firma Adı"),
+                'yetkili_adi': mapping.get("Yetkili Adı Soyadı"),
+                'il': mapping.get("il"),
+                'sektor': mapping.get("Sektör"),
+            }
+            context_columns = {field: col for field, col in context_columns.items() if col in sql_columns}
+            
+            send_queue = []
+            send_queue_contexts = {}
+            suppressed_count = 0
+            for batch in self.database_manager.stream_distinct_emails(table_name, email_columns, conditions, params,
+                                                                       context_columns=context_columns):
+                contexts = dict(batch)
+                allowed, suppressed = self.suppression_list.filter(list(contexts))
+                send_queue.extend(allowed)
+                suppressed_count += suppressed
+                for email in allowed:
+                    context = contexts[email]
+                    if context:
+                        firma_adi, yetkili_adi = context.get('firma_adi', ""), context.get('yetkili_adi', "")
+                        context['ad_soyad'] = f"{firma_adi} - {yetkili_adi}" if firma_adi and yetkili_adi else (firma_adi or yetkili_adi)
+                        send_queue_contexts[email] = context
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Gönderim kuyruğu oluşturulamadı: {e}")
+            print(f"Gönderim kuyruğu hatası detayı: {e}")
+            return
         
-        return mapped_data, mapped_headers
+        if not send_queue:
+            QMessageBox.information(self, "Bilgi", "Seçilen kriterlere uygun e-posta adresi bulunamadı.")
+            return
+        
+        self.send_queue = send_queue
+        self.send_queue_contexts = send_queue_contexts
+        self.update_send_queue_label()
+        QMessageBox.information(self, "Bilgi",
+            f"{len(send_queue)} benzersiz e-posta adresi gönderim kuyruğuna alındı"
+            f" ({suppressed_count} engelli adres atlandı).\n"
+            "Gönderim ve zamanlama, kuyruk temizlenene kadar alıcı listesi yerine bu kuyruğu kullanır.")
+        self.switch_to_email_tab()
+
+    def clear_send_queue(self):
+        """SQL gönderim kuyruğunu temizle - alıcı listesine geri dön"""
+        self.send_queue = []
+        self.send_queue_contexts = {}
+        self.update_send_queue_label()
+
+    def update_send_queue_label(self):
+        """Gönderim kuyruğu durum etiketini güncelle"""
+        if self.send_queue:
+            self.send_queue_label.setText(f"SQL gönderim kuyruğu aktif: {len(self.send_queue)} alıcı (alıcı listesi yerine kullanılır)")
+            self.send_queue_label.show()
+            self.clear_send_queue_btn.show()
+        else:
+            self.send_queue_label.hide()
+            self.clear_send_queue_btn.hide()
+
+    def build_mapped_filter_query(self, table_name, il, sektor, email_filter, mapping):
+        """Sabit başlık takma adlı (SELECT "x" AS "E-posta-1") filtre sorgusunu oluştur
+        
+        Sorgu metni (tablo, eşleştirme, filtre şekli) bazında önbelleğe alınır;
+        aynı şekil tekrar kullanıldığında yalnızca parametreler yeniden hesaplanır.
+        """
+        # Sütun listesi önbellekli (information_schema her filtrelemede sorgulanmaz)
+        sql_columns, error = self.database_manager.get_table_columns(table_name)
+        if error:
+            raise Exception(error)
+        
+        conditions, params = self.build_filter_conditions(table_name, il, sektor, email_filter, mapping, sql_columns)
+        
+        shape_key = (table_name, tuple(sorted(mapping.items())), tuple(conditions))
+        query = self.filter_query_cache.get(shape_key)
+        if query is None:
+            # Eşleşmeyen alanlar NULL, eşleşenler sabit başlık adıyla seçilir
+            select_items = []
+            for fixed_field in self.mapping_manager.fixed_fields:
+                sql_field = mapping.get(fixed_field, "")
+                if sql_field and sql_field in sql_columns:
+                    select_items.append(f'"{sql_field}" AS "{fixed_field}"')
+                else:
+                    select_items.append(f'NULL AS "{fixed_field}"')
+            
+            query = f'SELECT {", ".join(select_items)} FROM "{table_name}"'
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            self.filter_query_cache[shape_key] = query
+        
+        return query, params
 
     def get_filtered_data_old_method(self, table_name, il, sektor, email_filter):
         """Eski yöntemle filtrelenmiş veri getir"""
@@ -5501,12 +6071,14 @@ class MainWindow(QMainWindow):
         
         # Sadece dolu olan alanlar için filtreleme ekle
         if il and il.strip():
-            conditions.append("il ILIKE %s")
-            params.append(f"%{il}%")
+            condition, param = self.database_manager.build_match_condition(table_name, "il", il)
+            conditions.append(condition)
+            params.append(param)
             
         if sektor and sektor.strip():
-            conditions.append(f'"{sektor_column}" ILIKE %s')
-            params.append(f"%{sektor}%")
+            condition, param = self.database_manager.build_match_condition(table_name, sektor_column, sektor)
+            conditions.append(condition)
+            params.append(param)
         
         # E-posta filtresi - sadece e-posta adresi olanları göster
         if email_filter:
@@ -5519,12 +6091,135 @@ class MainWindow(QMainWindow):
         # Sıralama ekle
         query += f" ORDER BY il, {sektor_column}, \"{firma_adi_column}\""
         
-        cur.execute(query, params)
-        return cur.fetchall()
+        self.last_filter_query = (query, list(params))
+        cur.close()
+        results, error = self.database_manager.execute_prepared(
+            query, params, shape=self.describe_filter_shape(table_name, query) + " (eşleştirmesiz)")
+        if error:
+            raise Exception(error)
+        self.refresh_query_stats()
+        return results
+
+class ContactImportWorker(QThread):
+    """Kişi listesini arka planda parça parça ayrıştıran iş parçacığı"""
+    
+    progress = pyqtSignal(int, int)           # okunan satır, geçerli kişi
+    preview_ready = pyqtSignal(list)          # ilk N kişi
+    import_finished = pyqtSignal(list, int)   # tüm kişiler, okunan satır
+    import_failed = pyqtSignal(str)
+    
+    def __init__(self, file_path=None, text=None, preview_size=100, chunk_size=2000, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.text = text
+        self.preview_size = preview_size
+        self.chunk_size = chunk_size
+        self.remove_duplicates = True
+        # Ana penceredeki doğrulayıcı (alan adı önbelleği paylaşılır)
+        main_window = parent.parent() if parent is not None else None
+        self.validator = getattr(main_window, 'email_validator', None) or EmailValidator()
+    
+    def run(self):
+        try:
+            if self.file_path:
+                source = iter_file_contacts(self.file_path)
+            else:
+                source = iter_text_contacts(self.text or "")
+            
+            contacts = []
+            seen = set()
+            total = 0
+            preview_sent = False
+            for contact in source:
+                total += 1
+                email = contact['email']
+                # E-posta formatını kontrol et
+                if self.validator.validate(email)['valid']:
+                    email_lower = email.lower()
+                    if not self.remove_duplicates or email_lower not in seen:
+                        contacts.append(contact)
+                        seen.add(email_lower)
+                
+                if not preview_sent and len(contacts) >= self.preview_size:
+                    self.preview_ready.emit(contacts[:self.preview_size])
+                    preview_sent = True
+                if total % self.chunk_size == 0:
+                    self.progress.emit(total, len(contacts))
+                if self.isInterruptionRequested():
+                    return
+            
+            if not preview_sent:
+                self.preview_ready.emit(contacts[:self.preview_size])
+            self.import_finished.emit(contacts, total)
+            
+        except Exception as e:
+            self.import_failed.emit(str(e))
+
+class RecipientValidationWorker(QThread):
+    """Alıcı listesini (MX sorguları dahil) arayüzü dondurmadan doğrulayan iş parçacığı"""
+    
+    validation_finished = pyqtSignal(list)
+    validation_failed = pyqtSignal(str)
+    
+    def __init__(self, validator, emails, check_mx=False, parent=None):
+        super().__init__(parent)
+        self.validator = validator
+        self.emails = emails
+        self.check_mx = check_mx
+    
+    def run(self):
+        try:
+            self.validation_finished.emit(self.validator.validate_many(self.emails, self.check_mx))
+        except Exception as e:
+            self.validation_failed.emit(str(e))
+
+class BounceCheckWorker(QThread):
+    """Posta kutusunu (IMAP) arayüzü dondurmadan yoklayan iş parçacığı"""
+    
+    check_finished = pyqtSignal(list)
+    check_failed = pyqtSignal(str)
+    
+    def __init__(self, processor, parent=None):
+        super().__init__(parent)
+        self.processor = processor
+    
+    def run(self):
+        try:
+            self.check_finished.emit(self.processor.poll())
+        except Exception as e:
+            self.check_failed.emit(str(e))
+
+class ScheduledJobWorker(QThread):
+    """Zamanlanmış kampanya işinin bir dilimini arayüzü dondurmadan gönderen iş parçacığı"""
+    
+    log_message = pyqtSignal(str)
+    job_finished = pyqtSignal(dict, dict)
+    job_failed = pyqtSignal(dict, str)
+    
+    def __init__(self, runner, job, max_count, parent=None):
+        super().__init__(parent)
+        self.runner = runner
+        self.runner.log = self.log_message.emit
+        self.job = job
+        self.max_count = max_count
+        self.result = None
+    
+    def stop(self):
+        """Sıradaki alıcıdan önce dur - gönderilmeyenler işte kalır"""
+        self.runner.stop_requested = True
+    
+    def run(self):
+        try:
+            self.result = self.runner.run(self.job, self.max_count)
+            self.job_finished.emit(self.job, self.result)
+        except Exception as e:
+            self.job_failed.emit(self.job, str(e))
 
 class ManualImportDialog(QDialog):
     """Manuel import penceresi"""
     
+    PREVIEW_SIZE = 100
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Manuel İçe Aktar")
@@ -5532,6 +6227,7 @@ class ManualImportDialog(QDialog):
         self.setMinimumSize(500, 400)
         
         self.imported_contacts = []
+        self.import_worker = None
         self.init_ui()
         
     def init_ui(self):
@@ -5544,8 +6240,9 @@ class ManualImportDialog(QDialog):
         layout.addWidget(title_label)
         
         # Açıklama
-        desc_label = QLabel("Her satıra bir e-posta adresi yazın. İsteğe bağlı olarak ad soyad ekleyebilirsiniz:")
+        desc_label = QLabel("Her satıra bir e-posta adresi yazın veya CSV/TSV/Excel/vCard dosyası seçin. İsteğe bağlı olarak ad soyad ekleyebilirsiniz:")
         desc_label.setStyleSheet("color: #666; font-style: italic; font-size: 11px;")
+        desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
         
         # Format açıklaması
@@ -5558,8 +6255,8 @@ class ManualImportDialog(QDialog):
         self.contacts_text.setPlaceholderText("ornek@firma.com\nAhmet Yılmaz,ahmet@firma.com\ninfo@digerfirma.com")
         layout.addWidget(self.contacts_text)
         
-        # Doğrulanmış kişiler tablosu
-        validated_group = QGroupBox("Doğrulanmış Kişiler")
+        # Doğrulanmış kişiler tablosu (yalnızca önizleme)
+        validated_group = QGroupBox(f"Doğrulanmış Kişiler (ilk {self.PREVIEW_SIZE} kayıt önizlemesi)")
         validated_layout = QVBoxLayout(validated_group)
         
         self.validated_table = QTableWidget()
@@ -5569,6 +6266,13 @@ class ManualImportDialog(QDialog):
         
         layout.addWidget(validated_group)
         
+        # İlerleme çubuğu
+        self.import_progress = QProgressBar()
+        self.import_progress.setRange(0, 0)
+        self.import_progress.setTextVisible(False)
+        self.import_progress.hide()
+        layout.addWidget(self.import_progress)
+        
         # Özet bilgileri
         summary_layout = QHBoxLayout()
         
@@ -5588,6 +6292,13 @@ class ManualImportDialog(QDialog):
         
         # Butonlar
         button_layout = QHBoxLayout()
+        
+        file_btn = QPushButton("📂 Dosyadan Yükle")
+        file_btn.setStyleSheet("QPushButton { background-color: #607D8B; color: white; font-size: 12px; border: none; border-radius: 4px; padding: 8px 16px; } QPushButton:hover { background-color: #455A64; }")
+        file_btn.setToolTip("CSV, TSV, Excel (XLSX) veya vCard (VCF) dosyasından içe aktar")
+        file_btn.clicked.connect(self.import_from_file)
+        button_layout.addWidget(file_btn)
+        
         button_layout.addStretch()
         
         validate_btn = QPushButton("Doğrula")
@@ -5610,68 +6321,84 @@ class ManualImportDialog(QDialog):
         layout.addLayout(button_layout)
         
     def validate_contacts(self):
-        """Girilen e-posta adreslerini doğrula"""
-        try:
-            text = self.contacts_text.toPlainText().strip()
-            if not text:
-                QMessageBox.warning(self, "Uyarı", "Lütfen e-posta adresleri girin!")
-                return
-            
-            lines = text.split('\n')
-            contacts = []
-            duplicates = set()
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Virgül ile ayrılmış format kontrol et
-                if ',' in line:
-                    parts = line.split(',', 1)
-                    name = parts[0].strip()
-                    email = parts[1].strip()
-                else:
-                    # Sadece e-posta adresi
-                    email = line.strip()
-                    name = ""
-                
-                # E-posta formatını kontrol et
-                if '@' in email and '.' in email.split('@')[1]:
-                    email_lower = email.lower()
-                    if email_lower not in duplicates:
-                        contacts.append({
-                            'name': name,
-                            'email': email
-                        })
-                        duplicates.add(email_lower)
-            
-            # Tabloyu güncelle
-            self.validated_table.setRowCount(len(contacts))
-            for row, contact in enumerate(contacts):
-                self.validated_table.setItem(row, 0, QTableWidgetItem(contact['name']))
-                self.validated_table.setItem(row, 1, QTableWidgetItem(contact['email']))
-            
-            # Özet bilgileri güncelle
-            total_count = len(lines) - lines.count('')
-            duplicate_count = total_count - len(contacts)
-            
-            self.total_label.setText(f"Toplam: {total_count}")
-            self.duplicate_label.setText(f"Mükerrer: {duplicate_count}")
-            
-            # İçe aktar butonunu aktif hale getir
-            self.import_btn.setEnabled(len(contacts) > 0)
-            
-            # Sonuçları sakla
-            self.imported_contacts = contacts
-            
-            if len(contacts) > 0:
-                QMessageBox.information(self, "Başarılı", f"{len(contacts)} geçerli e-posta adresi bulundu!")
-            else:
-                QMessageBox.warning(self, "Uyarı", "Geçerli e-posta adresi bulunamadı!")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Doğrulama hatası: {e}")
+        """Girilen e-posta adreslerini arka planda doğrula"""
+        text = self.contacts_text.toPlainText().strip()
+        if not text:
+            QMessageBox.warning(self, "Uyarı", "Lütfen e-posta adresleri girin!")
+            return
+        self.start_import_worker(ContactImportWorker(text=text, preview_size=self.PREVIEW_SIZE, parent=self))
+    
+    def import_from_file(self):
+        """Dosyadan kişileri arka planda akış halinde içe aktar"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Kişi Dosyası Seç", "",
+            "Kişi Dosyaları (*.csv *.tsv *.txt *.xlsx *.vcf);;Tüm Dosyalar (*)")
+        if not file_path:
+            return
+        self.start_import_worker(ContactImportWorker(file_path=file_path, preview_size=self.PREVIEW_SIZE, parent=self))
+    
+    def start_import_worker(self, worker):
+        """Ayrıştırma iş parçacığını başlat"""
+        if self.import_worker and self.import_worker.isRunning():
+            QMessageBox.warning(self, "Uyarı", "İçe aktarma devam ediyor, lütfen bekleyin.")
+            return
+        
+        worker.remove_duplicates = self.remove_duplicates_check.isChecked()
+        worker.progress.connect(self.on_import_progress)
+        worker.preview_ready.connect(self.on_import_preview)
+        worker.import_finished.connect(self.on_import_finished)
+        worker.import_failed.connect(self.on_import_failed)
+        self.import_worker = worker
+        
+        self.import_btn.setEnabled(False)
+        self.imported_contacts = []
+        self.validated_table.setRowCount(0)
+        self.import_progress.show()
+        worker.start()
+    
+    def on_import_progress(self, total, valid):
+        """Parça parça ilerleme bilgisi"""
+        self.total_label.setText(f"Okunan: {total}")
+        self.duplicate_label.setText(f"Geçerli: {valid}")
+    
+    def on_import_preview(self, contacts):
+        """İlk N kişiyi önizleme tablosuna yaz"""
+        self.validated_table.setRowCount(len(contacts))
+        for row, contact in enumerate(contacts):
+            self.validated_table.setItem(row, 0, QTableWidgetItem(contact['name']))
+            self.validated_table.setItem(row, 1, QTableWidgetItem(contact['email']))
+    
+    def on_import_finished(self, contacts, total_count):
+        """Ayrıştırma tamamlandı - tüm liste widget'a değil doğrudan sonuca alınır"""
+        self.import_progress.hide()
+        
+        # Özet bilgileri güncelle
+        skipped_count = total_count - len(contacts)
+        self.total_label.setText(f"Toplam: {total_count}")
+        self.duplicate_label.setText(f"Mükerrer/Geçersiz: {skipped_count}")
+        
+        # İçe aktar butonunu aktif hale getir
+        self.import_btn.setEnabled(len(contacts) > 0)
+        
+        # Sonuçları sakla
+        self.imported_contacts = contacts
+        
+        if len(contacts) > 0:
+            QMessageBox.information(self, "Başarılı", f"{len(contacts)} geçerli e-posta adresi bulundu!")
+        else:
+            QMessageBox.warning(self, "Uyarı", "Geçerli e-posta adresi bulunamadı!")
+    
+    def on_import_failed(self, error):
+        """Ayrıştırma hatası"""
+        self.import_progress.hide()
+        QMessageBox.critical(self, "Hata", f"Doğrulama hatası: {error}")
+    
+    def reject(self):
+        """İptal edilirse arka plan işini durdur"""
+        if self.import_worker and self.import_worker.isRunning():
+            self.import_worker.requestInterruption()
+            self.import_worker.wait()
+        super().reject()
     
     def get_imported_contacts(self):
         """İçe aktarılan kişileri döndür"""
@@ -0,0 +1,125 @@
+import os
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+# Sağlayıcıların kabul ettiği yaklaşık en büyük mesaj boyutları (base64 kodlanmış, bayt)
+PROVIDER_SIZE_LIMITS = {
+    "gmail": 25 * 1024 * 1024,
+    "googlemail": 25 * 1024 * 1024,
+    "outlook": 20 * 1024 * 1024,
+    "office365": 35 * 1024 * 1024,
+    "hotmail": 20 * 1024 * 1024,
+    "yandex": 30 * 1024 * 1024,
+    "yahoo": 25 * 1024 * 1024,
+}
+DEFAULT_SIZE_LIMIT = 25 * 1024 * 1024
+
+
+def provider_size_limit(smtp_server):
+    """SMTP sunucu adından sağlayıcının mesaj boyutu sınırını tahmin et"""
+    server = (smtp_server or "").lower()
+    for name, limit in PROVIDER_SIZE_LIMITS.items():
+        if name in server:
+            return limit
+    return DEFAULT_SIZE_LIMIT
+
+
+def encoded_size(raw_size):
+    """base64 (76 karakterlik satırlarla) kodlanmış boyut"""
+    encoded = 4 * ((raw_size + 2) // 3)
+    return encoded + 2 * ((encoded + 75) // 76)
+
+
+class AttachmentStore:
+    """Ek dosya içerik önbelleği - içerik özetine göre anahtarlanmış LRU
+
+    Her dosya bir kez okunur, SHA-256 özeti alınır ve base64 kodlanmış hali saklanır.
+    Dosya yolu -> (mtime, boyut, özet) eşlemesi ile değişiklikler stat bilgisinden anlaşılır.
+    Toplam önbellek boyutu max_bytes ile sınırlıdır (en eski kullanılan çıkarılır).
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()   # özet -> kayıt
+        self._paths = {}                # yol -> (mtime, boyut, özet)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path):
+        """Dosyanın önbellekteki kaydını döndür - gerekirse diskten oku"""
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime, stat.st_size)
+
+        with self._lock:
+            known = self._paths.get(file_path)
+            if known and known[:2] == signature and known[2] in self._entries:
+                self._entries.move_to_end(known[2])
+                self.hits += 1
+                return self._entries[known[2]]
+
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        with self._lock:
+            self.misses += 1
+            self._paths[file_path] = (signature[0], signature[1], digest)
+            entry = self._entries.get(digest)
+            if entry is None:
+                encoded = base64.encodebytes(raw).decode('ascii')
+                entry = {
+                    'sha256': digest,
+                    'size': len(raw),
+                    'raw': raw,
+                    'base64': encoded,
+                }
+                self._entries[digest] = entry
+                self.current_bytes += len(raw) + len(encoded)
+                self._evict()
+            else:
+                self._entries.move_to_end(digest)
+            return entry
+
+    def _evict(self):
+        # Sınır aşıldıysa en eski kullanılanları çıkar (en az bir kayıt kalır)
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.current_bytes -= entry['size'] + len(entry['base64'])
+
+    def estimate_message_size(self, attachments, body="", inline_images=(), preview_images=(), previewer=None):
+        """Eklerin ve gövdenin kodlanmış toplam boyutunu tahmin et
+
+        attachments ve inline_images diske dokunmadan (stat ile) sayılır. preview_images
+        gövdeye küçültülmüş ön izleme olarak eklenen görsellerdir: previewer verilirse
+        gönderimde kullanılacak ön izlemenin boyutu sayılır (ön izleme önbelleğe alınır ve
+        gönderimde yeniden kullanılır), üretilemezse orijinal boyut.
+        """
+        total = encoded_size(len(body.encode('utf-8'))) * 2  # düz metin + HTML
+        for file_path in list(attachments) + list(inline_images):
+            if file_path and os.path.exists(file_path):
+                total += encoded_size(os.path.getsize(file_path))
+        for file_path in preview_images:
+            if not (file_path and os.path.exists(file_path)):
+                continue
+            preview = None
+            if previewer is not None:
+                preview = previewer.preview(self.get(file_path))
+            total += len(preview['base64']) if preview else encoded_size(os.path.getsize(file_path))
+        return total
+
+    def get_stats(self):
+        """Önbellek istatistikleri"""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+default_attachment_store = AttachmentStore()
@@ -0,0 +1,56 @@
+import os
+import subprocess
+from datetime import datetime
+
+
+def backup_database(database, backup_dir, log=print):
+    """PostgreSQL veritabanını pg_dump ile (düz SQL) yedekle - başarılıysa dosya yolunu döndürür
+
+    database: {'host', 'port', 'database', 'user', 'password'} (config.json 'database' bölümü)
+    """
+    if not backup_dir:
+        # Varsayılan backup dizini yoksa yedekleme yapma
+        log("UYARI: Backup dizini belirtilmemiş! Yedekleme yapılmayacak.")
+        return None
+
+    db_name = str(database.get('database', '')).strip()
+    user = str(database.get('user', '')).strip()
+    password = database.get('password', '')
+    host = str(database.get('host', '')).strip()
+    port = str(database.get('port', '')).strip()
+    if not all([db_name, user, password, host, port]):
+        log("Veritabanı bağlantı bilgileri eksik!")
+        return None
+
+    # Backup dizinini oluştur
+    os.makedirs(backup_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_file = os.path.join(backup_dir, f"veritabani_yedek_{timestamp}.sql")
+    # pg_dump komutu oluştur (plain text format)
+    cmd = [
+        'pg_dump',
+        '-h', host,
+        '-p', port,
+        '-U', user,
+        '-F', 'p',  # plain text format
+        '-f', backup_file,
+        db_name
+    ]
+    env = os.environ.copy()
+    env['PGPASSWORD'] = password
+    log(f"Yedekleme komutu: {' '.join(cmd)}")
+    log(f"Yedekleme dosyası: {backup_file}")
+
+    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        log(f"Yedekleme hatası: {result.stderr}")
+        return None
+    if not os.path.exists(backup_file):
+        log("HATA: Yedek dosyası oluşturulamadı!")
+        return None
+    file_size = os.path.getsize(backup_file)
+    log(f"Yedekleme başarılı! Dosya boyutu: {file_size} bytes")
+    if file_size == 0:
+        log("UYARI: Yedek dosyası 0 byte! Veritabanı bağlantısını kontrol edin.")
+        return None
+    return backup_file
@@ -0,0 +1,266 @@
+import os
+import re
+import json
+import imaplib
+import threading
+from email import message_from_bytes
+from email.utils import parseaddr
+
+from modules.suppression_list import normalize_email
+
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+'-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+STATUS_RE = re.compile(r"\b([245])\.\d{1,3}\.\d{1,3}\b")
+UIDVALIDITY_RE = re.compile(rb"UIDVALIDITY (\d+)")
+
+# Rapor biçiminde olmayan geri dönüşler yalnızca bu gönderenlerden kabul edilir
+# (konu tek başına yetmez: "Re: ... delivery failure" gibi müşteri yanıtları geri dönüş değildir)
+BOUNCE_SENDERS = ("mailer-daemon", "postmaster", "mail delivery")
+READ_SUBJECTS = ("read:", "okundu:", "okundu bilgisi", "read receipt")
+
+
+def imap_host_for(smtp_server):
+    """SMTP sunucusundan IMAP sunucusunu tahmin et (smtp.gmail.com -> imap.gmail.com)"""
+    smtp_server = (smtp_server or "").strip()
+    if smtp_server.startswith("smtp."):
+        return "imap." + smtp_server[5:]
+    if smtp_server.startswith("smtp-mail."):
+        return "outlook.office365.com"
+    return smtp_server
+
+
+def _report_fields(part):
+    """message/delivery-status veya disposition-notification parçasının alan bloklarını düz listeye çevir"""
+    payload = part.get_payload()
+    if isinstance(payload, list):
+        # Python e-posta ayrıştırıcısı alan bloklarını alt mesajlar olarak verir
+        return [dict((key.lower(), value) for key, value in block.items()) for block in payload]
+    fields = {}
+    for line in str(payload).splitlines():
+        if ':' in line:
+            key, value = line.split(':', 1)
+            fields[key.strip().lower()] = value.strip()
+    return [fields]
+
+
+def _address(value):
+    """'rfc822; ali@ornek.com' biçimindeki alandan adresi al"""
+    if not value:
+        return None
+    value = value.split(';', 1)[-1]
+    match = EMAIL_RE.search(value)
+    return normalize_email(match.group(0)) if match else None
+
+
+def parse_report(raw):
+    """DSN (geri dönüş) ve MDN (okundu bilgisi) mesajlarını çözümle
+
+    Dönüş: [{'type': 'bounce'|'delayed'|'read', 'email', 'status', 'permanent', 'detail'}]
+    Rapor değilse boş liste.
+    """
+    msg = message_from_bytes(raw) if isinstance(raw, bytes) else raw
+    events = []
+
+    if msg.get_content_type() == 'multipart/report':
+        report_type = (msg.get_param('report-type') or '').lower()
+        for part in msg.walk():
+            content_type = part.get_content_type()
+            if report_type == 'delivery-status' and content_type == 'message/delivery-status':
+                for fields in _report_fields(part):
+                    email = _address(fields.get('final-recipient') or fields.get('original-recipient'))
+                    if not email:
+                        continue
+                    action = (fields.get('action') or '').lower()
+                    status = (fields.get('status') or '').strip()
+                    if action == 'delayed' or status.startswith('4'):
+                        event_type, permanent = 'delayed', False
+                    elif action in ('delivered', 'relayed', 'expanded'):
+                        continue
+                    else:
+                        event_type, permanent = 'bounce', status.startswith('5') or action == 'failed'
+                    events.append({'type': event_type, 'email': email, 'status': status, 'permanent': permanent,
+                                   'detail': fields.get('diagnostic-code', '')})
+            elif report_type == 'disposition-notification' and content_type == 'message/disposition-notification':
+                for fields in _report_fields(part):
+                    email = _address(fields.get('final-recipient') or fields.get('original-recipient'))
+                    disposition = (fields.get('disposition') or '').lower()
+                    if email and 'displayed' in disposition:
+                        events.append({'type': 'read', 'email': email, 'status': '', 'permanent': False,
+                                       'detail': disposition})
+        if events:
+            return events
+
+    # Rapor biçiminde olmayan (eski tip) geri dönüşler için sezgisel çözümleme
+    sender = parseaddr(msg.get('From', ''))[1].lower()
+    subject = (msg.get('Subject') or '').lower()
+    if any(key in sender for key in BOUNCE_SENDERS):
+        text = _plain_text(msg)
+        status_match = STATUS_RE.search(text)
+        status = status_match.group(0) if status_match else ''
+        own = {normalize_email(addr) for addr in EMAIL_RE.findall(msg.get('To', ''))}
+        for email in dict.fromkeys(normalize_email(addr) for addr in EMAIL_RE.findall(text)):
+            if email in own or any(key in email for key in ("mailer-daemon", "postmaster")):
+                continue
+            # Durum kodu yoksa kalıcı sayılmaz (engelleme listesine eklenmez, yalnızca raporlanır)
+            events.append({'type': 'bounce', 'email': email, 'status': status,
+                           'permanent': status.startswith('5'), 'detail': subject})
+            break
+    elif subject.startswith(READ_SUBJECTS):
+        email = normalize_email(parseaddr(msg.get('From', ''))[1])
+        if email:
+            events.append({'type': 'read', 'email': email, 'status': '', 'permanent': False, 'detail': subject})
+    return events
+
+
+def _plain_text(msg):
+    parts = []
+    for part in msg.walk():
+        if part.get_content_maintype() == 'text':
+            try:
+                parts.append(part.get_payload(decode=True).decode(part.get_content_charset() or 'utf-8', 'ignore'))
+            except Exception:
+                continue
+    return "\n".join(parts)
+
+
+class IMAPMailbox:
+    """IMAP posta kutusu - yalnızca son görülen UID'den sonraki mesajları indirir"""
+
+    def __init__(self, host, username, password, port=993, folder="INBOX", use_ssl=True, timeout=30):
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.folder = folder
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+
+    def fetch_since(self, last_uid, uidvalidity=None, limit=500):
+        """(uidvalidity, [(uid, ham mesaj), ...]) döndür - UIDVALIDITY değiştiyse baştan başlar"""
+        if self.use_ssl:
+            connection = imaplib.IMAP4_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            connection = imaplib.IMAP4(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.login(self.username, self.password)
+            connection.select(self.folder, readonly=True)
+            status, data = connection.status(self.folder, "(UIDVALIDITY)")
+            match = UIDVALIDITY_RE.search(data[0]) if status == "OK" and data else None
+            current_validity = int(match.group(1)) if match else None
+            if uidvalidity is not None and current_validity != uidvalidity:
+                last_uid = 0
+
+            status, data = connection.uid("SEARCH", None, f"UID {last_uid + 1}:*")
+            uids = sorted(int(uid) for uid in data[0].split()) if status == "OK" and data[0] else []
+            # "n:*" aralığı yeni mesaj yoksa son mesajı döndürür
+            uids = [uid for uid in uids if uid > last_uid][:limit]
+
+            messages = []
+            for uid in uids:
+                status, data = connection.uid("FETCH", str(uid), "(BODY.PEEK[])")
+                if status == "OK" and data and isinstance(data[0], tuple):
+                    messages.append((uid, data[0][1]))
+            return current_validity, messages
+        finally:
+            try:
+                connection.logout()
+            except Exception:
+                pass
+
+
+class LocalMailbox:
+    """Klasördeki .eml dosyalarını posta kutusu gibi sunan yerel yedek (test ve çevrimdışı kullanım)
+
+    Dosyalar ada göre sıralanır; sıra numarası UID olarak kullanılır.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch_since(self, last_uid, uidvalidity=None, limit=500):
+        if not os.path.isdir(self.directory):
+            return 1, []
+        names = sorted(name for name in os.listdir(self.directory) if name.lower().endswith(".eml"))
+        messages = []
+        for uid, name in enumerate(names, start=1):
+            if uid <= last_uid:
+                continue
+            with open(os.path.join(self.directory, name), "rb") as f:
+                messages.append((uid, f.read()))
+            if len(messages) >= limit:
+                break
+        return 1, messages
+
+
+def event_status(event):
+    """Olayın alıcı listesinde gösterilecek durum metni"""
+    if event['type'] == 'read':
+        return "Okundu"
+    if event['type'] == 'bounce':
+        label = "Geri döndü" if event['permanent'] else "Geçici hata"
+    else:
+        label = "Gecikmeli"
+    return f"{label} {event['status']}".strip()
+
+
+def load_recipient_statuses(state_path="bounce_state.json"):
+    """Kayıtlı alıcı durumları (normalize e-posta -> durum metni) - alıcı listesi yüklenirken kullanılır"""
+    return BounceProcessor(None, state_path=state_path).state['recipients']
+
+
+class BounceProcessor:
+    """Posta kutusundaki DSN/MDN mesajlarını artımlı işler
+
+    Son işlenen UID (ve UIDVALIDITY) durum dosyasında tutulur; her yoklamada yalnızca yeni
+    mesajlar indirilir. Kalıcı geri dönüşler engelleme listesine eklenir. Her adresin son
+    durumu ('recipients') da aynı dosyada saklanır; o an listede olmayan adreslerin durumu
+    kaybolmaz ve yeniden başlatmadan sonra alıcılar yüklenirken uygulanır.
+    """
+
+    def __init__(self, mailbox, suppression_list=None, state_path="bounce_state.json"):
+        self.mailbox = mailbox
+        self.suppression_list = suppression_list
+        self.state_path = state_path
+        self.state = {'last_uid': 0, 'uidvalidity': None, 'bounces': 0, 'delayed': 0, 'reads': 0,
+                      'recipients': {}}
+        self._lock = threading.Lock()
+        self.load_state()
+
+    def load_state(self):
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    self.state.update(json.load(f))
+            except Exception as e:
+                print(f"Geri dönüş durumu okunamadı: {e}")
+
+    def save_state(self):
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+
+    def poll(self):
+        """Yeni mesajları işle ve olay listesi döndür"""
+        with self._lock:
+            uidvalidity, messages = self.mailbox.fetch_since(self.state['last_uid'], self.state['uidvalidity'])
+            if uidvalidity != self.state['uidvalidity'] and self.state['uidvalidity'] is not None:
+                self.state['last_uid'] = 0
+            self.state['uidvalidity'] = uidvalidity
+
+            events = []
+            for uid, raw in messages:
+                try:
+                    events.extend(parse_report(raw))
+                except Exception as e:
+                    print(f"Mesaj çözümlenemedi (UID {uid}): {e}")
+                self.state['last_uid'] = max(self.state['last_uid'], uid)
+
+            hard_bounces = [event['email'] for event in events if event['type'] == 'bounce' and event['permanent']]
+            if hard_bounces and self.suppression_list is not None:
+                self.suppression_list.add_many(hard_bounces, "geri dönüş")
+            for event in events:
+                key = {'bounce': 'bounces', 'delayed': 'delayed', 'read': 'reads'}[event['type']]
+                self.state[key] += 1
+                self.state['recipients'][normalize_email(event['email'])] = event_status(event)
+            if messages:
+                self.save_state()
+            return events
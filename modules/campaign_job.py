@@ -0,0 +1,297 @@
+import os
+import copy
+import time
+
+from modules.file_server import file_digest
+from modules.smtp_sender import deliver_email
+from modules.send_planner import PACE_HORIZON, slot_time, jittered, replan
+from modules.recurrence import advance_recurrence
+
+# Limit dolduğunda veya hata durumunda işin yeniden deneneceği süre (saniye)
+RETRY_DELAY = 3600
+# İş dosyasına yazılmayan SMTP alanları - çalıştırma anında ayarlardan (config.json) çözülür
+SECRET_SMTP_KEYS = ('password',)
+
+
+def resolve_attachment(file_path):
+    """Ek dosyayı zamanlama anındaki haliyle tanımla (yol, ad, boyut, içerik özeti)"""
+    return {
+        'path': os.path.abspath(file_path),
+        'name': os.path.basename(file_path),
+        'size': os.path.getsize(file_path),
+        'sha256': file_digest(file_path),
+    }
+
+
+def build_job_spec(subject, body, recipients, attachments, smtp_settings, settings, due, contexts=None, kind='campaign',
+                   recurrence=None, plan=None):
+    """Arayüzden bağımsız, JSON'a yazılabilir kampanya işi
+
+    smtp_settings: şifre işe yazılmaz (bkz. resolve_smtp_settings)
+    settings: zamanlama anındaki gönderim ayarları (bcc_enabled, email_delay, vcard_image_path,
+    attach_image_originals, history_skip_days). Gövde imza eklenmiş son haliyle saklanır.
+    contexts: alıcı -> kişiselleştirme alanları (yalnızca dolu alanlar)
+    recurrence: tekrar kuralı (modules.recurrence) - tekrarlar tek kayıtta tutulur
+    plan: gönderim zamanlarını izinli saatlere yayan plan (modules.send_planner)
+    """
+    return {
+        'kind': kind,
+        'subject': subject,
+        'body': body,
+        'attachments': [resolve_attachment(path) for path in attachments if os.path.exists(path)],
+        'smtp_settings': {key: value for key, value in smtp_settings.items() if key not in SECRET_SMTP_KEYS},
+        'settings': dict(settings),
+        'recipients': list(recipients),
+        'contexts': {email: context for email, context in (contexts or {}).items() if context},
+        'cursor': 0,
+        'sent_count': 0,
+        'failed_count': 0,
+        'total_count': len(recipients),
+        'due': float(due),
+        'recurrence': recurrence,
+        'plan': plan,
+    }
+
+
+def normalize_job_spec(job):
+    """Eski biçimdeki (ayarları üst düzeyde tutan) işleri güncel biçime çevir"""
+    if 'settings' not in job:
+        job['settings'] = {
+            'bcc_enabled': job.pop('bcc_enabled', False),
+            'email_delay': job.pop('email_delay', 3),
+        }
+    attachments = job.get('attachments', [])
+    if attachments and isinstance(attachments[0], str):
+        job['attachments'] = [{'path': path, 'name': os.path.basename(path), 'size': None, 'sha256': None}
+                              for path in attachments]
+    job.setdefault('contexts', {})
+    job.setdefault('cursor', 0)
+    job.setdefault('sent_count', 0)
+    job.setdefault('failed_count', 0)
+    job.setdefault('total_count', len(job.get('recipients', [])))
+    return job
+
+
+def resolve_smtp_settings(job, current):
+    """İşin SMTP ayarlarını çalıştırma anındaki ayarlardan (current) şifreyle tamamla
+
+    Şifre yalnızca aynı hesap (kullanıcı adı) için alınır; hesap değiştiyse şifresiz döner
+    ve iş SMTP ayarları eksik sayılır. Eski biçimde şifreyi içeren işler olduğu gibi kullanılır.
+    """
+    stored = dict(job.get('smtp_settings') or {})
+    if stored.get('password'):
+        return stored
+    if stored.get('username') and stored['username'] != current.get('username'):
+        return stored
+    resolved = dict(current)
+    resolved.update((key, value) for key, value in stored.items() if value)
+    return resolved
+
+
+def job_attachment_paths(job, log=print):
+    """İşin eklerini diskten çöz - kaybolan ya da değişen dosyalar için uyarı verir"""
+    paths = []
+    for attachment in job.get('attachments', []):
+        path = attachment['path']
+        if not os.path.exists(path):
+            log(f"Ek dosya bulunamadı, gönderilmeyecek: {path}")
+            continue
+        if attachment.get('size') is not None and os.path.getsize(path) != attachment['size']:
+            log(f"Ek dosya zamanlamadan sonra değişmiş: {path}")
+        paths.append(path)
+    return paths
+
+
+def remaining_recipients(job):
+    """İmlecin (cursor) gösterdiği yerden itibaren henüz gönderilmemiş alıcılar"""
+    return job['recipients'][job.get('cursor', 0):]
+
+
+class CampaignJobRunner:
+    """Zamanlanmış kampanya işini arayüz olmadan çalıştırır (GUI iş parçacığında veya arka planda)
+
+    Bir çalıştırmada en fazla max_count alıcıya gönderilir; imleç ilerletilir ve sonuç
+    sözlüğü döner. Sayaçların, geçmişin ve işin yeniden zamanlanması çağıranın işidir.
+    """
+
+    def __init__(self, validator=None, suppression_list=None, contact_history=None, message_options=None,
+                 log=print, send=deliver_email, sleep=time.sleep, clock=time.time):
+        self.validator = validator
+        self.suppression_list = suppression_list
+        self.contact_history = contact_history
+        self.message_options = message_options or {}
+        self.log = log
+        self.send = send
+        self.sleep = sleep
+        self.clock = clock
+        self.stop_requested = False
+
+    def filter_recipients(self, recipients, subject, history_skip_days=0):
+        """Gönderim öncesi son kontroller: sözdizimi, engelleme listesi, gönderim geçmişi"""
+        skipped = 0
+        if self.validator is not None:
+            recipients, invalid = self.validator.filter_valid(recipients)
+            skipped += invalid
+        if self.suppression_list is not None:
+            recipients, suppressed = self.suppression_list.filter(recipients)
+            skipped += suppressed
+        if self.contact_history is not None and history_skip_days:
+            recipients, recent = self.contact_history.filter_recent(recipients, subject, history_skip_days)
+            skipped += recent
+        return recipients, skipped
+
+    def run(self, job, max_count):
+        """İşin sıradaki dilimini gönder
+
+        İşte gönderim planı ('plan', modules.send_planner) varsa mesajlar planlanan
+        zamanlarında (titreşimli) gönderilir; zamanı çalışmanın ilk PACE_HORIZON saniyesi
+        içinde gelmeyen ilk mesajda durulur ve planın sonraki zamanı 'next_due' olarak döner.
+
+        Dönüş: {'sent': [...], 'failed': [...], 'skipped': n, 'done': bool, 'next_due': epoch|None}
+        """
+        job = normalize_job_spec(job)
+        settings = job['settings']
+        subject = job['subject']
+        result = {'sent': [], 'failed': [], 'skipped': 0, 'done': False, 'next_due': None}
+
+        pending = remaining_recipients(job)
+        if not pending:
+            result['done'] = True
+            return result
+
+        attachments = job_attachment_paths(job, self.log)
+        vcard_image_path = settings.get('vcard_image_path')
+        if vcard_image_path and not os.path.exists(vcard_image_path):
+            vcard_image_path = None
+        email_delay = settings.get('email_delay', 3)
+        label = "BCC e-posta" if settings.get('bcc_enabled') else "E-posta"
+        plan = self.prepare_plan(job, len(pending))
+        # Planlı işte çalışma kısa tutulur; iş parçacığı saatlerce meşgul edilmez
+        deadline = self.clock() + PACE_HORIZON
+
+        # Dilim: imleçten itibaren max_count alıcı (kontrolden geçemeyenler kotayı harcamaz)
+        batch = []
+        skipped_positions = []
+        position = job['cursor']
+        while position < len(job['recipients']) and len(batch) < max_count:
+            chunk = job['recipients'][position:position + (max_count - len(batch))]
+            allowed, _ = self.filter_recipients(chunk, subject.strip(), settings.get('history_skip_days', 0))
+            allowed = set(allowed)
+            for offset, recipient in enumerate(chunk):
+                if recipient in allowed:
+                    batch.append((position + offset, recipient))
+                else:
+                    skipped_positions.append(position + offset)
+            position += len(chunk)
+
+        for j, (recipient_position, recipient) in enumerate(batch):
+            if self.stop_requested:
+                # Durdurulursa gönderilmeyenler sonraki çalıştırmaya kalır
+                position = recipient_position
+                break
+            if plan is not None:
+                slot = slot_time(plan, plan['index'])
+                if slot is not None:
+                    send_at = jittered(slot[0], slot[1], plan['params']['jitter'])
+                    if send_at > deadline:
+                        # Planın sonraki zamanı uzakta: iş o zamana yeniden kurulur
+                        position = recipient_position
+                        result['next_due'] = slot[0]
+                        break
+                    self.sleep(max(0.0, send_at - self.clock()))
+            elif j > 0:
+                self.sleep(email_delay)
+            try:
+                self.log(f"{label} gönderiliyor ({j+1}/{len(batch)}): {subject} -> {recipient}")
+                self.send(subject, job['body'], recipient, attachments, job['smtp_settings'], True, vcard_image_path,
+                          job['contexts'].get(recipient), **self.message_options)
+                result['sent'].append(recipient)
+            except Exception as e:
+                result['failed'].append(recipient)
+                self.log(f"{label} gönderme hatası ({recipient}): {e}")
+            if plan is not None:
+                plan['index'] += 1
+
+        job['cursor'] = position
+        # Erken durulduysa imleç geri alınır; imlecin ötesindeki atlananlar sonraki çalıştırmada sayılır
+        result['skipped'] = sum(1 for skipped_position in skipped_positions if skipped_position < position)
+        if plan is not None and result['next_due'] is None:
+            slot = slot_time(plan, plan['index'])
+            result['next_due'] = slot[0] if slot else None
+        job['sent_count'] += len(result['sent'])
+        job['failed_count'] += len(result['failed'])
+        result['done'] = job['cursor'] >= len(job['recipients'])
+        return result
+
+    def prepare_plan(self, job, pending_count):
+        """İşin gönderim planını kontrol et - geride kalındıysa (uygulama kapalıydı) veya plan
+        bittiyse kalan alıcılar için şimdiden itibaren yeniden kur"""
+        plan = job.get('plan')
+        if not plan:
+            return None
+        slot = slot_time(plan, plan['index'])
+        now = self.clock()
+        if slot is None or slot[0] < now - PACE_HORIZON:
+            plan = job['plan'] = replan(plan, pending_count, now)
+            self.log(f"Gönderim planı yeniden oluşturuldu: {pending_count} alıcı, {len(plan['windows'])} gün")
+        return plan
+
+
+def job_lease(job, max_count):
+    """Bir çalıştırmanın en uzun süresi (saniye) - iş bu süre için kiralanır (JobScheduler.claim)"""
+    email_delay = job.get('settings', {}).get('email_delay', 3)
+    # Her gönderim için bekleme ve SMTP süresi; planlı işte çalışma PACE_HORIZON ile sınırlıdır
+    return PACE_HORIZON + max(1, max_count) * (email_delay + 30)
+
+
+def defer_job(scheduler, job_id, now=None, due=None, **fields):
+    """İşi ertele (limit doldu veya çalıştırma hatası) - due verilmezse RETRY_DELAY sonrasına
+
+    fields: erteleme ile aynı yazımda işe kaydedilecek alanlar (imleç, sayaçlar ...)
+    """
+    now = time.time() if now is None else now
+    due = now + RETRY_DELAY if due is None else due
+    scheduler.reschedule(job_id, due, **fields)
+    return due
+
+
+def finish_job_run(scheduler, job, result, now=None, retry_due=None):
+    """Bir çalıştırmanın sonucunu zamanlayıcıya uygula - arayüz ve headless motor ortak kullanır
+
+    Değişiklikler diskteki son kayıt üzerinde tek yazımda yapılır ve işin kirası bırakılır.
+
+    Dönüş: (durum, sonraki zaman) - durum: 'cancelled' (çalışırken iptal edildi),
+    'completed', 'recurring' (sonraki tekrara kuruldu), 'planned' (planın sonraki
+    zamanına kuruldu) veya 'retry' (retry_due'da - verilmezse RETRY_DELAY sonra - devam).
+    Dilim gönderim limiti nedeniyle kısaldıysa retry_due limitin açılacağı zaman olmalı.
+    """
+    now = time.time() if now is None else now
+    job_id = job['id']
+    stored = scheduler.get(job_id)
+    if stored is None:
+        return 'cancelled', None
+
+    if result['done']:
+        stored = copy.deepcopy(stored)
+        stored.update(sent_count=job['sent_count'], failed_count=job['failed_count'])
+        next_due = advance_recurrence(stored, now)
+        if next_due is None:
+            scheduler.complete(job_id)
+            return 'completed', None
+        # Tekrarlayan iş: aynı kayıt imleç sıfırlanarak sonraki tekrara kaydırılır
+        if stored.get('plan'):
+            stored['plan'] = replan(stored['plan'], len(stored['recipients']), next_due)
+            if stored['plan']['windows']:
+                next_due = stored['plan']['windows'][0]['start']
+        stored.pop('due')
+        stored.pop('running_by', None)
+        scheduler.reschedule(job_id, next_due, **stored)
+        return 'recurring', next_due
+
+    # Kalan alıcılar için aynı iş imleçten devam eder
+    progress = {'cursor': job['cursor'], 'sent_count': job['sent_count'],
+                'failed_count': job['failed_count'], 'plan': job.get('plan')}
+    if result.get('next_due') is not None:
+        scheduler.reschedule(job_id, result['next_due'], **progress)
+        return 'planned', result['next_due']
+    return 'retry', defer_job(scheduler, job_id, now, due=retry_due, **progress)
@@ -1,11 +1,17 @@
 import json
 import os
 
+from modules.file_lock import file_lock
+
 class ConfigManager:
     def __init__(self, config_path="config.json"):
         self.config_path = config_path
         self.config = {}
 
+    def locked(self):
+        """config.json'u oku-değiştir-yaz sırasında kilitle (arayüz ve servis aynı dosyayı kullanır)"""
+        return file_lock(self.config_path + ".lock")
+
     def load_config(self):
         if os.path.exists(self.config_path):
             with open(self.config_path, "r", encoding="utf-8") as f:
@@ -15,34 +21,30 @@ class ConfigManager:
         return self.config
 
     def save_config(self, config):
-        """Tüm config'i kaydet"""
-        with open(self.config_path, "w", encoding="utf-8") as f:
+        """Tüm config'i kaydet (atomik - diğer süreç yarım yazılmış dosya okumaz)"""
+        temp_path = self.config_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(config, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, self.config_path)
         self.config = config
 
+    def save_section(self, key, value):
+        with self.locked():
+            config = self.load_config()
+            config[key] = value
+            self.save_config(config)
+
     def save_settings(self, settings):
-        config = self.load_config()
-        config["settings"] = settings
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=4)
-        self.config = config
+        self.save_section("settings", settings)
 
     def save_database(self, database):
-        config = self.load_config()
-        config["database"] = database
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=4)
-        self.config = config
+        self.save_section("database", database)
 
     def save_schedule(self, schedule):
         """Zamanlama ayarlarını kaydet"""
-        config = self.load_config()
-        config["schedule"] = schedule
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=4)
-        self.config = config
+        self.save_section("schedule", schedule)
 
     def load_schedule(self):
         """Zamanlama ayarlarını yükle"""
         config = self.load_config()
-        return config.get("schedule", {}) 
\ No newline at end of file
+        return config.get("schedule", {})
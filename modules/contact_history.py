@@ -0,0 +1,85 @@
+import os
+import json
+import threading
+from datetime import datetime, timedelta
+
+from modules.suppression_list import normalize_email
+
+
+class ContactHistory:
+    """Kampanyalar arası gönderim geçmişi - normalize e-posta -> {şablon: son gönderim zamanı}
+
+    Kayıtlar diske satır başına bir JSON olacak şekilde (append-only) yazılır ve açılışta
+    tek geçişte belleğe alınır; "bu şablon son N gün içinde gönderildi mi" kontrolü O(1)'dir.
+    """
+
+    def __init__(self, path="contact_history.jsonl"):
+        self.path = path
+        self._history = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self._history)
+
+    def load(self):
+        """Geçmiş dosyasını satır satır oku (aynı adres/şablon için en son kayıt geçerli)"""
+        self._history = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    sent_at = datetime.fromisoformat(record['sent_at'])
+                    templates = self._history.setdefault(record['email'], {})
+                    if record['template'] not in templates or templates[record['template']] < sent_at:
+                        templates[record['template']] = sent_at
+        except Exception as e:
+            print(f"Gönderim geçmişi okunamadı: {e}")
+
+    def record_many(self, emails, template, sent_at=None):
+        """Başarılı gönderimleri kaydet"""
+        sent_at = sent_at or datetime.now()
+        timestamp = sent_at.isoformat(timespec='seconds')
+        lines = []
+        with self._lock:
+            for email in emails:
+                email = normalize_email(email)
+                if not email:
+                    continue
+                self._history.setdefault(email, {})[template] = sent_at
+                lines.append(json.dumps({'email': email, 'template': template, 'sent_at': timestamp},
+                                        ensure_ascii=False) + "\n")
+            if lines:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+
+    def last_sent(self, email, template=None):
+        """Adrese son gönderim zamanı (şablon verilmezse herhangi bir şablon) - yoksa None"""
+        templates = self._history.get(normalize_email(email))
+        if not templates:
+            return None
+        if template is not None:
+            return templates.get(template)
+        return max(templates.values())
+
+    def filter_recent(self, emails, template, days, now=None):
+        """Aynı şablon son 'days' gün içinde gönderilmiş adresleri çıkar
+
+        Dönüş: (gönderilecekler, atlanan sayısı)
+        """
+        if not days:
+            return list(emails), 0
+        cutoff = (now or datetime.now()) - timedelta(days=days)
+        history = self._history
+        allowed = []
+        for email in emails:
+            templates = history.get(normalize_email(email))
+            sent_at = templates.get(template) if templates else None
+            if sent_at is None or sent_at < cutoff:
+                allowed.append(email)
+        return allowed, len(emails) - len(allowed)
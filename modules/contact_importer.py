@@ -0,0 +1,132 @@
+import os
+import csv
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+
+# Başlık satırında e-posta ve ad sütunlarını tanımak için anahtar kelimeler
+EMAIL_HEADERS = ("e-posta", "eposta", "e_posta", "email", "e-mail", "mail")
+NAME_HEADERS = ("ad soyad", "ad_soyad", "adı soyadı", "yetkili", "isim", "name", "firma")
+# Önek olarak aranmayan kısa başlıklar ("ad" ile başlayan "adres" sütunu ad sayılmaz)
+EXACT_NAME_HEADERS = ("ad", "adı")
+
+
+def detect_format(file_path):
+    """Dosya uzantısından içe aktarma formatını belirle"""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        return "xlsx"
+    if extension in (".vcf", ".vcard"):
+        return "vcf"
+    if extension == ".tsv":
+        return "tsv"
+    return "csv"
+
+
+def detect_columns(header):
+    """Başlık satırından (e-posta, ad) sütun indekslerini bul - e-posta bulunamazsa None"""
+    normalized = [str(cell).strip().lower() if cell is not None else "" for cell in header]
+    email_index = None
+    name_index = None
+    for i, cell in enumerate(normalized):
+        if email_index is None and any(key in cell for key in EMAIL_HEADERS):
+            email_index = i
+        elif name_index is None and (cell in EXACT_NAME_HEADERS or any(cell.startswith(key) for key in NAME_HEADERS)):
+            name_index = i
+    if email_index is None:
+        return None
+    return email_index, name_index
+
+
+def iter_rows_contacts(rows):
+    """Satır listesinden (generator) kişi üret - ilk satır başlık olabilir"""
+    columns = None
+    for row in rows:
+        if not row or all(cell in (None, "") for cell in row):
+            continue
+        if columns is None:
+            columns = detect_columns(row)
+            if columns is not None:
+                # Başlık satırı - veri değil
+                continue
+            # Başlık yok: e-posta içeren ilk hücreyi e-posta, ondan önceki hücreyi ad kabul et
+            for i, cell in enumerate(row):
+                if cell is not None and '@' in str(cell):
+                    columns = (i, i - 1 if i > 0 else (1 if len(row) > 1 else None))
+                    break
+            if columns is None:
+                continue
+        email_index, name_index = columns
+        email = str(row[email_index]).strip() if email_index < len(row) and row[email_index] is not None else ""
+        name = ""
+        if name_index is not None and name_index < len(row) and row[name_index] is not None:
+            name = str(row[name_index]).strip()
+        if email:
+            yield {'name': name, 'email': email}
+
+
+def iter_text_contacts(text):
+    """Yapıştırılan metinden kişi üret (e-posta veya Ad Soyad,e-posta satırları)"""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if ',' in line:
+            name, email = line.split(',', 1)
+            yield {'name': name.strip(), 'email': email.strip()}
+        else:
+            yield {'name': "", 'email': line}
+
+
+def iter_vcf_contacts(handle):
+    """vCard dosyasından kişi üret (FN ve EMAIL alanları)"""
+    name = ""
+    emails = []
+    for line in handle:
+        line = line.strip()
+        upper = line.upper()
+        if upper.startswith("BEGIN:VCARD"):
+            name = ""
+            emails = []
+        elif upper.startswith("FN") and ':' in line:
+            name = line.split(':', 1)[1].strip()
+        elif upper.startswith("EMAIL") and ':' in line:
+            emails.append(line.split(':', 1)[1].strip())
+        elif upper.startswith("END:VCARD"):
+            for email in emails:
+                yield {'name': name, 'email': email}
+
+
+def iter_file_contacts(file_path):
+    """Dosyadaki kişileri akış halinde üret (CSV, TSV, XLSX, VCF)"""
+    file_format = detect_format(file_path)
+
+    if file_format == "xlsx":
+        if openpyxl is None:
+            raise ImportError("Excel içe aktarma için openpyxl paketi gerekli (pip install openpyxl)")
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            yield from iter_rows_contacts(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+        return
+
+    with open(file_path, 'r', encoding='utf-8-sig', errors='ignore', newline='') as f:
+        if file_format == "vcf":
+            yield from iter_vcf_contacts(f)
+            return
+
+        if file_format == "tsv":
+            delimiter = '\t'
+        else:
+            # Türkçe Excel CSV çıktıları genelde noktalı virgül kullanır
+            sample = f.read(4096)
+            f.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+            except csv.Error:
+                delimiter = ','
+        yield from iter_rows_contacts(csv.reader(f, delimiter=delimiter))
@@ -1,8 +1,16 @@
+import re
+import json
+import time
 import psycopg2
 import logging
 from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 
+from modules.distinct_value_cache import DistinctValueCache
+
+# İndeks ifadelerindeki tırnaklı ("Sütun") veya tırnaksız (sutun) tanımlayıcılar
+IDENTIFIER_RE = re.compile(r'"((?:[^"]|"")+)"|\b([^\W\d]\w*)\b')
+
 class DatabaseManager:
     def __init__(self):
         self.conn = None
@@ -10,6 +18,26 @@ class DatabaseManager:
         self.connection_pool = None
         self.logger = logging.getLogger(__name__)
         
+        # DISTINCT değer ve sütun listesi önbellekleri
+        self.distinct_cache = DistinctValueCache(ttl=600)
+        self.column_cache = {}
+        
+        # Sunucu tarafı hazır sorgular (PREPARE) - bağlantıya özgüdür
+        self.prepared_statements = {}
+        self.prepared_conn = None
+        # Ad sayacı hiç azalmaz; silinen bir girişin adı sunucuda hâlâ var olabilir
+        self.prepared_counter = 0
+        # Sorgu şekli bazında gecikme istatistikleri
+        self.query_stats = {}
+        
+    def invalidate_cache(self, table_name=None):
+        """Tablo bazlı önbellekleri temizle (veri veya eşleştirme değiştiğinde)"""
+        self.distinct_cache.invalidate(table_name)
+        if table_name is None:
+            self.column_cache.clear()
+        else:
+            self.column_cache.pop(table_name, None)
+        
     def test_connection(self, host, port, db_name, user, password):
         """Veritabanı bağlantısını test et"""
         try:
@@ -40,6 +68,9 @@ class DatabaseManager:
             
             # Bağlantıyı aç
             self.conn = psycopg2.connect(**self.connection_params)
+            # Farklı bir veritabanına bağlanılmış olabilir, önbellekleri temizle
+            self.invalidate_cache()
+            self.prepared_statements = {}
             self.logger.info("Veritabanı bağlantısı başarıyla açıldı")
             return self.conn
             
@@ -83,9 +114,8 @@ class DatabaseManager:
         if not table_name:
             return False
             
-        # Sadece harf, rakam ve alt çizgi karakterlerine izin ver
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
-        return all(c in allowed_chars for c in table_name)
+        # Sadece harf (Türkçe karakterler dahil), rakam ve alt çizgi karakterlerine izin ver
+        return all(c.isalnum() or c == '_' for c in table_name)
         
     def validate_column_name(self, column_name):
         """Sütun adı doğrulama - SQL injection koruması"""
@@ -116,11 +146,14 @@ class DatabaseManager:
             self.logger.error(f"Beklenmeyen hata: {e}")
             return None, f"Beklenmeyen hata: {e}"
             
-    def get_table_columns(self, table_name):
+    def get_table_columns(self, table_name, use_cache=True):
         """Tablo sütunlarını güvenli şekilde al"""
         if not self.validate_table_name(table_name):
             return None, "Geçersiz tablo adı"
             
+        if use_cache and table_name in self.column_cache:
+            return self.column_cache[table_name], None
+            
         query = """
             SELECT column_name 
             FROM information_schema.columns 
@@ -132,7 +165,9 @@ class DatabaseManager:
         if error:
             return None, error
             
-        return [row[0] for row in results], None
+        columns = [row[0] for row in results]
+        self.column_cache[table_name] = columns
+        return columns, None
         
     def get_table_data(self, table_name, columns=None, conditions=None, limit=None):
         """Tablo verilerini güvenli şekilde al"""
@@ -169,18 +204,32 @@ class DatabaseManager:
             
         return self.safe_execute_query(query, params)
         
-    def get_distinct_values(self, table_name, column_name):
-        """Belirli sütundaki benzersiz değerleri al"""
+    def get_distinct_values(self, table_name, column_name, use_cache=True):
+        """Belirli sütundaki benzersiz değerleri al (önbellekli)"""
         if not self.validate_table_name(table_name) or not self.validate_column_name(column_name):
             return None, "Geçersiz tablo veya sütun adı"
             
+        if use_cache:
+            cached = self.distinct_cache.get(table_name, column_name)
+            if cached is not None:
+                return cached, None
+            
         query = f'SELECT DISTINCT "{column_name}" FROM "{table_name}" WHERE "{column_name}" IS NOT NULL AND "{column_name}" <> \'\' ORDER BY "{column_name}"'
         
         results, error = self.safe_execute_query(query)
         if error:
             return None, error
             
-        return [row[0] for row in results], None
+        values = [row[0] for row in results]
+        self.distinct_cache.put(table_name, column_name, values)
+        return values, None
+        
+    def autocomplete_values(self, table_name, column_name, prefix, limit=50):
+        """Önbellekteki DISTINCT değerlerden önek ile otomatik tamamlama (önbellek boşsa doldurulur)"""
+        _, error = self.get_distinct_values(table_name, column_name)
+        if error:
+            return []
+        return self.distinct_cache.prefix_search(table_name, column_name, prefix, limit)
         
     def get_table_count(self, table_name):
         """Tablo kayıt sayısını al"""
@@ -193,4 +242,288 @@ class DatabaseManager:
         if error:
             return None, error
             
-        return results[0][0] if results else 0, None 
\ No newline at end of file
+        return results[0][0] if results else 0, None 
+        
+    def build_match_condition(self, table_name, column_name, value):
+        """Filtre koşulu oluştur - DISTINCT listesinden seçilen değerler için indeks dostu eşleşme
+        
+        Dönüş: (koşul, parametre). Değer önbellekteki DISTINCT listede birebir varsa
+        (listeden seçildi) o değerin tüm yazımlarına = ANY(...) eşitliği kullanılır;
+        serbest yazılan metin için eski ILIKE '%değer%' davranışı (pg_trgm indeksi ile
+        hızlanır) korunur, böylece kelime ortasındaki eşleşmeler kaybolmaz.
+        """
+        value = value.strip()
+        variants = self.distinct_cache.contains(table_name, column_name, value)
+        if variants:
+            return f'"{column_name}" = ANY(%s)', variants
+            
+        return f'"{column_name}" ILIKE %s', f"%{value}%"
+        
+    def get_table_indexes(self, table_name):
+        """Tablodaki indeksleri al - tanım, erişim yöntemi, indekslenen sütunlar ve ifadeler
+        
+        Sütunlar pg_index.indkey'den sırasıyla okunur (ifade sütunları 0 olduğundan
+        listede yer almaz, ifadeler 'expressions' alanında gelir).
+        """
+        if not self.validate_table_name(table_name):
+            return None, "Geçersiz tablo adı"
+            
+        query = """
+            SELECT i.relname, pg_get_indexdef(ix.indexrelid), am.amname,
+                   ARRAY(SELECT a.attname
+                         FROM unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+                         JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = k.attnum
+                         ORDER BY k.ord),
+                   pg_get_expr(ix.indexprs, ix.indrelid)
+            FROM pg_index ix
+            JOIN pg_class t ON t.oid = ix.indrelid
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            JOIN pg_am am ON am.oid = i.relam
+            WHERE n.nspname = 'public' AND t.relname = %s
+        """
+        results, error = self.safe_execute_query(query, (table_name,))
+        if error:
+            return None, error
+        return [{'name': row[0], 'definition': row[1], 'method': row[2], 'columns': list(row[3] or []),
+                 'expressions': row[4] or ""} for row in results], None
+        
+    def suggest_indexes(self, table_name, filter_columns, email_columns):
+        """Filtre ve e-posta sütunları için eksik indeksleri öner
+        
+        Filtre sütunları (il, sektör) için eşitlik aramasına btree, ILIKE '%..%'
+        aramasına pg_trgm GIN indeksi; e-posta sütunları için lower() ifade indeksi önerilir.
+        """
+        indexes, error = self.get_table_indexes(table_name)
+        if error:
+            return None, error
+            
+        def has_btree(column_name):
+            # Eşitlik araması için sütun indeksin ilk sütunu olmalı
+            return any(index['method'] == 'btree' and index['columns'][:1] == [column_name] for index in indexes)
+        
+        def has_trgm(column_name):
+            return any(index['method'] == 'gin' and column_name in index['columns']
+                       and 'gin_trgm_ops' in index['definition'] for index in indexes)
+        
+        def has_lower(column_name):
+            # İfade içindeki tanımlayıcılar tam ad olarak karşılaştırılır (il ile il_kodu karışmaz)
+            for index in indexes:
+                expression = index['expressions']
+                identifiers = {quoted or bare for quoted, bare in IDENTIFIER_RE.findall(expression)}
+                if re.search(r'\blower\(', expression) and column_name in identifiers:
+                    return True
+            return False
+        
+        suggestions = []
+        for column_name in filter_columns:
+            if not column_name or not self.validate_column_name(column_name):
+                continue
+            if not has_btree(column_name):
+                suggestions.append({
+                    'column': column_name,
+                    'kind': 'btree',
+                    'name': f"idx_{table_name}_{column_name}",
+                    'sql': f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column_name}" ON "{table_name}" ("{column_name}")'
+                })
+            if not has_trgm(column_name):
+                suggestions.append({
+                    'column': column_name,
+                    'kind': 'trgm',
+                    'name': f"idx_{table_name}_{column_name}_trgm",
+                    'sql': f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column_name}_trgm" ON "{table_name}" USING gin ("{column_name}" gin_trgm_ops)'
+                })
+                
+        for column_name in email_columns:
+            if not column_name or not self.validate_column_name(column_name):
+                continue
+            if not has_lower(column_name):
+                suggestions.append({
+                    'column': column_name,
+                    'kind': 'lower',
+                    'name': f"idx_{table_name}_{column_name}_lower",
+                    'sql': f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column_name}_lower" ON "{table_name}" (lower("{column_name}"))'
+                })
+                
+        return suggestions, None
+        
+    def create_suggested_index(self, suggestion):
+        """Önerilen indeksi oluştur (trigram indeksleri için pg_trgm eklentisini etkinleştirir)"""
+        try:
+            conn = self.get_connection()
+            if not conn:
+                return False, "Veritabanı bağlantısı kurulamadı"
+                
+            cur = conn.cursor()
+            if suggestion['kind'] == 'trgm':
+                cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cur.execute(suggestion['sql'])
+            conn.commit()
+            cur.close()
+            self.logger.info(f"İndeks oluşturuldu: {suggestion['name']}")
+            return True, None
+            
+        except psycopg2.Error as e:
+            conn.rollback()
+            self.logger.error(f"İndeks oluşturma hatası: {e}")
+            return False, f"İndeks oluşturma hatası: {e}"
+            
+    def explain_query(self, query, params=None):
+        """Sorguyu EXPLAIN ANALYZE ile çalıştır ve süre/plan özetini döndür"""
+        results, error = self.safe_execute_query(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}", params)
+        if error:
+            return None, error
+            
+        plan = results[0][0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        plan = plan[0]
+        
+        # En alttaki tarama düğümlerini topla (Seq Scan / Index Scan / Bitmap Heap Scan ...)
+        scans = []
+        nodes = [plan['Plan']]
+        while nodes:
+            node = nodes.pop()
+            if 'Scan' in node.get('Node Type', ''):
+                scans.append(node['Node Type'])
+            nodes.extend(node.get('Plans', []))
+            
+        return {
+            'execution_ms': plan.get('Execution Time', 0.0),
+            'planning_ms': plan.get('Planning Time', 0.0),
+            'scans': scans,
+        }, None
+
+        
+    def execute_prepared(self, query, params=None, shape=None):
+        """Sorguyu sunucu tarafı PREPARE/EXECUTE ile çalıştır ve şekil bazında süre kaydet
+        
+        Aynı sorgu metni (tablo + aktif koşullar) bağlantı boyunca bir kez hazırlanır,
+        sonraki çağrılarda yalnızca EXECUTE gönderilir ve PostgreSQL planı yeniden kullanabilir.
+        """
+        params = list(params or [])
+        conn = self.get_connection()
+        if not conn:
+            return None, "Veritabanı bağlantısı kurulamadı"
+            
+        # Hazır sorgular oturuma bağlıdır; bağlantı değiştiyse listeyi sıfırla
+        if conn is not self.prepared_conn:
+            self.prepared_statements = {}
+            self.prepared_conn = conn
+            
+        try:
+            cur = conn.cursor()
+            statement_name = self.prepared_statements.get(query)
+            if statement_name is None:
+                self.prepared_counter += 1
+                statement_name = f"filter_stmt_{self.prepared_counter}"
+                # %s yer tutucularını $1, $2 ... biçimine çevir
+                parts = query.split("%s")
+                prepared_query = parts[0] + "".join(f"${i}{part}" for i, part in enumerate(parts[1:], 1))
+                cur.execute(f"PREPARE {statement_name} AS {prepared_query}")
+                self.prepared_statements[query] = statement_name
+                
+            start = time.perf_counter()
+            if params:
+                placeholders = ", ".join(["%s"] * len(params))
+                cur.execute(f"EXECUTE {statement_name} ({placeholders})", params)
+            else:
+                cur.execute(f"EXECUTE {statement_name}")
+            results = cur.fetchall()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            cur.close()
+            
+            self.record_query_stat(shape or query, elapsed_ms, len(results))
+            return results, None
+            
+        except psycopg2.Error as e:
+            conn.rollback()
+            self.logger.error(f"Hazır sorgu hatası: {e}")
+            # ROLLBACK hazır sorguyu silmez; kayıttan düşülen ad sunucuda da serbest bırakılır
+            statement_name = self.prepared_statements.pop(query, None)
+            if statement_name is not None:
+                try:
+                    cur = conn.cursor()
+                    cur.execute(f"DEALLOCATE {statement_name}")
+                    cur.close()
+                except psycopg2.Error:
+                    conn.rollback()
+            return None, f"Veritabanı hatası: {e}"
+            
+    def record_query_stat(self, shape, elapsed_ms, row_count):
+        """Sorgu şekli için çalıştırma süresini kaydet"""
+        stat = self.query_stats.get(shape)
+        if stat is None:
+            stat = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0, 'rows': 0}
+            self.query_stats[shape] = stat
+        stat['count'] += 1
+        stat['total_ms'] += elapsed_ms
+        stat['max_ms'] = max(stat['max_ms'], elapsed_ms)
+        stat['last_ms'] = elapsed_ms
+        stat['rows'] = row_count
+        
+    def get_query_stats(self):
+        """Sorgu şekli istatistiklerini ortalama süreye göre azalan sırada döndür"""
+        stats = []
+        for shape, stat in self.query_stats.items():
+            stats.append({
+                'shape': shape,
+                'count': stat['count'],
+                'avg_ms': stat['total_ms'] / stat['count'],
+                'max_ms': stat['max_ms'],
+                'last_ms': stat['last_ms'],
+                'rows': stat['rows'],
+            })
+        stats.sort(key=lambda item: item['avg_ms'], reverse=True)
+        return stats
+
+        
+    def stream_distinct_emails(self, table_name, email_columns, conditions=None, params=None, batch_size=5000,
+                               context_columns=None):
+        """Filtreye uyan e-postaları SQL tarafında tekilleştirip parça parça döndür (generator)
+        
+        E-posta sütunları UNION ALL ile birleştirilir ve lower(trim(...)) üzerinde DISTINCT ON
+        ile tekilleştirilir; sonuçlar sunucu tarafı (named) cursor ile batch_size'lık listeler
+        halinde akıtılır. Liste elemanları (e-posta, {alan: değer}) çiftleridir; değerler
+        context_columns ({alan: sütun}) sütunlarından seçilir (verilmezse sözlük boştur).
+        """
+        if not self.validate_table_name(table_name):
+            raise ValueError("Geçersiz tablo adı")
+        email_columns = [col for col in email_columns if col]
+        if not email_columns or not all(self.validate_column_name(col) for col in email_columns):
+            raise ValueError("Geçersiz e-posta sütunu")
+        context_columns = {field: col for field, col in (context_columns or {}).items() if col}
+        if not all(self.validate_column_name(col) for col in context_columns.values()):
+            raise ValueError("Geçersiz kişiselleştirme sütunu")
+        fields = list(context_columns)
+            
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        selected = "".join(f', "{context_columns[field]}"::text AS c{i}' for i, field in enumerate(fields))
+        branches = []
+        query_params = []
+        for col in email_columns:
+            branches.append(
+                f'SELECT lower(trim("{col}")) AS email{selected} FROM "{table_name}" '
+                f'WHERE {where} AND strpos("{col}", \'@\') > 0'
+            )
+            query_params.extend(params or [])
+        outer = "".join(f", c{i}" for i in range(len(fields)))
+        query = f"SELECT DISTINCT ON (email) email{outer} FROM ({' UNION ALL '.join(branches)}) AS audience ORDER BY email"
+        
+        conn = self.get_connection()
+        if not conn:
+            raise ConnectionError("Veritabanı bağlantısı kurulamadı")
+            
+        cur = conn.cursor(name="audience_stream")
+        cur.itersize = batch_size
+        try:
+            cur.execute(query, query_params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [(row[0], {field: value.strip() for field, value in zip(fields, row[1:]) if value and value.strip()})
+                       for row in rows]
+        finally:
+            cur.close()
+            conn.commit()
@@ -0,0 +1,114 @@
+import time
+import bisect
+import threading
+
+
+def turkish_fold(text):
+    """Türkçe büyük/küçük harf duyarsız karşılaştırma için metni normalize et"""
+    if text is None:
+        return ""
+    text = str(text)
+    # Python'un lower() fonksiyonu İ -> i̇ ve I -> i dönüşümü yapar, Türkçe için düzelt
+    text = text.replace("İ", "i").replace("I", "ı")
+    return text.lower().strip()
+
+
+class DistinctValueCache:
+    """(tablo, sütun) bazında DISTINCT değer önbelleği ve önek (prefix) indeksi"""
+
+    def __init__(self, ttl=600):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_fresh(self, entry):
+        return self.ttl is None or (time.monotonic() - entry["loaded_at"]) < self.ttl
+
+    def get(self, table_name, column_name, loader=None):
+        """Önbellekten değerleri getir; yoksa veya süresi dolmuşsa loader ile yükle"""
+        key = (table_name, column_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._is_fresh(entry):
+                self.hits += 1
+                return entry["values"]
+            # Yükleyici verilmese de (çağıran kendisi sorgular) ıska sayılır
+            self.misses += 1
+
+        if loader is None:
+            return None
+
+        values = loader()
+        if values is None:
+            return None
+        self.put(table_name, column_name, values)
+        return self._entries[key]["values"]
+
+    def put(self, table_name, column_name, values):
+        """Değerleri önbelleğe yaz ve önek indeksini oluştur"""
+        values = [v for v in values if v is not None and str(v).strip() != ""]
+        # Önek araması için katlanmış (folded) anahtarlara göre sıralı indeks
+        index = sorted((turkish_fold(v), str(v)) for v in values)
+        # Aynı katlanmış anahtara düşen yazımların hepsi tutulur ("İstanbul", "istanbul")
+        exact = {}
+        for folded, value in index:
+            exact.setdefault(folded, []).append(value)
+        entry = {
+            "values": values,
+            "folded_keys": [item[0] for item in index],
+            "folded_values": [item[1] for item in index],
+            "exact": exact,
+            "loaded_at": time.monotonic(),
+        }
+        with self._lock:
+            self._entries[(table_name, column_name)] = entry
+
+    def contains(self, table_name, column_name, value):
+        """Değer önbellekteki DISTINCT listede birebir var mı (Türkçe katlamalı)
+
+        Dönüş: eşleşen tüm yazımların listesi; yoksa (veya önbellek eskiyse) None
+        """
+        entry = self._entries.get((table_name, column_name))
+        if not entry or not self._is_fresh(entry):
+            return None
+        return entry["exact"].get(turkish_fold(value))
+
+    def prefix_search(self, table_name, column_name, prefix, limit=50):
+        """Önek ile başlayan değerleri döndür - O(log n + k)"""
+        entry = self._entries.get((table_name, column_name))
+        if not entry:
+            return []
+        keys = entry["folded_keys"]
+        folded_prefix = turkish_fold(prefix)
+        if not folded_prefix:
+            return entry["folded_values"][:limit] if limit else list(entry["folded_values"])
+
+        start = bisect.bisect_left(keys, folded_prefix)
+        results = []
+        for i in range(start, len(keys)):
+            if not keys[i].startswith(folded_prefix):
+                break
+            results.append(entry["folded_values"][i])
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def invalidate(self, table_name=None, column_name=None):
+        """Önbelleği temizle - tablo/sütun verilmezse tamamını temizler"""
+        with self._lock:
+            if table_name is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries.keys()):
+                if key[0] == table_name and (column_name is None or key[1] == column_name):
+                    del self._entries[key]
+
+    def get_stats(self):
+        """Önbellek istatistiklerini döndür"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
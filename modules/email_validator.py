@@ -0,0 +1,160 @@
+import re
+import time
+import difflib
+import threading
+
+try:
+    import dns.resolver
+except ImportError:
+    dns = None
+
+
+# RFC 5322 dot-atom yerel kısım (tırnaklı yerel kısımlar toplu gönderimde desteklenmez)
+LOCAL_PART_RE = re.compile(r"^[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*$")
+# ASCII (IDNA dönüşümü sonrası) alan adı: etiketler 1-63 karakter, TLD harf veya xn--
+DOMAIN_RE = re.compile(r"^(?=.{1,253}$)([A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+(?:[A-Za-z]{2,63}|xn--[A-Za-z0-9-]{1,59})$")
+
+# MX kontrolü başarısız olduğunda verilen neden (gönderim sırasında MX sorgulanmaz)
+NO_MX_REASON = "Alan adı e-posta kabul etmiyor (MX yok)"
+# MX kontrolü dnspython gerektirir (isteğe bağlı bağımlılık)
+MX_CHECK_AVAILABLE = dns is not None
+
+# Yazım hatası kontrolü için sık kullanılan alan adları
+COMMON_DOMAINS = (
+    "gmail.com", "hotmail.com", "outlook.com", "yahoo.com", "yandex.com", "icloud.com",
+    "live.com", "msn.com", "hotmail.com.tr", "outlook.com.tr", "yahoo.com.tr", "yandex.com.tr",
+    "mynet.com", "windowslive.com", "protonmail.com", "aol.com",
+)
+
+
+class StaticResolver:
+    """DNS yerine sabit tablodan MX cevabı veren çözümleyici (test ve çevrimdışı kullanım için)"""
+
+    def __init__(self, mx_records=None, default=True):
+        self.mx_records = mx_records or {}
+        self.default = default
+
+    def __call__(self, domain):
+        return self.mx_records.get(domain, self.default)
+
+
+def dns_mx_resolver(domain, timeout=3.0):
+    """dnspython ile MX (yoksa A) kaydı var mı kontrol et"""
+    if dns is None:
+        raise ImportError("MX kontrolü için dnspython paketi gerekli (pip install dnspython)")
+    resolver = dns.resolver.Resolver()
+    resolver.lifetime = timeout
+    try:
+        return len(resolver.resolve(domain, "MX")) > 0
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
+        return False
+    except dns.resolver.NoAnswer:
+        # MX yoksa RFC 5321'e göre A kaydına teslim edilir
+        try:
+            return len(resolver.resolve(domain, "A")) > 0
+        except Exception:
+            return False
+
+
+class EmailValidator:
+    """Sözdizimi, IDN, yazım hatası ve (isteğe bağlı) MX kontrolü yapan doğrulayıcı
+
+    Alan adı kontrolleri alan adı başına bir kez yapılır ve önbelleğe alınır; toplu
+    doğrulamada aynı alan adına sahip binlerce adres tek kontrol maliyeti öder.
+    """
+
+    def __init__(self, resolver=None, mx_ttl=86400):
+        self.resolver = resolver or dns_mx_resolver
+        self.mx_ttl = mx_ttl
+        self._domain_cache = {}
+        self._mx_cache = {}
+        self._lock = threading.Lock()
+
+    def normalize_domain(self, domain):
+        """Alan adını IDNA (punycode) biçimine çevir - geçersizse None"""
+        domain = domain.strip().rstrip('.').lower()
+        try:
+            return domain.encode('idna').decode('ascii')
+        except UnicodeError:
+            return None
+
+    def suggest_domain(self, domain):
+        """Sık kullanılan alan adlarına çok yakın ama farklı ise düzeltme öner"""
+        if domain in COMMON_DOMAINS:
+            return None
+        matches = difflib.get_close_matches(domain, COMMON_DOMAINS, n=1, cutoff=0.85)
+        return matches[0] if matches else None
+
+    def check_domain(self, domain):
+        """Alan adı kontrolü (önbellekli): (ascii alan adı, hata sebebi, öneri)"""
+        cached = self._domain_cache.get(domain)
+        if cached is not None:
+            return cached
+        ascii_domain = self.normalize_domain(domain)
+        if not ascii_domain or not DOMAIN_RE.match(ascii_domain):
+            result = (None, "Geçersiz alan adı", None)
+        else:
+            result = (ascii_domain, None, self.suggest_domain(ascii_domain))
+        self._domain_cache[domain] = result
+        return result
+
+    def has_mx(self, ascii_domain):
+        """Alan adının posta kabul edip etmediğini (TTL önbellekli) kontrol et"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._mx_cache.get(ascii_domain)
+            if cached and now - cached[1] < self.mx_ttl:
+                return cached[0]
+        try:
+            result = bool(self.resolver(ascii_domain))
+        except ImportError:
+            raise
+        except Exception:
+            # Geçici DNS hatası - adresi reddetme, önbelleğe de alma
+            return True
+        with self._lock:
+            self._mx_cache[ascii_domain] = (result, now)
+        return result
+
+    def validate(self, email, check_mx=False):
+        """Tek adres doğrula - sonuç sözlüğü döndürür"""
+        email = (email or "").strip()
+        result = {'email': email, 'normalized': None, 'valid': False, 'reason': None, 'suggestion': None}
+
+        if email.count('@') != 1:
+            result['reason'] = "Geçersiz format"
+            return result
+        local_part, domain = email.split('@')
+        if not local_part or len(local_part) > 64 or not LOCAL_PART_RE.match(local_part):
+            result['reason'] = "Geçersiz kullanıcı adı"
+            return result
+
+        ascii_domain, reason, suggestion = self.check_domain(domain)
+        if reason:
+            result['reason'] = reason
+            return result
+        if suggestion:
+            result['suggestion'] = f"{local_part}@{suggestion}"
+        if check_mx and not self.has_mx(ascii_domain):
+            result['reason'] = NO_MX_REASON
+            return result
+
+        result['normalized'] = f"{local_part}@{ascii_domain}"
+        result['valid'] = True
+        return result
+
+    def validate_many(self, emails, check_mx=False):
+        """Adres listesini tek geçişte doğrula - sonuç sözlükleri listesi döndürür"""
+        if check_mx:
+            # MX sorguları benzersiz alan adı başına bir kez yapılır
+            domains = {email.rsplit('@', 1)[1] for email in emails if email and '@' in email}
+            for domain in domains:
+                ascii_domain, reason, _ = self.check_domain(domain.strip())
+                if not reason:
+                    self.has_mx(ascii_domain)
+        return [self.validate(email, check_mx) for email in emails]
+
+    def filter_valid(self, emails, check_mx=False):
+        """Geçerli adresleri döndür: (geçerliler, geçersiz sayısı)"""
+        valid = [email for email, result in zip(emails, self.validate_many(emails, check_mx)) if result['valid']]
+        return valid, len(emails) - len(valid)
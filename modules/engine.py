@@ -0,0 +1,547 @@
+import os
+import copy
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+
+from modules.config_manager import ConfigManager
+from modules.suppression_list import SuppressionList
+from modules.contact_history import ContactHistory
+from modules.email_validator import EmailValidator
+from modules.recipient_store import RecipientStore
+from modules.contact_importer import iter_file_contacts
+from modules.signature_renderer import SignatureRenderer
+from modules.job_scheduler import JobScheduler
+from modules.campaign_job import (CampaignJobRunner, build_job_spec, normalize_job_spec, remaining_recipients,
+                                  finish_job_run, defer_job, job_lease, resolve_smtp_settings)
+from modules.send_planner import SendPlanner
+from modules.backup import backup_database
+from modules.file_server import AttachmentOffloader, HostedFileRegistry, BackgroundServer
+from modules.tracking_server import TrackingStore, MessageTracker, create_tracking_app
+from modules.bounce_processor import BounceProcessor, IMAPMailbox, imap_host_for
+
+# finish_job_run / run_job durumlarının log karşılıkları
+JOB_STATUS_LABELS = {
+    'cancelled': "zamanlama iptal edildi",
+    'completed': "zamanlama tamamlandı",
+    'recurring': "tekrarlayan gönderim tamamlandı",
+    'planned': "kalan alıcılar plana göre gönderilecek",
+    'retry': "kalan alıcılar için devam zamanı kuruldu",
+    'busy': "başka bir süreçte (arayüz/servis) çalışıyor, atlandı",
+}
+
+
+def engine_settings(config):
+    """config.json içeriğini motorun kullandığı düz ayar sözlüğüne çevir (arayüzdeki varsayılanlarla)"""
+    s = config.get("settings", {})
+    schedule = config.get("schedule", {})
+    return {
+        'smtp_settings': {
+            'server': s.get("smtp_server", ""),
+            'port': int(s.get("smtp_port") or 587),
+            'username': s.get("sender_email", "").strip(),
+            'password': s.get("sender_password", "").strip(),
+        },
+        'bcc_enabled': s.get("bcc_enabled", False),
+        'email_delay': int(schedule.get("email_delay_schedule", s.get("email_delay_schedule", 3))),
+        'vcard_enabled': s.get("vcard_enabled", False),
+        'vcard_image_path': s.get("vcard_image_path", "") or None,
+        'signature_enabled': s.get("vcard_signature_enabled", False),
+        'signature_fields': {key: s.get(f"signature_{key}", "")
+                             for key in ('name', 'phone', 'mobile', 'email', 'web', 'address', 'services')},
+        'attach_image_originals': s.get("attach_image_originals", True),
+        'history_skip_days': int(schedule.get("history_skip_days", 0)),
+        'hourly_limit': int(schedule.get("hourly_limit", 30)),
+        'daily_limit': int(schedule.get("daily_limit", 150)),
+        'limit_enabled': schedule.get("limit_enabled", True),
+        'spread_enabled': schedule.get("spread_enabled", False),
+        'spread_weekdays_only': schedule.get("spread_weekdays_only", True),
+        'spread_start_hour': int(schedule.get("spread_start_hour", 9)),
+        'spread_end_hour': int(schedule.get("spread_end_hour", 18)),
+        'spread_jitter': int(schedule.get("spread_jitter", 30)),
+        'offload_enabled': s.get("offload_enabled", False),
+        'offload_threshold_mb': int(s.get("offload_threshold_mb", 5)),
+        'offload_base_url': s.get("offload_base_url", "").strip(),
+        'offload_port': int(s.get("offload_port", 8090)),
+        'tracking_enabled': s.get("tracking_enabled", False),
+        'tracking_base_url': s.get("tracking_base_url", "").strip(),
+        'tracking_embedded': s.get("tracking_embedded", True),
+        'tracking_clicks': s.get("tracking_clicks", True),
+        'tracking_port': int(s.get("tracking_port", 8080)),
+        'bounce_enabled': s.get("bounce_enabled", False),
+        'imap_server': s.get("imap_server", "").strip(),
+        'imap_port': int(s.get("imap_port") or 993),
+        'bounce_interval_minutes': int(s.get("bounce_interval_minutes", 15)),
+        'backup_dir': s.get("backup_dir", "").strip(),
+        'database': config.get("database", {}),
+    }
+
+
+class SendingLimiter:
+    """Saatlik/günlük gönderim sayaçları - config.json 'sending_stats' bölümünde tutulur
+
+    Arayüz ve servis (cli.py run-daemon) aynı sayaçları kullanır: her okuma-yazma config
+    kilidi altında diskteki son değerler üzerinde yapılır. Bir dilim göndermeden önce
+    reserve() ile kapasite ayrılır, bitince settle() ile kullanılmayan kısım geri bırakılır;
+    böylece iki süreç aynı boş kapasiteyi birlikte harcayamaz.
+    """
+
+    def __init__(self, config_manager, hourly_limit=30, daily_limit=150, enabled=True):
+        self.config_manager = config_manager
+        self.hourly_limit = hourly_limit
+        self.daily_limit = daily_limit
+        self.enabled = enabled
+        self.hourly_sent_count = 0
+        self.daily_sent_count = 0
+        now = datetime.now()
+        self.last_hourly_reset = now.replace(minute=0, second=0, microsecond=0)
+        self.last_daily_reset = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.load()
+
+    def load(self):
+        """Diskteki sayaçları oku ve süresi dolanları sıfırla"""
+        try:
+            stats = self.config_manager.load_config().get("sending_stats", {})
+        except (OSError, ValueError) as e:
+            print(f"Gönderim istatistikleri okunamadı: {e}")
+            stats = {}
+        try:
+            self.hourly_sent_count = max(0, stats.get("hourly_sent_count", 0))
+            self.daily_sent_count = max(0, stats.get("daily_sent_count", 0))
+            self.last_hourly_reset = datetime.fromisoformat(stats["last_hourly_reset"])
+            self.last_daily_reset = datetime.fromisoformat(stats["last_daily_reset"])
+        except (KeyError, ValueError, TypeError):
+            pass
+        self.refresh()
+
+    def save(self):
+        """Sayaçları yaz - çağıran config kilidini tutmalı (bkz. _update)"""
+        config = self.config_manager.load_config()
+        config["sending_stats"] = {
+            "hourly_sent_count": self.hourly_sent_count,
+            "daily_sent_count": self.daily_sent_count,
+            "last_hourly_reset": self.last_hourly_reset.isoformat(),
+            "last_daily_reset": self.last_daily_reset.isoformat(),
+            "last_save_time": datetime.now().isoformat(),
+        }
+        self.config_manager.save_config(config)
+
+    def refresh(self, now=None):
+        """Süresi dolan saatlik/günlük sayaçları sıfırla"""
+        now = now or datetime.now()
+        if now >= self.last_hourly_reset + timedelta(hours=1):
+            self.hourly_sent_count = 0
+            self.last_hourly_reset = now.replace(minute=0, second=0, microsecond=0)
+        if now >= self.last_daily_reset + timedelta(days=1):
+            self.daily_sent_count = 0
+            self.last_daily_reset = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _update(self, change):
+        """Kilit altında son değerleri oku, change(self) uygula ve kaydet"""
+        with self.config_manager.locked():
+            self.load()
+            result = change(self)
+            self.save()
+        return result
+
+    def _add(self, count):
+        self.hourly_sent_count = max(0, self.hourly_sent_count + count)
+        self.daily_sent_count = max(0, self.daily_sent_count + count)
+
+    def record(self, sent_count):
+        """Kapasite ayrılmadan yapılan gönderimleri say"""
+        self._update(lambda limiter: limiter._add(sent_count))
+
+    def _available(self, total_recipients):
+        if not self.enabled:
+            return total_recipients, "Limit kontrolü devre dışı"
+        safe_count = min(self.hourly_limit - self.hourly_sent_count,
+                         self.daily_limit - self.daily_sent_count, total_recipients)
+        if safe_count <= 0:
+            return 0, "Gönderim limiti doldu!"
+        return safe_count, f"Güvenli gönderim sayısı: {safe_count}/{total_recipients}"
+
+    def safe_count(self, total_recipients):
+        """Şu an limitleri aşmadan gönderilebilecek sayı ve açıklama (kapasite ayırmaz)"""
+        self.load()
+        return self._available(total_recipients)
+
+    def reserve(self, total_recipients):
+        """Gönderilebilecek sayıyı hesapla ve o kadar kapasiteyi sayaçlara işle
+
+        Dönüş: (sayı, açıklama, ayırma) - ayırma gönderimden sonra settle()'a verilir.
+        """
+        def change(limiter):
+            count, message = limiter._available(total_recipients)
+            limiter._add(count)
+            reservation = {'count': count, 'hourly_reset': limiter.last_hourly_reset.isoformat(),
+                           'daily_reset': limiter.last_daily_reset.isoformat()}
+            return count, message, reservation
+        return self._update(change)
+
+    def settle(self, reservation, sent_count):
+        """Ayrılan kapasiteden gönderilmeyen kısmı geri bırak
+
+        Ayırmadan sonra saat/gün dönmüşse o dönemin sayacına dokunulmaz (sıfırlanmıştır).
+        """
+        unused = reservation['count'] - sent_count
+        if not unused:
+            return
+
+        def change(limiter):
+            if limiter.last_hourly_reset.isoformat() == reservation['hourly_reset']:
+                limiter.hourly_sent_count = max(0, limiter.hourly_sent_count - unused)
+            if limiter.last_daily_reset.isoformat() == reservation['daily_reset']:
+                limiter.daily_sent_count = max(0, limiter.daily_sent_count - unused)
+        self._update(change)
+
+    def next_reset(self):
+        """Kapasitenin yeniden açılacağı an (epoch)"""
+        if self.daily_sent_count >= self.daily_limit:
+            return (self.last_daily_reset + timedelta(days=1)).timestamp()
+        return (self.last_hourly_reset + timedelta(hours=1)).timestamp()
+
+
+class EmailEngine:
+    """Arayüzden bağımsız gönderim motoru - ayarları config.json'dan okur
+
+    Gönderim, limit, filtreleme, zamanlanmış işler ve yedekleme burada toplanır; komut
+    satırı (cli.py) ve sunucu üzerinde çalışan servis bu sınıfı kullanır. Kalıcı dosyalar
+    (zamanlanmış işler, engelleme listesi, gönderim geçmişi) arayüzle ortaktır.
+    """
+
+    def __init__(self, config_path="config.json", log=print):
+        self.config_manager = ConfigManager(config_path)
+        self.log = log
+        self.settings = engine_settings(self.config_manager.load_config())
+        self.suppression_list = SuppressionList()
+        self.contact_history = ContactHistory()
+        self.email_validator = EmailValidator()
+        self.job_scheduler = JobScheduler()
+        self.signature_renderer = SignatureRenderer()
+        self.signature_renderer.update(self.settings['signature_fields'], self.settings['vcard_enabled'],
+                                       self.settings['signature_enabled'])
+        self.limiter = SendingLimiter(self.config_manager, self.settings['hourly_limit'],
+                                      self.settings['daily_limit'], self.settings['limit_enabled'])
+        self.tracking_store = None
+        self.servers = []
+        self._message_options = None
+        # Durdurma isteği (servis SIGTERM ile durdurulduğunda) - çalışan dilim sıradaki alıcıdan önce durur
+        self._stop_event = threading.Event()
+        self._active_runner = None
+
+    # ---- Alıcılar ve iş tanımları ----
+
+    def load_recipients(self, emails=(), files=()):
+        """Komut satırındaki adresler ve dosyalardan (CSV, TSV, XLSX, VCF) alıcı listesi"""
+        store = RecipientStore(self.suppression_list)
+        store.add_many((email, "") for email in emails)
+        for file_path in files:
+            store.add_many((contact['email'], contact['name']) for contact in iter_file_contacts(file_path))
+        return store
+
+    def send_planner(self, spread=None):
+        """Gönderim yayma açıksa ayarlardaki planlayıcı (kapalıysa None) - spread ayarı geçersiz kılar"""
+        s = self.settings
+        if not (s['spread_enabled'] if spread is None else spread):
+            return None
+        weekdays = (0, 1, 2, 3, 4) if s['spread_weekdays_only'] else tuple(range(7))
+        return SendPlanner(s['hourly_limit'], s['daily_limit'], s['spread_start_hour'], s['spread_end_hour'],
+                           weekdays, s['spread_jitter'] / 100)
+
+    def build_job(self, subject, body, store, attachments=(), due=None, kind='campaign', recurrence=None,
+                  spread=None):
+        """Arayüzdeki zamanlama ile aynı biçimde iş tanımı - imza eklenir, ayarlar sabitlenir
+
+        store: alıcılar ve kişiselleştirme alanları (RecipientStore)
+        """
+        s = self.settings
+        due = time.time() if due is None else due
+        attachments = [path for path in attachments if os.path.exists(path)]
+        settings = {
+            'bcc_enabled': s['bcc_enabled'],
+            'email_delay': s['email_delay'],
+            'vcard_image_path': s['vcard_image_path'] if s['vcard_enabled'] else None,
+            'attach_image_originals': s['attach_image_originals'],
+            'history_skip_days': s['history_skip_days'],
+        }
+        recipients = list(store.emails)
+        contexts = {email: store.get_context(email) for email in recipients}
+        plan = None
+        planner = self.send_planner(spread)
+        if planner is not None:
+            # Bugün gönderilmiş mesajlar ilk günün kotasından düşülür
+            same_day = datetime.fromtimestamp(due).date() == datetime.now().date()
+            plan = planner.plan(len(recipients), due, self.limiter.daily_sent_count if same_day else 0)
+        body = self.signature_renderer.render(body, attachments)
+        return build_job_spec(subject, body, recipients, attachments, s['smtp_settings'], settings, due, contexts,
+                              kind, recurrence, plan)
+
+    def schedule(self, job):
+        """İşi kalıcı zamanlayıcıya ekle (arayüz açıldığında da görünür)"""
+        return self.job_scheduler.add(job)
+
+    # ---- Gönderim ----
+
+    def message_options(self, serve=False):
+        """Büyük ek paylaşımı ve takip seçenekleri - serve=True ise gömülü sunucular da başlatılır"""
+        if self._message_options is not None:
+            return self._message_options
+        s = self.settings
+        options = {'attach_image_originals': s['attach_image_originals'], 'offloader': None, 'tracker': None}
+        if s['offload_enabled'] and s['offload_base_url']:
+            offloader = AttachmentOffloader(s['offload_base_url'], HostedFileRegistry(),
+                                            s['offload_threshold_mb'] * 1024 * 1024, port=s['offload_port'])
+            try:
+                if serve:
+                    offloader.ensure_server()
+                    self.servers.append(offloader)
+                options['offloader'] = offloader
+            except Exception as e:
+                self.log(f"Dosya paylaşım sunucusu başlatılamadı: {e}")
+        if s['tracking_enabled'] and s['tracking_base_url']:
+            self.tracking_store = self.tracking_store or TrackingStore()
+            self.tracking_store.start()
+            try:
+                if serve and s['tracking_embedded']:
+                    server = BackgroundServer(create_tracking_app(self.tracking_store), port=s['tracking_port'])
+                    server.start()
+                    self.servers.append(server)
+                options['tracker'] = MessageTracker(s['tracking_base_url'], self.tracking_store, s['tracking_clicks'])
+            except Exception as e:
+                self.log(f"Takip sunucusu başlatılamadı: {e}")
+        self._message_options = options
+        return options
+
+    def runner(self, job):
+        message_options = dict(self.message_options())
+        message_options['attach_image_originals'] = job['settings'].get('attach_image_originals', True)
+        return CampaignJobRunner(self.email_validator, self.suppression_list, self.contact_history,
+                                 message_options, log=self.log)
+
+    def current_smtp_settings(self):
+        """config.json'daki güncel SMTP ayarları (arayüzde değiştirilmiş olabilir)"""
+        try:
+            return engine_settings(self.config_manager.load_config())['smtp_settings']
+        except (OSError, ValueError) as e:
+            self.log(f"Ayarlar okunamadı, başlangıçtaki SMTP ayarları kullanılıyor: {e}")
+            return self.settings['smtp_settings']
+
+    def start_job_run(self, job_id, subject='Konu yok'):
+        """Zamanlayıcıdaki işi çalıştırmaya hazırla - arayüz ve servis ortak kullanır
+
+        İş kiralanır, alıcı/SMTP kontrol edilir ve limitten kapasite ayrılır. Dönüş:
+        ('run', (iş kopyası, güvenli sayı, ayırma)) veya dokunulmayacaksa ('busy', None),
+        ('removed', None) ya da ('limit', kapasitenin açılacağı zaman - iş oraya ertelendi).
+        Çalıştırma sonrası finish_job_run_result(), hata durumunda abort_job_run() çağrılmalı.
+        """
+        # İş önce kiralanır; diğer süreç aynı işi çalıştırıyorsa iki kez gönderilmez
+        job = self.job_scheduler.claim(job_id)
+        if job is None:
+            self.log(f"{subject}: {JOB_STATUS_LABELS['busy']}")
+            return 'busy', None
+        # Kayıt bitişte güncellenir; çalışma kopya üzerinde yapılır
+        job = normalize_job_spec(copy.deepcopy(job))
+        subject = job.get('subject', subject)
+        pending = remaining_recipients(job)
+        # Şifre iş dosyasında tutulmaz; kopyaya güncel ayarlardan eklenir (diske yazılmaz)
+        smtp_settings = job['smtp_settings'] = resolve_smtp_settings(job, self.current_smtp_settings())
+        if not pending or not (smtp_settings.get('server') and smtp_settings.get('username')
+                               and smtp_settings.get('password')):
+            self.log(f"Alıcı listesi boş veya SMTP ayarları eksik, iş kaldırıldı: {subject}")
+            self.job_scheduler.complete(job_id)
+            return 'removed', None
+
+        # Sayaçlar diğer süreçle ortak: kapasite kilit altında ayrılır
+        safe_count, message, reservation = self.limiter.reserve(len(pending))
+        if safe_count == 0:
+            next_reset = self.limiter.next_reset()
+            self.log(f"{message} {subject} {datetime.fromtimestamp(next_reset):%d.%m.%Y %H:%M} "
+                     f"itibarıyla tekrar denenecek")
+            return 'limit', defer_job(self.job_scheduler, job_id, due=next_reset)
+        self.log(f"Güvenli gönderim: {safe_count}/{len(pending)} alıcı - {subject}")
+        # Kira, dilimin süresine göre uzatılır
+        self.job_scheduler.claim(job_id, job_lease(job, safe_count))
+        return 'run', (job, safe_count, reservation)
+
+    def finish_job_run_result(self, job, result, reservation):
+        """Dilim sonucunu limite, gönderim geçmişine ve zamanlayıcıya uygula - (durum, sonraki zaman)"""
+        subject = job['subject']
+        self.limiter.settle(reservation, len(result['sent']))
+        if result['skipped']:
+            self.log(f"{result['skipped']} alıcı kontrollerden geçemediği için atlandı")
+        if result['sent']:
+            failed = set(result['failed'])
+            self.contact_history.record_many((r for r in result['sent'] if r not in failed), subject.strip())
+            self.log(f"{subject}: {len(result['sent'])}/{len(result['sent']) + len(result['failed'])} başarılı")
+        # Kalan alıcılar limitin yeniden açıldığı an devam eder (limit dolmadıysa saat başında)
+        status, next_due = finish_job_run(self.job_scheduler, job, result, retry_due=self.limiter.next_reset())
+        next_time = f" - sonraki: {datetime.fromtimestamp(next_due):%d.%m.%Y %H:%M}" if next_due else ""
+        self.log(f"{subject}: {JOB_STATUS_LABELS[status]}{next_time}")
+        return status, next_due
+
+    def abort_job_run(self, job_id, error):
+        """Çalıştırma hatası - iş kaybolmasın, RETRY_DELAY sonra tekrar denenir
+
+        Ayrılan kapasite geri bırakılmaz: hatadan önce kaçının gönderildiği bilinmez.
+        """
+        self.log(f"Zamanlanmış e-posta gönderilirken hata: {error}")
+        if self.job_scheduler.get(job_id) is not None:
+            return 'retry', defer_job(self.job_scheduler, job_id)
+        return 'removed', None
+
+    def run_job(self, job):
+        """Zamanlayıcıdaki işin bir dilimini çalıştır (arayüzdeki zamanlayıcıyla aynı kurallar)
+
+        Dönüş: (durum, sonraki zaman, gönderilen sayısı) - durum finish_job_run ile aynı;
+        ayrıca 'removed' (alıcı/SMTP yok), 'limit' (limit doldu, kapasitenin açılacağı
+        zamana ertelendi) ve 'busy' (iş başka süreçte çalışıyor, dokunulmadı).
+        """
+        job_id = job['id']
+        try:
+            status, value = self.start_job_run(job_id, job.get('subject', 'Konu yok'))
+            if status != 'run':
+                return status, value, 0
+            job, safe_count, reservation = value
+            runner = self._active_runner = self.runner(job)
+            try:
+                result = runner.run(job, safe_count)
+            finally:
+                self._active_runner = None
+            status, next_due = self.finish_job_run_result(job, result, reservation)
+            return status, next_due, len(result['sent'])
+        except Exception as e:
+            status, next_due = self.abort_job_run(job_id, e)
+            return status, next_due, 0
+
+    def run_pending(self, now=None):
+        """Zamanı gelen işleri sırayla çalıştır - çalıştırılan iş sayısını döndürür"""
+        due_jobs = self.job_scheduler.take_due(now)
+        count = 0
+        for job in due_jobs:
+            if self._stop_event.is_set():
+                # Çalıştırılmayan işler kayıtta kalır; sonraki açılışta yeniden sıraya girer
+                break
+            self.run_job(job)
+            count += 1
+        return count
+
+    def request_stop(self):
+        """Servisi durdur - çalışan dilim sıradaki alıcıdan önce durur ve sonucu işe işlenir"""
+        self._stop_event.set()
+        runner = self._active_runner
+        if runner is not None:
+            runner.stop_requested = True
+
+    def send(self, job, wait=False):
+        """İşi hemen göndermeye başla
+
+        Limit dolduğunda veya plan sonraki güne geçtiğinde kalan alıcılar zamanlayıcıda
+        kalır (run-daemon veya arayüz devam ettirir); wait=True ise bu çağrı bekleyip
+        işi kendisi bitirir. Dönüş: gönderilen adres sayısı
+        """
+        smtp_settings = resolve_smtp_settings(job, self.current_smtp_settings())
+        if not (smtp_settings.get('server') and smtp_settings.get('username') and smtp_settings.get('password')):
+            raise ValueError("SMTP ayarları eksik! config.json içindeki settings bölümünü kontrol edin.")
+        job_id = self.schedule(job)
+        sent = 0
+        while True:
+            stored = self.job_scheduler.get(job_id)
+            if stored is None:
+                break
+            if stored['due'] > time.time():
+                if not wait:
+                    self.log(f"Kalan {len(remaining_recipients(stored))} alıcı zamanlandı: "
+                             f"{datetime.fromtimestamp(stored['due']):%d.%m.%Y %H:%M}")
+                    break
+                time.sleep(max(0.0, stored['due'] - time.time()))
+            status, _, count = self.run_job(stored)
+            sent += count
+            if status == 'busy':
+                # Servis/arayüz işi devraldı - kalanları o gönderir
+                break
+        return sent
+
+    def poll_bounces(self):
+        """Posta kutusundaki geri dönüş/okundu bilgilerini işle (arayüzdeki kontrolle aynı hesap)"""
+        s = self.settings
+        smtp_settings = s['smtp_settings']
+        host = s['imap_server'] or imap_host_for(smtp_settings['server'])
+        mailbox = IMAPMailbox(host, smtp_settings['username'], smtp_settings['password'], port=s['imap_port'],
+                              use_ssl=(s['imap_port'] == 993))
+        events = BounceProcessor(mailbox, self.suppression_list).poll()
+        if events:
+            self.log(f"Geri dönüş/okundu bilgisi: {len(events)} yeni olay işlendi")
+        return events
+
+    def run_daemon(self, max_sleep=60):
+        """Zamanlanmış işleri sürekli çalıştır - en yakın işe kadar uyur
+
+        Ctrl+C ile veya request_stop() (cli.py'de SIGTERM) ile durur.
+        """
+        self.message_options(serve=True)
+        s = self.settings
+        next_bounce = time.time() if s['bounce_enabled'] else None
+        self.log(f"Servis başladı - {len(self.job_scheduler)} zamanlanmış iş")
+        try:
+            while not self._stop_event.is_set():
+                self.run_pending()
+                if next_bounce is not None and time.time() >= next_bounce:
+                    try:
+                        self.poll_bounces()
+                    except Exception as e:
+                        self.log(f"Geri dönüş kontrolü başarısız: {e}")
+                    next_bounce = time.time() + s['bounce_interval_minutes'] * 60
+                # Arayüzün yaptığı değişiklikler (yeni/iptal edilen işler) next_due içinde yeniden okunur
+                next_due = self.job_scheduler.next_due()
+                wake = time.time() + max_sleep if next_due is None else min(next_due, time.time() + max_sleep)
+                if next_bounce is not None:
+                    wake = min(wake, next_bounce)
+                self._stop_event.wait(max(0.5, wake - time.time()))
+            self.log("Servis durduruluyor")
+        except KeyboardInterrupt:
+            self.log("Servis durduruluyor")
+        finally:
+            self.close()
+
+    def close(self):
+        for server in self.servers:
+            try:
+                server.stop()
+            except Exception:
+                pass
+        self.servers = []
+        if self.tracking_store is not None:
+            self.tracking_store.stop()
+
+    # ---- İstatistik ve yedekleme ----
+
+    def stats(self):
+        """Gönderim sayaçları, zamanlanmış işler ve (varsa) takip özetleri"""
+        self.limiter.refresh()
+        next_job = self.job_scheduler.peek()
+        stats = {
+            'hourly_sent': f"{self.limiter.hourly_sent_count}/{self.limiter.hourly_limit}",
+            'daily_sent': f"{self.limiter.daily_sent_count}/{self.limiter.daily_limit}",
+            'scheduled_jobs': len(self.job_scheduler),
+            'next_job': None if next_job is None else {
+                'subject': next_job.get('subject'),
+                'due': datetime.fromtimestamp(next_job['due']).isoformat(timespec='minutes'),
+                'remaining': len(remaining_recipients(normalize_job_spec(next_job))),
+            },
+            'suppressed': len(self.suppression_list),
+            'contact_history': len(self.contact_history),
+        }
+        if os.path.exists("tracking_tokens.jsonl"):
+            store = self.tracking_store or TrackingStore()
+            stats['campaigns'] = store.get_campaign_stats()
+        return stats
+
+    def backup(self):
+        """Veritabanını config.json'daki ayarlarla yedekle - dosya yolu veya None"""
+        return backup_database(self.settings['database'], self.settings['backup_dir'], log=self.log)
+
+
+def format_stats(stats):
+    return json.dumps(stats, ensure_ascii=False, indent=2)
@@ -0,0 +1,40 @@
+import os
+import time
+from contextlib import contextmanager
+
+# Bu süreden eski kilit dosyası, çöken bir sürecin bıraktığı kabul edilip silinir
+STALE_LOCK_SECONDS = 30
+
+
+class FileLockTimeout(Exception):
+    """Kilit dosyası süresi içinde alınamadı"""
+
+
+@contextmanager
+def file_lock(lock_path, timeout=10.0):
+    """Süreçler arası kilit - arayüz ve arka plan servisi (cli.py run-daemon) ortak dosyaları
+    değiştirirken kullanır (kilit dosyası O_EXCL ile oluşturulur)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise FileLockTimeout(f"Dosya kilitli: {lock_path}")
+            time.sleep(0.05)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
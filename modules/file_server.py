@@ -0,0 +1,230 @@
+import os
+import hmac
+import json
+import base64
+import hashlib
+import secrets
+import threading
+import time
+from datetime import datetime
+
+try:
+    from flask import Flask, abort, send_file
+    from werkzeug.serving import make_server
+except ImportError:
+    Flask = None
+
+from modules.suppression_list import normalize_email
+
+
+DEFAULT_OFFLOAD_THRESHOLD = 5 * 1024 * 1024
+DEFAULT_LINK_TTL_DAYS = 30
+
+
+def file_digest(file_path, chunk_size=1024 * 1024):
+    """Büyük dosyayı belleğe almadan parça parça SHA-256 özetini hesapla"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class LinkSigner:
+    """HMAC-SHA256 ile imzalı, süreli indirme bağlantısı belirteci üretir ve doğrular"""
+
+    def __init__(self, secret):
+        self.secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+
+    def sign(self, file_id, email, expires):
+        payload = _b64encode(json.dumps([file_id, email, int(expires)], separators=(",", ":")).encode("utf-8"))
+        signature = _b64encode(hmac.new(self.secret, payload.encode("ascii"), hashlib.sha256).digest()[:16])
+        return f"{payload}.{signature}"
+
+    def verify(self, token, now=None):
+        """Geçerli belirteç için (dosya id, e-posta) döndür - geçersiz veya süresi dolmuşsa None"""
+        try:
+            payload, signature = token.split(".", 1)
+            expected = _b64encode(hmac.new(self.secret, payload.encode("ascii"), hashlib.sha256).digest()[:16])
+            if not hmac.compare_digest(signature, expected):
+                return None
+            file_id, email, expires = json.loads(_b64decode(payload))
+        except (ValueError, TypeError):
+            return None
+        if expires < (now or time.time()):
+            return None
+        return file_id, email
+
+
+class HostedFileRegistry:
+    """Bağlantı ile paylaşılan dosyaların kaydı ve indirme sayaçları
+
+    Dosyalar içerik özetine göre tekilleştirilir (hosted_files.json); indirmeler
+    downloads.jsonl dosyasına satır satır eklenir ve açılışta sayaçlara toplanır.
+    """
+
+    def __init__(self, path="hosted_files.json", downloads_path="downloads.jsonl"):
+        self.path = path
+        self.downloads_path = downloads_path
+        self.files = {}
+        self.secret = None
+        self.download_counts = {}   # dosya id -> {e-posta: sayı}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Kayıt ve indirme geçmişini yükle"""
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.files = data.get("files", {})
+                self.secret = data.get("secret")
+            except Exception as e:
+                print(f"Paylaşılan dosya kaydı okunamadı: {e}")
+        if not self.secret:
+            self.secret = secrets.token_hex(32)
+            self.save()
+
+        if os.path.exists(self.downloads_path):
+            try:
+                with open(self.downloads_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        counts = self.download_counts.setdefault(record['file_id'], {})
+                        counts[record['email']] = counts.get(record['email'], 0) + 1
+            except Exception as e:
+                print(f"İndirme geçmişi okunamadı: {e}")
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({"secret": self.secret, "files": self.files}, f, ensure_ascii=False, indent=2)
+
+    def register(self, file_path):
+        """Dosyayı paylaşıma ekle ve dosya kimliğini (içerik özetinin ilk 16 karakteri) döndür"""
+        file_id = file_digest(file_path)[:16]
+        with self._lock:
+            record = {'path': os.path.abspath(file_path), 'name': os.path.basename(file_path),
+                      'size': os.path.getsize(file_path)}
+            if self.files.get(file_id) != record:
+                self.files[file_id] = record
+                self.save()
+        return file_id
+
+    def get(self, file_id):
+        return self.files.get(file_id)
+
+    def record_download(self, file_id, email):
+        """İndirmeyi say ve geçmişe ekle"""
+        with self._lock:
+            counts = self.download_counts.setdefault(file_id, {})
+            counts[email] = counts.get(email, 0) + 1
+            with open(self.downloads_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'file_id': file_id, 'email': email,
+                                    'time': datetime.now().isoformat(timespec='seconds')},
+                                   ensure_ascii=False) + "\n")
+
+    def get_download_stats(self):
+        """Dosya başına özet: [{name, recipients, downloads}]"""
+        stats = []
+        for file_id, record in self.files.items():
+            counts = self.download_counts.get(file_id, {})
+            stats.append({'file_id': file_id, 'name': record['name'], 'size': record['size'],
+                          'recipients': len(counts), 'downloads': sum(counts.values())})
+        return stats
+
+
+def create_file_app(registry, signer):
+    """İmzalı indirme bağlantılarını sunan Flask uygulaması"""
+    if Flask is None:
+        raise ImportError("Dosya paylaşım sunucusu için Flask paketi gerekli (pip install Flask)")
+    app = Flask(__name__)
+
+    @app.route("/d/<token>")
+    def download(token):
+        verified = signer.verify(token)
+        if verified is None:
+            abort(403)
+        file_id, email = verified
+        record = registry.get(file_id)
+        if record is None or not os.path.exists(record['path']):
+            abort(404)
+        registry.record_download(file_id, email)
+        return send_file(record['path'], as_attachment=True, download_name=record['name'])
+
+    return app
+
+
+class BackgroundServer:
+    """WSGI uygulamasını arka plan thread'inde çalıştırır (uygulama kapanınca durdurulur)"""
+
+    def __init__(self, app, host="0.0.0.0", port=8090):
+        self.app = app
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._server = make_server(self.host, self.port, self.app, threaded=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
+            self._thread = None
+
+
+class AttachmentOffloader:
+    """Eşik üstündeki ekleri e-postaya koymak yerine imzalı indirme bağlantısı ile paylaşır"""
+
+    def __init__(self, base_url, registry=None, threshold=DEFAULT_OFFLOAD_THRESHOLD,
+                 ttl_days=DEFAULT_LINK_TTL_DAYS, host="0.0.0.0", port=8090):
+        self.base_url = base_url.rstrip("/")
+        self.registry = registry or HostedFileRegistry()
+        self.signer = LinkSigner(self.registry.secret)
+        self.threshold = threshold
+        self.ttl_days = ttl_days
+        self.host = host
+        self.port = port
+        self.server = None
+
+    def should_offload(self, file_path):
+        return os.path.getsize(file_path) > self.threshold
+
+    def register(self, file_path):
+        return self.registry.register(file_path)
+
+    def link(self, file_id, email):
+        """Alıcıya özel imzalı indirme bağlantısı"""
+        expires = time.time() + self.ttl_days * 86400
+        return f"{self.base_url}/d/{self.signer.sign(file_id, normalize_email(email), expires)}"
+
+    def ensure_server(self):
+        """Dosya sunucusunu (çalışmıyorsa) başlat"""
+        if self.server is None:
+            self.server = BackgroundServer(create_file_app(self.registry, self.signer), self.host, self.port)
+        self.server.start()
+
+    def stop(self):
+        if self.server is not None:
+            self.server.stop()
@@ -0,0 +1,93 @@
+import io
+import base64
+import threading
+from collections import OrderedDict
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+# Gövdedeki ön izleme 400 piksel genişlikte gösterilir; yüksek çözünürlüklü ekranlar için 2 katı üretilir
+PREVIEW_MAX_WIDTH = 800
+PREVIEW_QUALITY = 80
+
+
+class ImagePreviewer:
+    """Inline görsel ön izlemeleri için küçültülmüş ve yeniden sıkıştırılmış kopyalar üretir
+
+    Ön izleme kaynak dosyanın içerik özeti (AttachmentStore kaydı) başına bir kez üretilir
+    ve base64 kodlanmış haliyle saklanır; böylece kampanya boyunca her alıcıya aynı küçük
+    parça eklenir. Pillow yüklü değilse None döner ve çağıran orijinal görseli kullanır.
+    """
+
+    def __init__(self, max_width=PREVIEW_MAX_WIDTH, quality=PREVIEW_QUALITY, image_format="JPEG", cache_size=32):
+        self.max_width = max_width
+        self.quality = quality
+        self.image_format = image_format.upper()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        return Image is not None
+
+    def preview(self, entry):
+        """Önbellek kaydından (sha256, raw) ön izleme kaydı üret - üretilemezse None"""
+        if Image is None:
+            return None
+        key = (entry['sha256'], self.max_width, self.quality, self.image_format)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        try:
+            preview = self._render(entry['raw'])
+        except Exception as e:
+            print(f"Görsel ön izleme oluşturulamadı: {e}")
+            return None
+        if preview is None:
+            return None
+
+        with self._lock:
+            self._cache[key] = preview
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return preview
+
+    def _render(self, raw):
+        image = Image.open(io.BytesIO(raw))
+        if getattr(image, "is_animated", False):
+            # Hareketli GIF'ler bozulmasın diye olduğu gibi bırakılır
+            return None
+        if image.width > self.max_width:
+            height = max(1, round(image.height * self.max_width / image.width))
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+
+        if self.image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            # Saydamlık beyaz zemin üzerine düzleştirilir
+            rgba = image.convert("RGBA")
+            background = Image.new("RGB", rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.split()[-1])
+            image = background
+
+        buffer = io.BytesIO()
+        image.save(buffer, self.image_format, quality=self.quality, optimize=True)
+        data = buffer.getvalue()
+        if len(data) >= len(raw):
+            # Zaten küçük olan görseller için yeniden sıkıştırma kazanç sağlamaz
+            return None
+        return {
+            'size': len(data),
+            'width': image.width,
+            'height': image.height,
+            'subtype': self.image_format.lower(),
+            'base64': base64.encodebytes(data).decode('ascii'),
+        }
+
+
+default_image_previewer = ImagePreviewer()
@@ -0,0 +1,221 @@
+import os
+import json
+import time
+import heapq
+import uuid
+import threading
+from contextlib import contextmanager
+
+from modules.file_lock import file_lock
+
+# Başka süreçte çalışan iş için kiralama süresi (çağıran daha uzun süre isteyebilir)
+DEFAULT_LEASE = 600
+
+
+class JobScheduler:
+    """Kalıcı, öncelik kuyruğu (heap) tabanlı iş zamanlayıcı
+
+    İşler 'due' (epoch saniye) anahtarına göre bir min-heap'te tutulur; en yakın iş O(1)
+    ile okunur, ekleme/çıkarma O(log n)'dir. İptal ve yeniden zamanlama heap'i taramaz:
+    eski girişler sürüm numarasıyla geçersiz sayılır ve sıraya geldiklerinde atlanır.
+    İşler her değişiklikte JSON dosyasına (atomik olarak) yazılır ve açılışta geri yüklenir;
+    '_' ile başlayan anahtarlar yalnızca bellekte tutulur.
+
+    Dosya arayüz ve arka plan servisi (cli.py run-daemon) tarafından birlikte kullanılabilir:
+    her değişiklik kilit dosyası altında diskteki son hal yeniden okunarak yapılır ve
+    çalıştırılacak iş önce claim() ile kiralanır ('running_by'); kirası geçerli olan iş
+    başka süreçte tekrar çalıştırılmaz.
+    """
+
+    def __init__(self, path="scheduled_jobs.json"):
+        self.path = path
+        self.lock_path = path + ".lock"
+        # Bu zamanlayıcı örneğinin (süreç) kimliği - kiralamalarda kullanılır
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.jobs = {}      # iş id -> iş sözlüğü
+        self._heap = []     # (due, sürüm, iş id)
+        self._versions = {}
+        self._counter = 0
+        self._stamp = None  # son okunan/yazılan dosyanın (mtime, boyut) bilgisi
+        self._lock = threading.RLock()
+        self.load()
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __contains__(self, job_id):
+        return job_id in self.jobs
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self):
+        """Kayıtlı işleri yükle ve heap'i yeniden kur"""
+        with self._lock:
+            self.jobs = {}
+            self._heap = []
+            self._versions = {}
+            self._stamp = self._file_stamp()
+            if self._stamp is None:
+                return
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    jobs = json.load(f)
+            except Exception as e:
+                print(f"Zamanlanmış işler okunamadı: {e}")
+                return
+            for job in jobs:
+                self._push(job)
+
+    def refresh(self):
+        """Dosya başka süreçte değiştiyse yeniden yükle - yüklendiyse True"""
+        with self._lock:
+            if self._file_stamp() == self._stamp:
+                return False
+            self.load()
+            return True
+
+    @contextmanager
+    def _modify(self):
+        """Diskteki son hal üzerinde değişiklik yap ve kaydet (kilit altında)"""
+        with self._lock, file_lock(self.lock_path):
+            self.refresh()
+            yield
+            self.save()
+
+    def save(self):
+        """İşleri dosyaya atomik olarak yaz (yarım yazılmış dosya kalmaz)"""
+        with self._lock:
+            serializable = [{key: value for key, value in job.items() if not key.startswith('_')}
+                            for job in self.jobs.values()]
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(serializable, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+            self._stamp = self._file_stamp()
+
+    def _push(self, job):
+        self._counter += 1
+        self.jobs[job['id']] = job
+        self._versions[job['id']] = self._counter
+        heapq.heappush(self._heap, (job['due'], self._counter, job['id']))
+
+    def add(self, job, due=None):
+        """İşi ekle (id yoksa üretilir) ve id'sini döndür"""
+        with self._modify():
+            job.setdefault('id', uuid.uuid4().hex[:12])
+            if due is not None:
+                job['due'] = float(due)
+            self._push(job)
+        return job['id']
+
+    def get(self, job_id):
+        """Kayıtlı iş (yoksa None)"""
+        with self._lock:
+            self.refresh()
+            return self.jobs.get(job_id)
+
+    def _leased_by_other(self, job, now):
+        lease = job.get('running_by')
+        return bool(lease) and lease.get('owner') != self.owner and lease.get('until', 0) > now
+
+    def claim(self, job_id, lease=DEFAULT_LEASE, now=None):
+        """İşi bu süreç adına lease saniyeliğine kirala
+
+        Dönüş: diskteki güncel iş sözlüğü; iş silinmişse veya başka süreçte çalışıyorsa None.
+        Aynı süreç tekrar çağırırsa kira uzatılır. reschedule() ve complete() kirayı bırakır.
+        """
+        now = time.time() if now is None else now
+        with self._modify():
+            job = self.jobs.get(job_id)
+            if job is None or self._leased_by_other(job, now):
+                return None
+            job['running_by'] = {'owner': self.owner, 'pid': os.getpid(), 'until': now + lease}
+            return job
+
+    def reschedule(self, job_id, due, **fields):
+        """İşin zamanını değiştir (verilen alanlar aynı yazımda güncellenir) ve kirayı bırak"""
+        with self._modify():
+            job = self.jobs.get(job_id)
+            if job is None:
+                return False
+            job.update(fields)
+            job.pop('running_by', None)
+            job['due'] = float(due)
+            self._push(job)
+        return True
+
+    def cancel(self, job_id):
+        """İşi kaldır - heap girişi sırası geldiğinde atlanır"""
+        with self._modify():
+            job = self.jobs.pop(job_id, None)
+            self._versions.pop(job_id, None)
+        return job
+
+    def update(self, job_id, **fields):
+        """İşin alanlarını güncelle ('due' için reschedule kullanılmalı)"""
+        with self._modify():
+            job = self.jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+        return job
+
+    def _discard_stale(self):
+        heap = self._heap
+        while heap and self._versions.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def peek(self):
+        """En yakın zamanlı iş (yoksa None)"""
+        with self._lock:
+            self.refresh()
+            self._discard_stale()
+            return self.jobs[self._heap[0][2]] if self._heap else None
+
+    def next_due(self):
+        job = self.peek()
+        return job['due'] if job else None
+
+    def take_due(self, now=None):
+        """Zamanı gelmiş işleri sırayla heap'ten al
+
+        İşler kayıtta kalır; çalıştırılmadan önce claim() ile kiralanmalı, çalıştıktan
+        sonra complete() ile silinmeli veya reschedule() ile yeniden zamanlanmalıdır.
+        Böylece çalışma sırasında uygulama kapanırsa iş sonraki açılışta tekrar sıraya
+        girer. Başka süreçte çalışan işler kira bitimine ertelenir (verilmez).
+        """
+        now = time.time() if now is None else now
+        due_jobs = []
+        leased = []
+        with self._lock:
+            self.refresh()
+            self._discard_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, job_id = heapq.heappop(self._heap)
+                self._versions.pop(job_id, None)
+                job = self.jobs[job_id]
+                if self._leased_by_other(job, now):
+                    leased.append(job)
+                else:
+                    due_jobs.append(job)
+                self._discard_stale()
+            for job in leased:
+                # Diğer süreç bitirince dosya değişir ve yeniden yüklenir; çökerse kira bitiminde denenir
+                self._counter += 1
+                self._versions[job['id']] = self._counter
+                heapq.heappush(self._heap, (job['running_by']['until'], self._counter, job['id']))
+        return due_jobs
+
+    def complete(self, job_id):
+        """Tamamlanan işi kayıttan sil"""
+        return self.cancel(job_id)
+
+    def sorted_jobs(self):
+        """Arayüz için zamanına göre sıralı iş listesi"""
+        with self._lock:
+            self.refresh()
+            return sorted(self.jobs.values(), key=lambda job: job['due'])
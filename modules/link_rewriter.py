@@ -0,0 +1,61 @@
+import re
+import json
+import hashlib
+from html import unescape
+
+
+# <a ... href="..."> bağlantıları (tek veya çift tırnaklı)
+HREF_RE = re.compile(r'''(<a\b[^>]*?\bhref\s*=\s*)(["'])(.*?)\2''', re.IGNORECASE | re.DOTALL)
+# Takip edilmeyecek bağlantı türleri
+SKIP_PREFIXES = ("mailto:", "tel:", "sms:", "cid:", "#", "javascript:")
+
+TRACKED_HREF = '{base_url}/c/{{{{_track_token}}}}/{index}'
+
+
+def is_trackable(url):
+    """Yönlendirme ile takip edilebilecek (http/https, kişiselleştirme içermeyen) bağlantı mı"""
+    lowered = url.strip().lower()
+    if not lowered or lowered.startswith(SKIP_PREFIXES):
+        return False
+    # Alıcıya göre değişen ({{...}}) hedefler kampanya başına tek haritaya sığmaz
+    if "{{" in url:
+        return False
+    return lowered.startswith(("http://", "https://", "www."))
+
+
+def normalize_url(url):
+    """HTML varlıklarını çöz ve şemasız (www.) adreslere https ekle"""
+    url = unescape(url.strip())
+    if url.lower().startswith("www."):
+        url = "https://" + url
+    return url
+
+
+def links_id(urls):
+    """Bağlantı listesinin kimliği (aynı liste her zaman aynı kimliği alır)"""
+    return hashlib.sha1(json.dumps(urls).encode("utf-8")).hexdigest()[:12]
+
+
+def rewrite_links(html, base_url):
+    """HTML'deki bağlantıları alıcı belirteci yuvası içeren takip yönlendirmesine çevir
+
+    Dönüş: (yeniden yazılmış HTML, [hedef URL, ...]) - aynı hedef tek indeks alır.
+    Yeniden yazım kampanya başına bir kez yapılır; alıcı başına yalnızca {{_track_token}}
+    yuvası doldurulur.
+    """
+    base_url = base_url.rstrip("/")
+    urls = []
+    index_of = {}
+
+    def replace(match):
+        prefix, quote, url = match.groups()
+        if not is_trackable(url):
+            return match.group(0)
+        target = normalize_url(url)
+        index = index_of.get(target)
+        if index is None:
+            index = index_of[target] = len(urls)
+            urls.append(target)
+        return f"{prefix}{quote}{TRACKED_HREF.format(base_url=base_url, index=index)}{quote}"
+
+    return HREF_RE.sub(replace, html), urls
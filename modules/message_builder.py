@@ -0,0 +1,264 @@
+import os
+import re
+from html import escape as escape_html
+from collections import OrderedDict
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from email.mime.nonmultipart import MIMENonMultipart
+
+from modules.attachment_store import default_attachment_store
+from modules.image_preview import default_image_previewer
+
+
+# {{firma_adi}} biçimindeki kişiselleştirme alanları
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+IMAGE_SUBTYPES = {'.jpg': 'jpeg', '.jpeg': 'jpeg', '.png': 'png', '.gif': 'gif', '.bmp': 'bmp'}
+
+# Şablonlarda kullanılabilecek alanlar (alıcı bağlamındaki anahtarlar)
+PERSONALIZATION_FIELDS = ("firma_adi", "yetkili_adi", "ad_soyad", "email", "il", "sektor")
+
+HOSTED_LINKS_HTML = """
+<table role="presentation" cellpadding="0" cellspacing="0" border="0" style="margin-top:20px; font-family: 'Segoe UI', Arial, sans-serif; font-size:14px;">
+  <tr><td style="font-weight:600; color:#111827; padding-bottom:6px;">📎 İndirme Bağlantıları</td></tr>
+  {rows}
+</table>
+"""
+HOSTED_LINK_HTML = '<tr><td style="padding:2px 0;"><a href="{{{{_hosted_link_{index}}}}}" style="color:#2563eb;">{name}</a> <span style="color:#6B7280;">({size:.1f} MB)</span></td></tr>'
+
+
+def html_to_plain(text):
+    """HTML gövdeden düz metin sürümü üret (etiketleri temizle)"""
+    text = HTML_TAG_RE.sub('', text)
+    text = text.replace('&nbsp;', ' ')
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+class CompiledTemplate:
+    """Yer tutucuları önceden ayrıştırılmış şablon - render yalnızca parçaları birleştirir"""
+
+    __slots__ = ("literals", "fields")
+
+    def __init__(self, text):
+        parts = PLACEHOLDER_RE.split(text or "")
+        self.literals = parts[0::2]
+        self.fields = parts[1::2]
+
+    @property
+    def is_static(self):
+        return not self.fields
+
+    def render(self, context=None, escape=False):
+        """Bağlamdaki değerleri yer tutuculara yerleştir (escape=True ise HTML kaçışı uygulanır)"""
+        literals = self.literals
+        if not self.fields:
+            return literals[0]
+        context = context or {}
+        out = [literals[0]]
+        for field, literal in zip(self.fields, literals[1:]):
+            value = context.get(field)
+            value = "" if value is None else str(value)
+            out.append(escape_html(value) if escape else value)
+            out.append(literal)
+        return "".join(out)
+
+
+def encoded_part(entry, maintype, subtype):
+    """Önbellekteki base64 içerikten MIME parçası oluştur (yeniden kodlama yapılmaz)"""
+    part = MIMENonMultipart(maintype, subtype)
+    part.set_payload(entry['base64'])
+    part['Content-Transfer-Encoding'] = 'base64'
+    return part
+
+
+def image_subtype(file_path):
+    """Uzantıdan görsel MIME alt tipini belirle"""
+    return IMAGE_SUBTYPES.get(os.path.splitext(file_path)[1].lower(), 'octet-stream')
+
+
+class PreparedMessage:
+    """Kampanya başına bir kez hazırlanan mesaj iskeleti
+
+    Konu/gövde şablonları derlenir ve ekler, inline görseller, kartvizit gibi alıcıdan
+    bağımsız MIME parçaları bir kez oluşturulur; alıcı başına yalnızca değişken metin
+    parçaları render edilip hazır parçalar yeni zarfa eklenir.
+    """
+
+    def __init__(self, subject, body, sender, attachments=None, is_html=False, vcard_image_path=None,
+                 attachment_store=None, attach_image_originals=True, image_previewer=None, offloader=None,
+                 tracker=None):
+        self.sender = sender
+        self.attachment_store = attachment_store or default_attachment_store
+        self.image_previewer = image_previewer or default_image_previewer
+        self.attach_image_originals = attach_image_originals
+        self.offloader = offloader
+        # Açılma takibi yalnızca HTML gövdede (piksel) yapılabilir
+        self.tracker = tracker if is_html else None
+        self.campaign = subject
+        self.is_html = is_html
+        # Eşik üstündeki ekler bağlantı olarak gider: [(dosya id, ad, boyut, yol)]
+        self.hosted_files = self.register_hosted_files(attachments or [])
+        plain_body = html_to_plain(body) if is_html else body
+        if self.hosted_files:
+            if is_html:
+                body = body + self.hosted_links_block(html=True)
+            plain_body = plain_body + self.hosted_links_block(html=False)
+        self.links_id = None
+        if self.tracker is not None:
+            # Bağlantılar kampanya başına bir kez takip yönlendirmesine çevrilir
+            body, self.links_id = self.tracker.rewrite_links(body)
+            body = body + self.tracker.pixel_html()
+        self.subject_template = CompiledTemplate(subject)
+        self.html_template = CompiledTemplate(body) if is_html else None
+        self.plain_template = CompiledTemplate(plain_body)
+        self.static_parts = self.build_static_parts(attachments or [], vcard_image_path)
+        # Kişiselleştirme yoksa metin parçaları da tek sefer oluşturulur
+        self._static_alternative = None
+        if self.subject_template.is_static and self.plain_template.is_static and \
+                (self.html_template is None or self.html_template.is_static):
+            self._static_alternative = self.build_alternative(None)
+
+    def register_hosted_files(self, attachments):
+        """Bağlantı ile paylaşılacak büyük ekleri dosya sunucusuna kaydet"""
+        if self.offloader is None:
+            return []
+        hosted = []
+        for file_path in attachments:
+            if os.path.exists(file_path) and self.offloader.should_offload(file_path):
+                hosted.append((self.offloader.register(file_path), os.path.basename(file_path),
+                               os.path.getsize(file_path), file_path))
+        return hosted
+
+    def hosted_links_block(self, html):
+        """İndirme bağlantıları bölümü - bağlantılar alıcı başına {{_hosted_link_N}} yuvasına yerleşir"""
+        if html:
+            rows = "".join(HOSTED_LINK_HTML.format(index=i, name=escape_html(name), size=size / (1024 * 1024))
+                           for i, (_, name, size, _) in enumerate(self.hosted_files))
+            return HOSTED_LINKS_HTML.format(rows=rows)
+        rows = "".join(f"\n- {name} ({size / (1024 * 1024):.1f} MB): {{{{_hosted_link_{i}}}}}"
+                       for i, (_, name, size, _) in enumerate(self.hosted_files))
+        return f"\n\nİndirme bağlantıları:{rows}"
+
+    def build_static_parts(self, attachments, vcard_image_path):
+        """Alıcıdan bağımsız MIME parçalarını oluştur
+
+        Dosya içerikleri ek önbelleğinden (AttachmentStore) gelir. Inline ön izlemede görselin
+        küçültülmüş kopyası kullanılır; orijinal yalnızca ek olarak (attach_image_originals) gider.
+        """
+        parts = []
+        store = self.attachment_store
+
+        # Ek dosyalardaki görsellerin ön izlemesini inline olarak ekle
+        image_counter = 1
+        for file_path in attachments:
+            if os.path.exists(file_path) and os.path.splitext(file_path)[1].lower() in IMAGE_EXTENSIONS:
+                try:
+                    entry = store.get(file_path)
+                    preview = self.image_previewer.preview(entry)
+                    if preview is not None:
+                        part = encoded_part(preview, 'image', preview['subtype'])
+                    else:
+                        part = encoded_part(entry, 'image', image_subtype(file_path))
+                    part.add_header('Content-ID', f'<image{image_counter}>')
+                    part.add_header('Content-Disposition', 'inline', filename=os.path.basename(file_path))
+                    parts.append(part)
+                    image_counter += 1
+                except Exception as e:
+                    print(f"Görsel ön izleme eklenirken hata: {e}")
+
+        # Kartvizit görselini en sona inline olarak ekle (eğer varsa)
+        if vcard_image_path and os.path.exists(vcard_image_path):
+            try:
+                part = encoded_part(store.get(vcard_image_path), 'image', image_subtype(vcard_image_path))
+                part.add_header('Content-ID', '<kartvizit>')
+                part.add_header('Content-Disposition', 'inline', filename=os.path.basename(vcard_image_path))
+                parts.append(part)
+            except Exception as e:
+                print(f"Kartvizit görseli eklenirken hata: {e}")
+
+        # Ek dosyaları en sona ekle (görsellerin orijinali isteğe bağlı, büyük ekler bağlantı olarak gider)
+        hosted_paths = {file_path for _, _, _, file_path in self.hosted_files}
+        for file_path in attachments:
+            if file_path in hosted_paths:
+                continue
+            if not self.attach_image_originals and os.path.splitext(file_path)[1].lower() in IMAGE_EXTENSIONS:
+                continue
+            if os.path.exists(file_path):
+                part = encoded_part(store.get(file_path), 'application', 'octet-stream')
+                part.add_header('Content-Disposition', 'attachment',
+                                filename=('utf-8', '', os.path.basename(file_path)))
+                parts.append(part)
+
+        return parts
+
+    def build_alternative(self, context):
+        """Düz metin + HTML gövdeyi içeren multipart/alternative parçası"""
+        alternative_part = MIMEMultipart('alternative')
+        alternative_part.attach(MIMEText(self.plain_template.render(context), 'plain', 'utf-8'))
+        if self.html_template is not None:
+            alternative_part.attach(MIMEText(self.html_template.render(context, escape=True), 'html', 'utf-8'))
+        return alternative_part
+
+    def build(self, to, context=None):
+        """Alıcıya özel mesajı oluştur
+
+        Dönüş: (mesaj, takip kaydı) - takip kaydı (takip yoksa None) gönderim başarılı
+        olduktan sonra commit_tracking ile kaydedilmelidir.
+        """
+        context = dict(context or {})
+        context.setdefault("email", to)
+        for i, (file_id, _, _, _) in enumerate(self.hosted_files):
+            context[f"_hosted_link_{i}"] = self.offloader.link(file_id, to)
+        tracking_record = None
+        if self.tracker is not None:
+            tracking_record = self.tracker.new_token(to, self.campaign, self.links_id)
+            context["_track_token"] = tracking_record["t"]
+
+        # Ana mesaj - related type kullan (inline görseller için)
+        msg = MIMEMultipart('related')
+        msg['From'] = self.sender
+        msg['To'] = to
+        msg['Subject'] = self.subject_template.render(context)
+        msg['Disposition-Notification-To'] = self.sender
+        msg['Return-Receipt-To'] = self.sender
+        msg['X-Confirm-Reading-To'] = self.sender
+
+        msg.attach(self._static_alternative or self.build_alternative(context))
+        for part in self.static_parts:
+            msg.attach(part)
+        return msg, tracking_record
+
+    def commit_tracking(self, tracking_record):
+        """SMTP'nin kabul ettiği mesajın takip belirtecini kaydet"""
+        if tracking_record is not None:
+            self.tracker.commit_token(tracking_record)
+
+
+_prepared_cache = OrderedDict()
+PREPARED_CACHE_SIZE = 8
+
+
+def get_prepared_message(subject, body, sender, attachments=None, is_html=False, vcard_image_path=None,
+                         attach_image_originals=True, offloader=None, tracker=None):
+    """Aynı kampanya parametreleri için hazırlanmış mesajı önbellekten döndür"""
+    attachments = tuple(attachments or ())
+    # Dosya değişikliklerini yakalamak için değiştirilme zamanı ve boyut da anahtarın parçası
+    stamps = tuple((os.path.getmtime(path), os.path.getsize(path)) if os.path.exists(path) else None
+                   for path in attachments + ((vcard_image_path,) if vcard_image_path else ()))
+    offload_key = (id(offloader), offloader.threshold) if offloader is not None else None
+    key = (subject, body, sender, attachments, is_html, vcard_image_path, attach_image_originals, offload_key,
+           id(tracker) if tracker is not None else None, stamps)
+    prepared = _prepared_cache.get(key)
+    if prepared is None:
+        prepared = PreparedMessage(subject, body, sender, list(attachments), is_html, vcard_image_path,
+                                   attach_image_originals=attach_image_originals, offloader=offloader,
+                                   tracker=tracker)
+        _prepared_cache[key] = prepared
+        if len(_prepared_cache) > PREPARED_CACHE_SIZE:
+            _prepared_cache.popitem(last=False)
+    else:
+        _prepared_cache.move_to_end(key)
+    return prepared
@@ -0,0 +1,109 @@
+class RecipientStore:
+    """Alıcı listesinin bellekteki asıl kaynağı - sütun bazlı diziler ve e-posta indeksi
+
+    E-posta, ad ve durum bilgileri paralel listelerde tutulur; küçük harfe çevrilmiş
+    e-posta -> satır indeksi sözlüğü ile mükerrer kontrolü O(1) yapılır.
+    suppression verilirse (SuppressionList) listedeki adresler hiç eklenmez.
+    known_statuses (normalize e-posta -> durum) verilirse eklenen adresler kayıtlı durumla
+    (ör. geri dönüş/okundu) başlar.
+    fields dizisi şablon kişiselleştirme alanlarını (firma_adi, yetkili_adi ...) tutar.
+    """
+
+    def __init__(self, suppression=None, known_statuses=None):
+        self.emails = []
+        self.names = []
+        self.statuses = []
+        self.fields = []
+        self._index = {}
+        self.suppression = suppression
+        self.known_statuses = known_statuses if known_statuses is not None else {}
+
+    def __len__(self):
+        return len(self.emails)
+
+    def contains(self, email):
+        """E-posta listede var mı (büyük/küçük harf duyarsız)"""
+        return email.strip().lower() in self._index
+
+    def add(self, email, name="", status="Aktif", fields=None):
+        """Tek alıcı ekle - eklendiyse True, mükerrer veya geçersizse False döner"""
+        email = email.strip()
+        if not email or '@' not in email:
+            return False
+        email_lower = email.lower()
+        if email_lower in self._index:
+            return False
+        if self.suppression is not None and email_lower in self.suppression:
+            return False
+        self._index[email_lower] = len(self.emails)
+        self.emails.append(email)
+        self.names.append(name)
+        self.statuses.append(self.known_statuses.get(email_lower, status))
+        self.fields.append(fields)
+        return True
+
+    def add_many(self, contacts, status="Aktif"):
+        """(e-posta, ad) veya (e-posta, ad, alanlar) kayıtlarını toplu ekle
+
+        Dönüş: (eklenen, mükerrer, engellenen) sayıları
+        """
+        index = self._index
+        emails = self.emails
+        names = self.names
+        statuses = self.statuses
+        fields = self.fields
+        suppression = self.suppression
+        known_statuses = self.known_statuses
+        added = 0
+        duplicates = 0
+        suppressed = 0
+        for contact in contacts:
+            email = contact[0]
+            if not email:
+                continue
+            email = email.strip()
+            if '@' not in email:
+                continue
+            email_lower = email.lower()
+            if email_lower in index:
+                duplicates += 1
+                continue
+            if suppression is not None and email_lower in suppression:
+                suppressed += 1
+                continue
+            index[email_lower] = len(emails)
+            emails.append(email)
+            names.append(contact[1])
+            statuses.append(known_statuses.get(email_lower, status))
+            fields.append(contact[2] if len(contact) > 2 else None)
+            added += 1
+        return added, duplicates, suppressed
+
+    def row(self, row):
+        """Satırı (e-posta, ad, durum) olarak döndür"""
+        return self.emails[row], self.names[row], self.statuses[row]
+
+    def get_context(self, email):
+        """Şablon kişiselleştirme bağlamı (listede olmayan adres için yalnızca e-posta)"""
+        row = self._index.get(email.strip().lower())
+        if row is None:
+            return {'email': email}
+        context = dict(self.fields[row] or {})
+        context['email'] = self.emails[row]
+        context['ad_soyad'] = self.names[row]
+        return context
+
+    def set_status(self, email, status):
+        """Alıcının durumunu güncelle - satır indeksini döndürür (yoksa None)"""
+        row = self._index.get(email.strip().lower())
+        if row is not None:
+            self.statuses[row] = status
+        return row
+
+    def clear(self):
+        """Tüm alıcıları temizle"""
+        self.emails = []
+        self.names = []
+        self.statuses = []
+        self.fields = []
+        self._index = {}
@@ -0,0 +1,200 @@
+import bisect
+from datetime import datetime, timedelta
+
+
+# Alan sınırları: dakika, saat, ayın günü, ay, haftanın günü (0=Pazar, 7 de Pazar kabul edilir)
+CRON_FIELDS = (
+    ('dakika', 0, 59),
+    ('saat', 0, 23),
+    ('gün', 1, 31),
+    ('ay', 1, 12),
+    ('haftanın günü', 0, 7),
+)
+MONTH_NAMES = {name: i for i, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1)}
+DAY_NAMES = {name: i for i, name in enumerate(('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'))}
+# Eşleşme bulunamazsa aramayı sınırla (ör. "0 0 30 2 *" hiç gerçekleşmez)
+MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_value(token, names):
+    token = token.strip().lower()
+    if token in names:
+        return names[token]
+    return int(token)
+
+
+def _parse_field(text, index):
+    """Tek cron alanını izin verilen değerlerin sıralı listesine çevir"""
+    name, low, high = CRON_FIELDS[index]
+    names = MONTH_NAMES if index == 3 else DAY_NAMES if index == 4 else {}
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"Geçersiz adım ({name}): {step_text}")
+        if part in ('*', ''):
+            start, end = low, high
+        elif '-' in part:
+            start_text, end_text = part.split('-', 1)
+            start, end = _parse_value(start_text, names), _parse_value(end_text, names)
+        else:
+            start = _parse_value(part, names)
+            # "5/15" biçimi: başlangıçtan alanın sonuna kadar
+            end = high if step > 1 else start
+        if not (low <= start <= high and low <= end <= high and start <= end):
+            raise ValueError(f"Geçersiz {name} değeri: {part}")
+        values.update(range(start, end + 1, step))
+    if index == 4 and 7 in values:
+        values.discard(7)
+        values.add(0)
+    return sorted(values)
+
+
+class CronExpression:
+    """5 alanlı cron ifadesi (dakika saat gün ay haftanın-günü)
+
+    Sonraki çalışma zamanı dakika dakika taranmaz: uymayan ay/gün/saat/dakika alanları
+    izin verilen bir sonraki değere atlanır (bisect), bu yüzden hesap birkaç adımda biter.
+    Gün ve haftanın günü alanlarının ikisi de kısıtlıysa standart cron gibi VEYA ile birleşir.
+    """
+
+    def __init__(self, expression):
+        self.expression = " ".join(expression.split())
+        parts = self.expression.split(" ")
+        if len(parts) != 5:
+            raise ValueError(f"Cron ifadesi 5 alan içermeli (dakika saat gün ay haftanın-günü): {expression}")
+        try:
+            fields = [_parse_field(part, i) for i, part in enumerate(parts)]
+        except ValueError as e:
+            raise ValueError(f"Geçersiz cron ifadesi '{expression}': {e}")
+        self.minutes, self.hours, self.days, self.months, self.weekdays = fields
+        self.day_restricted = parts[2] != '*'
+        self.weekday_restricted = parts[4] != '*'
+
+    def __str__(self):
+        return self.expression
+
+    def _day_matches(self, day):
+        in_month = day.day in self.days
+        # Python: Pazartesi=0; cron: Pazar=0
+        in_week = (day.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return in_month or in_week
+        if self.day_restricted:
+            return in_month
+        if self.weekday_restricted:
+            return in_week
+        return True
+
+    def next_after(self, moment):
+        """moment'tan (datetime) sonraki ilk çalışma zamanı - yoksa None"""
+        current = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = current + timedelta(days=MAX_SEARCH_DAYS)
+        while current < limit:
+            if current.month not in self.months:
+                i = bisect.bisect_left(self.months, current.month)
+                if i < len(self.months):
+                    current = current.replace(month=self.months[i], day=1, hour=0, minute=0)
+                else:
+                    current = current.replace(year=current.year + 1, month=self.months[0], day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(current):
+                current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            i = bisect.bisect_left(self.hours, current.hour)
+            if i == len(self.hours):
+                current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if self.hours[i] != current.hour:
+                current = current.replace(hour=self.hours[i], minute=0)
+            i = bisect.bisect_left(self.minutes, current.minute)
+            if i == len(self.minutes):
+                current = (current + timedelta(hours=1)).replace(minute=0)
+                continue
+            return current.replace(minute=self.minutes[i])
+        return None
+
+
+def daily_cron(hour, minute):
+    """Her gün belirtilen saatte"""
+    return f"{minute} {hour} * * *"
+
+
+def weekday_cron(hour, minute):
+    """Her iş günü (Pazartesi-Cuma) belirtilen saatte"""
+    return f"{minute} {hour} * * 1-5"
+
+
+def cron_recurrence(expression):
+    """Cron tekrarı (ifade burada doğrulanır - geçersizse ValueError)"""
+    return {'type': 'cron', 'expr': str(CronExpression(expression)), 'runs': 0}
+
+
+def drip_recurrence(steps, interval_days):
+    """Damla dizisi: aynı alıcılara sırayla gönderilen şablonlar, aralarında interval_days gün
+
+    steps: [{'subject', 'body', 'attachments'}, ...] - ilk adım işin kendisidir.
+    """
+    return {'type': 'drip', 'steps': list(steps), 'step': 0, 'interval_days': int(interval_days), 'anchor': None}
+
+
+def first_fire(recurrence, start):
+    """İlk çalışma zamanı (epoch) - start (epoch) anı da dahil; tekrar bilgisine başlangıç işlenir"""
+    if recurrence and recurrence.get('type') == 'drip':
+        recurrence['anchor'] = float(start)
+    if recurrence and recurrence.get('type') == 'cron':
+        moment = CronExpression(recurrence['expr']).next_after(datetime.fromtimestamp(start) - timedelta(minutes=1))
+        return moment.timestamp() if moment else None
+    return float(start)
+
+
+def advance_recurrence(job, now):
+    """Tamamlanan tekrarlayan işi bir sonraki tekrara hazırla
+
+    Tek bir kayıt güncellenir (tekrarlar önceden üretilip saklanmaz). Sonraki çalışma
+    zamanını (epoch) döndürür; tekrar bitmişse None.
+    """
+    recurrence = job.get('recurrence')
+    if not recurrence:
+        return None
+    if recurrence['type'] == 'cron':
+        moment = CronExpression(recurrence['expr']).next_after(datetime.fromtimestamp(max(now, job['due'])))
+        if moment is None:
+            return None
+        recurrence['runs'] = recurrence.get('runs', 0) + 1
+        due = moment.timestamp()
+    elif recurrence['type'] == 'drip':
+        step = recurrence['step'] + 1
+        if step >= len(recurrence['steps']):
+            return None
+        recurrence['step'] = step
+        job.update(recurrence['steps'][step])
+        # Aralık, önceki adımın ilk zamanlandığı andan sayılır (limit nedeniyle ertelenen
+        # gönderimler sonraki adımları kaydırmaz)
+        anchor = recurrence.get('anchor') or job['due']
+        due = max(now, anchor + recurrence['interval_days'] * 86400)
+        recurrence['anchor'] = due
+    else:
+        return None
+    job['cursor'] = 0
+    job['due'] = due
+    return due
+
+
+def describe_recurrence(recurrence):
+    """Zamanlama listesi için kısa açıklama"""
+    if not recurrence:
+        return "Tek sefer"
+    if recurrence['type'] == 'drip':
+        return f"Damla dizisi {recurrence['step'] + 1}/{len(recurrence['steps'])} ({recurrence['interval_days']} gün arayla)"
+    expression = recurrence['expr']
+    parts = expression.split(" ")
+    if parts[2:] == ['*', '*', '1-5'] and parts[0].isdigit() and parts[1].isdigit():
+        return f"Her iş günü {int(parts[1]):02d}:{int(parts[0]):02d}"
+    if parts[2:] == ['*', '*', '*'] and parts[0].isdigit() and parts[1].isdigit():
+        return f"Her gün {int(parts[1]):02d}:{int(parts[0]):02d}"
+    return f"Cron: {expression}"
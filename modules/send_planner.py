@@ -0,0 +1,114 @@
+import bisect
+import random
+from datetime import datetime, timedelta
+
+
+# Takvim en fazla bu kadar gün ileriye planlanır (ör. çok büyük liste + çok düşük limit)
+MAX_PLAN_DAYS = 3660
+# Gönderici, zamanı bu kadar saniye içinde gelecek mesajları tek çalıştırmada gönderir
+PACE_HORIZON = 300
+
+
+class SendPlanner:
+    """Gönderimleri izinli saatlere eşit aralıklarla yayan planlayıcı
+
+    Her izinli gün için kapasite min(günlük limit, saatlik limit x izinli saat) olarak
+    alınır ve gün içindeki mesajlar pencereye eşit aralıkla dağıtılır; böylece hem günlük
+    kota doldurulur hem de saatlik hız sınırı aşılmaz. Plan gün başına tek pencere
+    {'start', 'end', 'count'} olarak saklanır (mesaj başına zaman tutulmaz).
+    """
+
+    def __init__(self, hourly_limit, daily_limit, start_hour=9, end_hour=18, weekdays=(0, 1, 2, 3, 4), jitter=0.3):
+        if not 0 <= start_hour < end_hour <= 24:
+            raise ValueError(f"Geçersiz gönderim saatleri: {start_hour}-{end_hour}")
+        self.hourly_limit = max(1, int(hourly_limit))
+        self.daily_limit = max(1, int(daily_limit))
+        self.start_hour = int(start_hour)
+        self.end_hour = int(end_hour)
+        self.weekdays = tuple(sorted(weekdays)) or tuple(range(7))
+        self.jitter = max(0.0, min(float(jitter), 0.9))
+
+    def params(self):
+        """Planı sonradan (başka süreçte) yeniden kurabilmek için ayarlar"""
+        return {'hourly_limit': self.hourly_limit, 'daily_limit': self.daily_limit, 'start_hour': self.start_hour,
+                'end_hour': self.end_hour, 'weekdays': list(self.weekdays), 'jitter': self.jitter}
+
+    def _day_bounds(self, day):
+        start = datetime(day.year, day.month, day.day, self.start_hour)
+        end = datetime(day.year, day.month, day.day) + timedelta(hours=self.end_hour)
+        return start, end
+
+    def plan(self, audience, start, daily_used=0):
+        """audience kadar mesaj için plan (epoch start anından itibaren)
+
+        daily_used: başlangıç gününde zaten gönderilmiş mesaj sayısı.
+        """
+        windows = []
+        remaining = int(audience)
+        begin = datetime.fromtimestamp(start)
+        day = begin.date()
+        full_hours = self.end_hour - self.start_hour
+        for offset in range(MAX_PLAN_DAYS):
+            if remaining <= 0:
+                break
+            current = day + timedelta(days=offset)
+            if current.weekday() not in self.weekdays:
+                continue
+            window_start, window_end = self._day_bounds(current)
+            # Aralık tam gün kapasitesine göre belirlenir; gün ortasında başlanırsa kalan süre kadar gönderilir
+            interval = full_hours * 3600 / min(self.daily_limit, self.hourly_limit * full_hours)
+            if begin > window_start:
+                window_start = begin
+            if window_start >= window_end:
+                continue
+            capacity = int((window_end - window_start).total_seconds() // interval)
+            used = daily_used if offset == 0 else 0
+            capacity = min(capacity, self.daily_limit - used)
+            count = min(capacity, remaining)
+            if count <= 0:
+                continue
+            start_ts = window_start.timestamp()
+            windows.append({'start': start_ts, 'end': start_ts + count * interval, 'count': count})
+            remaining -= count
+        return {'windows': windows, 'index': 0, 'params': self.params()}
+
+
+def planner_from_plan(plan):
+    return SendPlanner(**plan['params'])
+
+
+def slot_time(plan, index):
+    """index'inci mesajın planlanan (titreşimsiz) zamanı ve penceredeki aralık: (epoch, saniye)
+
+    Plan bittiyse None.
+    """
+    windows = plan['windows']
+    offsets = []
+    total = 0
+    for window in windows:
+        offsets.append(total)
+        total += window['count']
+    if index >= total:
+        return None
+    i = bisect.bisect_right(offsets, index) - 1
+    window = windows[i]
+    interval = (window['end'] - window['start']) / window['count']
+    return window['start'] + (index - offsets[i]) * interval, interval
+
+
+def jittered(slot, interval, jitter, rng=random):
+    """Düzenli aralığı gizlemek için zamanı aralığın jitter oranı kadar rastgele ileri kaydır"""
+    return slot + rng.uniform(0, jitter * interval)
+
+
+def replan(plan, audience, start, daily_used=0):
+    """Kalan alıcılar için planı aynı ayarlarla yeniden kur (geride kalındıysa veya tekrar başlıyorsa)"""
+    return planner_from_plan(plan).plan(audience, start, daily_used)
+
+
+def describe_plan(plan):
+    """Zamanlama sekmesi için özet: (gün sayısı, ilk zaman, tahmini bitiş)"""
+    windows = plan['windows']
+    if not windows:
+        return 0, None, None
+    return len(windows), windows[0]['start'], windows[-1]['end']
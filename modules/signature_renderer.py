@@ -0,0 +1,141 @@
+import os
+from collections import OrderedDict
+
+from modules.message_builder import IMAGE_EXTENSIONS
+
+
+# İmza alanları ve HTML biçimleri (sadece dolu olan alanlar imzaya eklenir)
+SIGNATURE_FIELD_FORMATS = (
+    ("name", '<div style="font-weight: 600; font-size: 16px; color: #111827; margin-bottom: 4px;">{}</div>'),
+    ("phone", '<div style="color: #374151; margin: 2px 0; font-size: 13px;">☎️ {}</div>'),
+    ("mobile", '<div style="color: #374151; margin: 2px 0; font-size: 13px;">📱 {}</div>'),
+    ("email", '<div style="color: #374151; margin: 2px 0; font-size: 13px;">✉️ {}</div>'),
+    ("web", '<div style="color: #374151; margin: 2px 0; font-size: 13px;">🌐 <a href="{href}" style="color: #2563eb; text-decoration: none;">{}</a></div>'),
+    ("address", '<div style="color: #6B7280; font-size: 12px; font-style: italic; margin: 4px 0 2px 0;">📍 {}</div>'),
+    ("services", '<div style="color: #9CA3AF; font-size: 11px; font-style: italic; margin: 2px 0;">💼 {}</div>'),
+)
+
+BODY_WRAPPER_HTML = '''
+            <table role="presentation" width="100%" cellpadding="0" cellspacing="0" border="0" bgcolor="#ffffff" style="background-color:#ffffff;">
+              <tr>
+                <td align="left" style="font-family: 'Segoe UI', Arial, sans-serif; font-size:15px; line-height:1.7; color:#111827; margin:25px 0; padding:20px; border-radius:12px; box-shadow:0 2px 10px rgba(0,0,0,0.06); border-left:4px solid #2563eb;">
+                  {body}
+                </td>
+              </tr>
+            </table>
+            '''
+
+IMAGE_PREVIEW_HTML = """
+                        <table width="400" style="margin: 10px 0; border-collapse: collapse;">
+                        <tr>
+                            <td style="text-align: left; padding: 5px;">
+                                <img src="cid:image{index}" width="400" style="width: 400px; max-width: 100%; height: auto; border-radius: 6px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);" alt="Görsel Ön İzleme" />
+                            </td>
+                        </tr>
+                    </table>
+                        """
+
+# Kartvizit görselini tablo yapısında tut - Outlook uyumlu
+VCARD_HTML = """
+        <br><br>
+        <table width="300" style="margin: 15px 0; border-collapse: collapse; background-color: #ffffff; border: 1px solid #e5e7eb; border-radius: 5px;">
+            <tr>
+                <td style="padding: 10px; text-align: left;">
+                    <img src="cid:kartvizit" width="150" height="100" style="width: 150px; height: 100px; border-radius: 4px; float: left; margin-right: 10px;" alt="Kartvizit" />
+                    <div style="font-family: Arial, sans-serif; font-size: 12px; color: #374151; margin-left: 160px;">
+                        Kartvizit Bilgileri
+                    </div>
+                </td>
+            </tr>
+        </table>
+        """
+
+SIGNATURE_WRAPPER_HTML = '''
+                <table role="presentation" width="100%" cellpadding="0" cellspacing="0" border="0" bgcolor="#ffffff" style="background-color:#ffffff; margin-top:25px;">
+                  <tr>
+                    <td align="left" style="font-family: 'Segoe UI', Arial, sans-serif; font-size:14px; color:#374151; padding:15px; border-left:4px solid #e74c3c; border-radius:10px; box-shadow:0 2px 8px rgba(0,0,0,0.06);">
+                      {parts}
+                    </td>
+                  </tr>
+                </table>
+                '''
+
+
+def web_href(address):
+    """İmzadaki web adresinden tıklanabilir bağlantı üret (şema yoksa https eklenir)"""
+    if address.lower().startswith(("http://", "https://")):
+        return address
+    return "https://" + address
+
+
+class SignatureRenderer:
+    """Kartvizit/imza HTML'ini önbellekli üreten sınıf
+
+    İmza parçası yalnızca alanlar değiştiğinde yeniden oluşturulur; aynı gövde ve ek
+    listesi için tamamlanmış gövde de önbellekten döner, böylece aynı kampanyanın her
+    gönderimi hazırlanmış mesaj önbelleğine (get_prepared_message) aynı anahtarla gelir.
+    """
+
+    def __init__(self, cache_size=16):
+        self.fields = {}
+        self.vcard_enabled = False
+        self.signature_enabled = False
+        self.version = 0
+        self._signature_html = None
+        self._render_cache = OrderedDict()
+        self.cache_size = cache_size
+
+    def update(self, fields, vcard_enabled, signature_enabled):
+        """Ayarları güncelle - değişiklik varsa önbellekleri geçersiz kıl"""
+        fields = {key: (value or "").strip() for key, value in fields.items()}
+        if fields == self.fields and vcard_enabled == self.vcard_enabled and \
+                signature_enabled == self.signature_enabled:
+            return
+        self.fields = fields
+        self.vcard_enabled = vcard_enabled
+        self.signature_enabled = signature_enabled
+        self.version += 1
+        self._signature_html = None
+        self._render_cache.clear()
+
+    def signature_html(self):
+        """Profesyonel imza HTML parçası (önbellekli)"""
+        if self._signature_html is None:
+            parts = []
+            if self.signature_enabled:
+                parts = [template.format(self.fields[key], href=web_href(self.fields[key]))
+                         for key, template in SIGNATURE_FIELD_FORMATS if self.fields.get(key)]
+            # Eğer en az bir alan doluysa HTML oluştur
+            self._signature_html = SIGNATURE_WRAPPER_HTML.format(parts='<br>'.join(parts)) if parts else ""
+        return self._signature_html
+
+    def render(self, email_body, attachments=None):
+        """E-posta gövdesine kartvizit imzası ve görsel ön izlemeleri ekler"""
+        if not self.vcard_enabled:
+            return email_body
+
+        key = (email_body, tuple(attachments or ()))
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Mesaj içeriğini yüksek kontrastlı ve tema-dostu HTML'e çevir
+        body = email_body
+        if not body.strip().startswith('<'):
+            # Düz metni HTML'e çevir
+            body = BODY_WRAPPER_HTML.format(body=body.replace('\n', '<br>'))
+
+        # Görsel ön izlemelerini ekle (en üstte, sola hizalı)
+        image_count = sum(1 for file_path in attachments or ()
+                          if os.path.splitext(file_path)[1].lower() in IMAGE_EXTENSIONS and os.path.exists(file_path))
+        image_preview_html = "".join(IMAGE_PREVIEW_HTML.format(index=i) for i in range(1, image_count + 1))
+
+        # HTML imza varsa kartvizit görselini gösterme
+        signature_html = self.signature_html()
+        vcard_html = "" if signature_html else VCARD_HTML
+
+        rendered = image_preview_html + body + signature_html + vcard_html
+        self._render_cache[key] = rendered
+        if len(self._render_cache) > self.cache_size:
+            self._render_cache.popitem(last=False)
+        return rendered
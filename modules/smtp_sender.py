@@ -0,0 +1,51 @@
+import smtplib
+
+from modules.message_builder import get_prepared_message
+
+
+class SMTPSendError(Exception):
+    """SMTP gönderim hatası (arayüzden bağımsız)"""
+
+
+def open_smtp_connection(smtp_settings, timeout=30):
+    """SMTP bağlantısı aç ve giriş yap (465 için SSL, diğerleri için STARTTLS)"""
+    port = int(smtp_settings['port'])
+    host = smtp_settings['server']
+    if port == 465:
+        server = smtplib.SMTP_SSL(host, port, timeout=timeout)
+        server.ehlo()
+    else:
+        server = smtplib.SMTP(host, port, timeout=timeout)
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+    # Bazı sunucularda giriş kullanıcı adı e-posta adresinden farklı olabilir
+    login_username = smtp_settings.get('auth_username', smtp_settings['username'])
+    try:
+        server.login(login_username, smtp_settings['password'])
+    except smtplib.SMTPAuthenticationError as auth_err:
+        server.close()
+        raise SMTPSendError(f"SMTP kimlik doğrulama hatası (535). Lütfen kullanıcı adı/şifreyi ve gerekirse uygulama şifresini kontrol edin. Sunucu: {host}, Port: {port}. Orijinal hata: {auth_err}")
+    return server
+
+
+def deliver_email(subject, body, to, attachments=None, smtp_settings=None, is_html=False, vcard_image_path=None,
+                  context=None, attach_image_originals=True, offloader=None, tracker=None):
+    """Tek alıcıya e-posta gönder - hata durumunda istisna fırlatır (arayüz göstermez)"""
+    # Kampanya iskeleti (derlenmiş şablon + hazır ek parçaları) bir kez oluşturulur,
+    # alıcı başına yalnızca kişiselleştirilmiş metin parçaları render edilir
+    prepared = get_prepared_message(subject, body, smtp_settings['username'], attachments, is_html, vcard_image_path,
+                                    attach_image_originals, offloader, tracker)
+    msg, tracking_record = prepared.build(to, context)
+
+    server = open_smtp_connection(smtp_settings)
+    try:
+        server.sendmail(smtp_settings['username'], to, msg.as_string())
+        # Belirteç yalnızca sunucu mesajı kabul ettiyse sayılır
+        prepared.commit_tracking(tracking_record)
+    finally:
+        try:
+            server.quit()
+        except Exception:
+            pass
+    return True
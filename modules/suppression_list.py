@@ -0,0 +1,128 @@
+import os
+import hashlib
+import threading
+from datetime import datetime
+
+
+def normalize_email(email):
+    """Karşılaştırma için e-posta adresini normalize et (boşluk ve büyük harf temizliği)"""
+    return email.strip().lower() if email else ""
+
+
+class SuppressionList:
+    """Gönderim dışı bırakılacak adresler (bounce, abonelikten çıkma, manuel) listesi
+
+    Adresler bellekte bir hash set'te tutulur (O(1) kontrol) ve diske satır satır
+    eklenen (append-only) bir TSV dosyasına yazılır: e-posta, sebep, tarih.
+    compact=True ile çok büyük listelerde adres metni yerine 8 baytlık özet saklanır.
+    """
+
+    def __init__(self, path="suppression_list.tsv", compact=False):
+        self.path = path
+        self.compact = compact
+        self._keys = set()
+        self._lock = threading.Lock()
+        self.load()
+
+    def _key(self, email):
+        email = normalize_email(email)
+        if self.compact:
+            return int.from_bytes(hashlib.blake2b(email.encode('utf-8'), digest_size=8).digest(), 'big')
+        return email
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, email):
+        return self._key(email) in self._keys
+
+    def load(self):
+        """Diskteki listeyi satır satır oku"""
+        self._keys = set()
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    email = line.split('\t', 1)[0]
+                    if '@' in email:
+                        self._keys.add(self._key(email))
+        except Exception as e:
+            print(f"Engelleme listesi okunamadı: {e}")
+
+    def add(self, email, reason="manuel"):
+        """Adresi listeye ekle - yeni eklendiyse True döner"""
+        return self.add_many([email], reason) == 1
+
+    def add_many(self, emails, reason="manuel"):
+        """Adresleri toplu ekle ve diske tek seferde yaz - eklenen sayısını döndürür"""
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        lines = []
+        with self._lock:
+            for email in emails:
+                email = normalize_email(email)
+                if '@' not in email:
+                    continue
+                key = self._key(email)
+                if key in self._keys:
+                    continue
+                self._keys.add(key)
+                lines.append(f"{email}\t{reason}\t{timestamp}\n")
+            if lines:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+        return len(lines)
+
+    def remove(self, email):
+        """Adresi listeden çıkar (dosya yeniden yazılır)"""
+        key = self._key(email)
+        with self._lock:
+            if key not in self._keys:
+                return False
+            self._keys.discard(key)
+            if os.path.exists(self.path):
+                temp_path = self.path + ".tmp"
+                with open(self.path, 'r', encoding='utf-8') as src, open(temp_path, 'w', encoding='utf-8') as dst:
+                    for line in src:
+                        if self._key(line.split('\t', 1)[0]) != key:
+                            dst.write(line)
+                os.replace(temp_path, self.path)
+        return True
+
+    def filter(self, emails):
+        """Listede olmayan adresleri döndür: (gönderilecekler, engellenen sayısı)"""
+        keys = self._keys
+        key = self._key
+        allowed = [email for email in emails if key(email) not in keys]
+        return allowed, len(emails) - len(allowed)
+
+    def import_file(self, file_path, reason="içe aktarma", chunk_size=10000):
+        """Metin/CSV dosyasından adresleri akış halinde içe aktar - eklenen sayısını döndürür"""
+        added = 0
+        chunk = []
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                # Satırdaki ilk e-posta benzeri alanı al (ayırıcı: virgül, noktalı virgül, tab)
+                for field in line.replace(';', ',').replace('\t', ',').split(','):
+                    if '@' in field:
+                        chunk.append(field.strip().strip('"'))
+                        break
+                if len(chunk) >= chunk_size:
+                    added += self.add_many(chunk, reason)
+                    chunk = []
+        if chunk:
+            added += self.add_many(chunk, reason)
+        return added
+
+    def export_file(self, file_path):
+        """Listeyi dosyaya akış halinde aktar - yazılan satır sayısını döndürür"""
+        count = 0
+        if not os.path.exists(self.path):
+            open(file_path, 'w', encoding='utf-8').close()
+            return 0
+        with open(self.path, 'r', encoding='utf-8') as src, open(file_path, 'w', encoding='utf-8') as dst:
+            dst.write("email\treason\ttimestamp\n")
+            for line in src:
+                dst.write(line)
+                count += 1
+        return count
@@ -0,0 +1,316 @@
+import os
+import json
+import time
+import base64
+import secrets
+import logging
+import threading
+from collections import deque
+
+try:
+    from flask import Flask, Response, abort, redirect
+except ImportError:
+    Flask = None
+
+from modules.suppression_list import normalize_email
+from modules.link_rewriter import rewrite_links, links_id
+
+
+# 1x1 saydam GIF
+PIXEL_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+PIXEL_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+TRACKING_PIXEL_HTML = '<img src="{base_url}/o/{{{{_track_token}}}}.gif" width="1" height="1" alt="" style="display:none;border:0;" />'
+
+
+class TrackingStore:
+    """Mesaj belirteçleri ve açılma/tıklama olayları - bellek içi, toplu diske yazım
+
+    Belirteçler gönderim anında üretilir; belirteç -> (e-posta, kampanya) eşlemesi bellekte
+    tutulur ve çözümleme O(1)'dir. İstek yolunda (piksel/yönlendirme) diske yazılmaz: olaylar
+    bir kuyruğa eklenir ve arka plan thread'i bunları belirli aralıklarla toplu olarak yazar.
+    Ayrı süreçte çalışan sunucu, bilmediği belirteçler için belirteç dosyasının yeni
+    satırlarını (kaldığı konumdan) okur.
+    """
+
+    def __init__(self, tokens_path="tracking_tokens.jsonl", events_path="tracking_events.jsonl",
+                 flush_interval=2.0, reload_interval=0.2):
+        self.tokens_path = tokens_path
+        self.events_path = events_path
+        self.flush_interval = flush_interval
+        self.reload_interval = reload_interval
+        self.tokens = {}            # belirteç -> (e-posta, kampanya, bağlantı listesi kimliği)
+        self.links = {}             # bağlantı listesi kimliği -> [url, ...]
+        self.opens = {}             # belirteç -> açılma sayısı
+        self.clicks = {}            # belirteç -> tıklama sayısı
+        self.sent_counts = {}       # kampanya -> gönderilen belirteç sayısı
+        self.notifications = deque(maxlen=10000)  # arayüz için ilk açılma/tıklama olayları
+        self._pending_tokens = []
+        self._pending_events = []
+        self._lock = threading.Lock()
+        self._tokens_offset = 0
+        self._last_reload = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self.load()
+
+    # --- yükleme ve belirteç üretimi ---
+
+    def load(self):
+        """Belirteç ve olay dosyalarını tek geçişte okuyup sayaçları oluştur"""
+        self.reload_tokens(force=True)
+        if not os.path.exists(self.events_path):
+            return
+        try:
+            with open(self.events_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        kind, token = json.loads(line)[:2]
+                    except (ValueError, TypeError):
+                        continue
+                    counter = self.opens if kind == "open" else self.clicks
+                    counter[token] = counter.get(token, 0) + 1
+        except Exception as e:
+            print(f"Takip olayları okunamadı: {e}")
+
+    def reload_tokens(self, force=False):
+        """Belirteç dosyasının son okunan konumdan sonraki satırlarını oku"""
+        now = time.monotonic()
+        if not force and now - self._last_reload < self.reload_interval:
+            return
+        self._last_reload = now
+        if not os.path.exists(self.tokens_path):
+            return
+        try:
+            # İkili kipte okunur: konum dosyadaki bayt sayısıdır (Windows'ta \r\n dahil)
+            with open(self.tokens_path, 'rb') as f:
+                f.seek(self._tokens_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Yazımı tamamlanmamış satır - sonraki okumada ele alınır
+                        break
+                    self._tokens_offset += len(line)
+                    try:
+                        record = json.loads(line.decode('utf-8'))
+                    except ValueError:
+                        continue
+                    self._apply_record(record)
+        except Exception as e:
+            print(f"Takip belirteçleri okunamadı: {e}")
+
+    def _apply_record(self, record):
+        if "links" in record:
+            self.links[record["links"]] = record["urls"]
+        elif record["t"] not in self.tokens:
+            self.tokens[record["t"]] = (record["e"], record["c"], record.get("l"))
+            self.sent_counts[record["c"]] = self.sent_counts.get(record["c"], 0) + 1
+
+    def new_token(self, email, campaign, links_id=None):
+        """Gönderilecek mesaj için belirteç kaydı üret - henüz sayılmaz ve diske yazılmaz
+
+        Mesaj SMTP tarafından kabul edilince commit_token ile kaydedilir; başarısız
+        gönderimler kampanyanın gönderim sayısına girmez.
+        """
+        record = {"t": secrets.token_urlsafe(12), "e": normalize_email(email), "c": campaign}
+        if links_id:
+            record["l"] = links_id
+        return record
+
+    def commit_token(self, record):
+        """Gönderilen mesajın belirtecini kaydet (diske bir sonraki toplu yazımda gider)"""
+        with self._lock:
+            self._apply_record(record)
+            self._pending_tokens.append(record)
+
+    def register_links(self, links_id, urls):
+        """Yönlendirme hedeflerini kaydet (bağlantı indeksi -> URL)"""
+        urls = list(urls)
+        if self.links.get(links_id) == urls:
+            return
+        record = {"links": links_id, "urls": urls}
+        with self._lock:
+            self._apply_record(record)
+            self._pending_tokens.append(record)
+
+    # --- istek yolu ---
+
+    def resolve(self, token):
+        """Belirteci (e-posta, kampanya) olarak çözümle - bilinmiyorsa None"""
+        resolved = self.tokens.get(token)
+        if resolved is None:
+            self.reload_tokens()
+            resolved = self.tokens.get(token)
+        return resolved
+
+    def link_url(self, token, index):
+        """Belirteç ve bağlantı indeksinden hedef URL - bulunamazsa None"""
+        resolved = self.resolve(token)
+        if resolved is None:
+            return None
+        urls = self.links.get(resolved[2])
+        if urls is None or not 0 <= index < len(urls):
+            return None
+        return urls[index]
+
+    def record(self, kind, token, link_index=None):
+        """Olayı kuyruğa ekle (disk yazımı yok)"""
+        resolved = self.resolve(token)
+        if resolved is None:
+            return False
+        counter = self.opens if kind == "open" else self.clicks
+        with self._lock:
+            first = token not in counter
+            counter[token] = counter.get(token, 0) + 1
+            self._pending_events.append([kind, token, link_index, int(time.time())])
+            if first:
+                self.notifications.append((kind, resolved[0], resolved[1]))
+        return True
+
+    # --- toplu yazım ---
+
+    def flush(self):
+        """Bekleyen belirteç ve olayları diske yaz"""
+        with self._lock:
+            tokens, self._pending_tokens = self._pending_tokens, []
+            events, self._pending_events = self._pending_events, []
+        if tokens:
+            size_before = os.path.getsize(self.tokens_path) if os.path.exists(self.tokens_path) else 0
+            with open(self.tokens_path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in tokens)
+            if size_before == self._tokens_offset:
+                # Dosyayı zaten sonuna kadar okumuştuk - kendi yazdığımız satırları tekrar okuma
+                self._tokens_offset = os.path.getsize(self.tokens_path)
+        if events:
+            with open(self.events_path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(event) + "\n" for event in events)
+        return len(tokens), len(events)
+
+    def start(self):
+        """Arka planda periyodik toplu yazımı başlat"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Takip olayları yazılamadı: {e}")
+
+    # --- raporlama ---
+
+    def drain_notifications(self):
+        """Arayüz için biriken ilk açılma/tıklama olaylarını döndür ve kuyruğu boşalt"""
+        drained = []
+        while self.notifications:
+            drained.append(self.notifications.popleft())
+        return drained
+
+    def get_campaign_stats(self):
+        """Kampanya başına gönderim, tekil açılma ve tıklama sayıları"""
+        stats = {}
+        for campaign, sent in self.sent_counts.items():
+            stats[campaign] = {'sent': sent, 'opened': 0, 'clicked': 0, 'clicks': 0}
+        for token, count in list(self.opens.items()):
+            resolved = self.tokens.get(token)
+            if resolved:
+                stats[resolved[1]]['opened'] += 1
+        for token, count in list(self.clicks.items()):
+            resolved = self.tokens.get(token)
+            if resolved:
+                stats[resolved[1]]['clicked'] += 1
+                stats[resolved[1]]['clicks'] += count
+        return stats
+
+
+class MessageTracker:
+    """Gönderim tarafı: mesajlara piksel ve belirteç yuvası ekler"""
+
+    def __init__(self, base_url, store, track_clicks=True):
+        self.base_url = base_url.rstrip("/")
+        self.store = store
+        self.track_clicks = track_clicks
+
+    def pixel_html(self):
+        """Alıcı başına {{_track_token}} yuvası içeren takip pikseli"""
+        return TRACKING_PIXEL_HTML.format(base_url=self.base_url)
+
+    def rewrite_links(self, html):
+        """Gövdedeki bağlantıları takip yönlendirmesine çevir ve hedefleri kaydet
+
+        Dönüş: (yeni HTML, bağlantı listesi kimliği - bağlantı yoksa None)
+        """
+        if not self.track_clicks:
+            return html, None
+        html, urls = rewrite_links(html, self.base_url)
+        if not urls:
+            return html, None
+        identifier = links_id(urls)
+        self.store.register_links(identifier, urls)
+        return html, identifier
+
+    def new_token(self, email, campaign, links_id=None):
+        return self.store.new_token(email, campaign, links_id)
+
+    def commit_token(self, record):
+        self.store.commit_token(record)
+
+
+def create_tracking_app(store):
+    """Piksel (/o/<belirteç>.gif) ve yönlendirme (/c/<belirteç>/<indeks>) uç noktalarını sunan uygulama"""
+    if Flask is None:
+        raise ImportError("Takip sunucusu için Flask paketi gerekli (pip install Flask)")
+    app = Flask(__name__)
+
+    @app.route("/o/<token>.gif")
+    def open_pixel(token):
+        store.record("open", token)
+        # Bilinmeyen belirteçte de piksel döner (geçerlilik bilgisi sızdırılmaz)
+        return Response(PIXEL_GIF, mimetype="image/gif", headers=PIXEL_HEADERS)
+
+    @app.route("/c/<token>/<int:index>")
+    def click_redirect(token, index):
+        url = store.link_url(token, index)
+        if url is None:
+            abort(404)
+        store.record("click", token, index)
+        return redirect(url, code=302)
+
+    @app.route("/health")
+    def health():
+        return {"tokens": len(store.tokens), "pending": len(store._pending_events)}
+
+    return app
+
+
+def create_default_app():
+    """WSGI sunucuları için giriş noktası (ör. waitress-serve --call modules.tracking_server:create_default_app)"""
+    store = TrackingStore()
+    store.start()
+    return create_tracking_app(store)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(filename="logs/tracking_server.log", level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logging.getLogger(__name__).info("Takip sunucusu başlatılıyor...")
+    application = create_default_app()
+    try:
+        from waitress import serve
+        serve(application, host="0.0.0.0", port=8080, threads=16)
+    except ImportError:
+        application.run(host="0.0.0.0", port=8080, threaded=True)